@@ -0,0 +1,22 @@
+"""Gunicorn config: threaded workers so /analyze overlaps blocking RPC I/O.
+
+The hot path blocks on outbound HTTP (Base RPC, Blockscout), so gthread
+workers let one process serve several in-flight requests. `preload_app`
+builds the app (and compiles detector patterns) once in the master so the
+worker forks share it copy-on-write. The `lru_cache` on `get_code` /
+`get_storage_at` and the analysis result cache stay process-local — each
+worker warms its own, which is an accepted tradeoff for avoiding shared
+state across forks.
+"""
+
+import os
+
+bind = "0.0.0.0:8000"
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1) + 1))
+threads = int(os.environ.get("WEB_THREADS", 5))
+preload_app = True
+worker_tmp_dir = "/dev/shm"
+timeout = 30
+max_requests = 500
+max_requests_jitter = 50
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from dataclasses import dataclass
 
@@ -24,7 +25,7 @@ from risk_api.analysis.patterns import (
 )
 from risk_api.analysis.reputation import detect_deployer_reputation
 from risk_api.analysis.scoring import RiskLevel, ScoreResult, compute_score, score_to_level
-from risk_api.chain.rpc import RPCError, get_code, get_storage_at
+from risk_api.chain.rpc import RPCError, get_code, get_storage_at_batch
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +35,9 @@ _IMPL_SLOTS: list[tuple[str, bytes]] = [
     ("EIP-1822", EIP_1822_SLOT),
     ("OpenZeppelin", OZ_IMPL_SLOT),
 ]
+_IMPL_SLOT_HEXES: tuple[str, ...] = tuple(
+    "0x" + slot_bytes.hex() for _, slot_bytes in _IMPL_SLOTS
+)
 
 _ZERO_WORD = "0" * 64
 
@@ -69,9 +73,12 @@ class NoBytecodeError(ValueError):
 
 
 # TTL cache for analysis results: (address, rpc_url, basescan_key) -> (result, timestamp)
+# Insertion order doubles as recency order: hits are reinserted, so eviction
+# at capacity drops the least recently used entry rather than the oldest.
 _analysis_cache: dict[tuple[str, str, str], tuple[AnalysisResult, float]] = {}
+_analysis_cache_lock = threading.Lock()
 _CACHE_TTL_SECONDS = 300  # 5 minutes
-_CACHE_MAX_SIZE = 128
+_CACHE_MAX_SIZE = 512
 
 
 def _cache_get(
@@ -79,30 +86,56 @@ def _cache_get(
 ) -> AnalysisResult | None:
     """Return cached result if present and not expired."""
     key = (address.lower(), rpc_url, basescan_api_key)
-    entry = _analysis_cache.get(key)
-    if entry is None:
-        return None
-    result, ts = entry
-    if time.monotonic() - ts > _CACHE_TTL_SECONDS:
+    with _analysis_cache_lock:
+        entry = _analysis_cache.get(key)
+        if entry is None:
+            return None
+        result, ts = entry
+        if time.monotonic() - ts > _CACHE_TTL_SECONDS:
+            del _analysis_cache[key]
+            return None
+        # Move the hit to the back so hot addresses survive eviction.
         del _analysis_cache[key]
-        return None
-    return result
+        _analysis_cache[key] = entry
+        return result
 
 
 def _cache_put(
     address: str, rpc_url: str, basescan_api_key: str, result: AnalysisResult
 ) -> None:
-    """Store result in cache, evicting oldest if at capacity."""
-    if len(_analysis_cache) >= _CACHE_MAX_SIZE:
-        oldest_key = next(iter(_analysis_cache))
-        del _analysis_cache[oldest_key]
-    key = (address.lower(), rpc_url, basescan_api_key)
-    _analysis_cache[key] = (result, time.monotonic())
+    """Store result in cache, evicting the least recently used at capacity."""
+    with _analysis_cache_lock:
+        if len(_analysis_cache) >= _CACHE_MAX_SIZE:
+            oldest_key = next(iter(_analysis_cache))
+            del _analysis_cache[oldest_key]
+        key = (address.lower(), rpc_url, basescan_api_key)
+        _analysis_cache[key] = (result, time.monotonic())
 
 
 def clear_analysis_cache() -> None:
     """Clear the analysis result cache (useful for testing)."""
-    _analysis_cache.clear()
+    with _analysis_cache_lock:
+        _analysis_cache.clear()
+
+
+_pipeline_warmed = False
+
+
+def warm_up_pipeline() -> None:
+    """Run the bytecode pipeline once on a tiny fixture, without any RPC.
+
+    Exercises disassembly, every detector, and scoring so imports, compiled
+    regexes, and detector tables are hot before the first paid request.
+    With gunicorn's preload_app the cost is paid once in the master.
+    """
+    global _pipeline_warmed
+    if _pipeline_warmed:
+        return
+    bytecode_hex = "0x" + "6080604052" + "00" * 200
+    instructions = disassemble(bytecode_hex)
+    findings = run_all_detectors(instructions)
+    compute_score(findings, instructions, bytecode_hex)
+    _pipeline_warmed = True
 
 
 def resolve_implementation(
@@ -119,11 +152,16 @@ def resolve_implementation(
             )
             return minimal_proxy_target
 
-    for slot_name, slot_bytes in _IMPL_SLOTS:
-        slot_hex = "0x" + slot_bytes.hex()
-        try:
-            raw = get_storage_at(address, slot_hex, rpc_url)
-        except RPCError:
+    # All three known slots go out as one JSON-RPC batch: one round trip
+    # instead of up to three sequential reads.
+    try:
+        slot_values = get_storage_at_batch(address, _IMPL_SLOT_HEXES, rpc_url)
+    except RPCError:
+        logger.debug("Failed to read implementation slots for %s", address)
+        return None
+
+    for (slot_name, _), raw in zip(_IMPL_SLOTS, slot_values):
+        if raw is None:
             logger.debug("Failed to read %s slot for %s", slot_name, address)
             continue
 
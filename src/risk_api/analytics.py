@@ -6,11 +6,40 @@ import hashlib
 import json
 import os
 import sqlite3
-from collections import Counter
+import threading
+from collections import Counter, deque
 from collections.abc import Iterable, Iterator, Mapping
 from pathlib import Path
 from typing import Any
 
+try:  # optional fast JSON codec — stdlib json remains the fallback
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+if orjson is not None:
+
+    def json_loads(data: str | bytes) -> Any:
+        return orjson.loads(data)
+
+    def json_dumps_compact(obj: Any, *, sort_keys: bool = False) -> str:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+
+else:
+
+    def json_loads(data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def json_dumps_compact(obj: Any, *, sort_keys: bool = False) -> str:
+        return json.dumps(obj, separators=(",", ":"), sort_keys=sort_keys)
+
+RECENT_ENTRIES_LIMIT = 20
+
+# Hourly bucket keys are the first 13 chars of the ISO timestamp ("YYYY-MM-DDTHH")
+# plus this constant suffix; string slicing beats strptime by a wide margin.
+_HOUR_KEY_SUFFIX = ":00:00Z"
+
 PAID_RESPONSE_SNAPSHOT_SCHEMA_VERSION = 1
 PAID_RESPONSE_SNAPSHOT_MAX_BYTES = 64 * 1024
 _PAID_RESPONSE_REDACTED = "[redacted]"
@@ -356,7 +385,7 @@ def build_sqlite_stats_payload(
         ).fetchall()
         payload["hourly"] = [
             {
-                "hour": f"{hour_prefix}:00:00Z",
+                "hour": hour_prefix + _HOUR_KEY_SUFFIX,
                 "count": int(count),
                 "paid": int(paid),
                 "landing_views": int(landing_views),
@@ -402,8 +431,8 @@ def build_sqlite_stats_payload(
         recent: list[dict[str, Any]] = []
         for (raw_json,) in reversed(recent_rows):
             try:
-                entry = json.loads(raw_json)
-            except json.JSONDecodeError:
+                entry = json_loads(raw_json)
+            except ValueError:
                 continue
             if not isinstance(entry, dict):
                 continue
@@ -417,66 +446,76 @@ def build_sqlite_stats_payload(
     return payload
 
 
-def build_stats_payload(
-    entries: Iterable[dict[str, Any]],
-    *,
-    intent_page_stages: set[str],
-    machine_doc_stages: set[str],
-    storage_backend: str = "unknown",
-    storage_path: str = "",
-    storage_durable: bool = False,
-) -> dict[str, Any]:
-    """Aggregate analytics entries into the dashboard/stats response."""
-    total = 0
-    paid = 0
-    duration_sum = 0.0
-    duration_count = 0
-    hourly_buckets: dict[str, dict[str, int]] = {}
-    recent: list[dict[str, Any]] = []
-    stage_counts: Counter[str] = Counter()
-    path_counts: Counter[str] = Counter()
-    host_counts: Counter[str] = Counter()
-    referer_counts: Counter[str] = Counter()
-    funnel = {key: 0 for key in FUNNEL_KEYS}
-    traffic_classes = {key: 0 for key in TRAFFIC_CLASS_KEYS}
+def _new_hourly_bucket() -> dict[str, int]:
+    return {
+        "count": 0,
+        "paid": 0,
+        "dur_sum": 0,
+        "dur_n": 0,
+        "landing_views": 0,
+        "how_payment_views": 0,
+        "intent_page_views": 0,
+        "intent_honeypot_views": 0,
+        "intent_proxy_views": 0,
+        "intent_deployer_views": 0,
+        "machine_doc_fetches": 0,
+        "valid_unpaid_402_attempts": 0,
+        "invalid_address_requests": 0,
+        "no_bytecode_requests": 0,
+        "paid_requests": 0,
+    }
 
-    for entry in entries:
-        total += 1
+
+class StatsAccumulator:
+    """Incremental single-pass aggregation of analytics entries.
+
+    Holds the running counters for the dashboard/stats response so new
+    entries can be folded in as they arrive instead of re-scanning the
+    whole log. ``build_payload`` snapshots the current state.
+    """
+
+    def __init__(
+        self, *, intent_page_stages: set[str], machine_doc_stages: set[str]
+    ) -> None:
+        self._intent_page_stages = intent_page_stages
+        self._machine_doc_stages = machine_doc_stages
+        self.total = 0
+        self.paid = 0
+        self.duration_sum = 0.0
+        self.duration_count = 0
+        self.hourly_buckets: dict[str, dict[str, int]] = {}
+        # Only the last RECENT_ENTRIES_LIMIT entries survive; the deque drops
+        # older ones as it goes instead of accumulating the whole log in memory.
+        self.recent: deque[dict[str, Any]] = deque(maxlen=RECENT_ENTRIES_LIMIT)
+        self.stage_counts: Counter[str] = Counter()
+        self.path_counts: Counter[str] = Counter()
+        self.host_counts: Counter[str] = Counter()
+        self.referer_counts: Counter[str] = Counter()
+        self.funnel = {key: 0 for key in FUNNEL_KEYS}
+        self.traffic_classes = {key: 0 for key in TRAFFIC_CLASS_KEYS}
+
+    def update(self, entry: dict[str, Any]) -> None:
+        """Fold one analytics entry into the running aggregation."""
+        self.total += 1
         if entry.get("paid"):
-            paid += 1
+            self.paid += 1
 
         stage = _normalize_stage(entry)
         traffic_class = classify_traffic_class(entry)
-        traffic_classes[traffic_class] += 1
+        self.traffic_classes[traffic_class] += 1
 
         dur = entry.get("duration_ms")
         if isinstance(dur, (int, float)):
-            duration_sum += dur
-            duration_count += 1
+            self.duration_sum += dur
+            self.duration_count += 1
 
         ts = entry.get("ts", "")
         if isinstance(ts, str) and len(ts) >= 13:
-            hour_key = ts[:13] + ":00:00Z"
-            bucket = hourly_buckets.get(hour_key)
+            hour_key = ts[:13] + _HOUR_KEY_SUFFIX
+            bucket = self.hourly_buckets.get(hour_key)
             if bucket is None:
-                bucket = {
-                    "count": 0,
-                    "paid": 0,
-                    "dur_sum": 0,
-                    "dur_n": 0,
-                    "landing_views": 0,
-                    "how_payment_views": 0,
-                    "intent_page_views": 0,
-                    "intent_honeypot_views": 0,
-                    "intent_proxy_views": 0,
-                    "intent_deployer_views": 0,
-                    "machine_doc_fetches": 0,
-                    "valid_unpaid_402_attempts": 0,
-                    "invalid_address_requests": 0,
-                    "no_bytecode_requests": 0,
-                    "paid_requests": 0,
-                }
-                hourly_buckets[hour_key] = bucket
+                bucket = _new_hourly_bucket()
+                self.hourly_buckets[hour_key] = bucket
             bucket["count"] += 1
             if entry.get("paid"):
                 bucket["paid"] += 1
@@ -488,7 +527,7 @@ def build_stats_payload(
                 bucket["landing_views"] += 1
             elif stage == "how_payment_view":
                 bucket["how_payment_views"] += 1
-            elif stage in intent_page_stages:
+            elif stage in self._intent_page_stages:
                 bucket["intent_page_views"] += 1
                 if stage == "intent_honeypot_view":
                     bucket["intent_honeypot_views"] += 1
@@ -496,7 +535,7 @@ def build_stats_payload(
                     bucket["intent_proxy_views"] += 1
                 elif stage == "intent_deployer_view":
                     bucket["intent_deployer_views"] += 1
-            elif stage in machine_doc_stages:
+            elif stage in self._machine_doc_stages:
                 bucket["machine_doc_fetches"] += 1
             elif stage == "unpaid_402":
                 bucket["valid_unpaid_402_attempts"] += 1
@@ -508,89 +547,352 @@ def build_stats_payload(
                 bucket["paid_requests"] += 1
 
         if stage == "landing_view":
-            funnel["landing_views"] += 1
+            self.funnel["landing_views"] += 1
         elif stage == "how_payment_view":
-            funnel["how_payment_views"] += 1
-        elif stage in intent_page_stages:
-            funnel["intent_page_views"] += 1
+            self.funnel["how_payment_views"] += 1
+        elif stage in self._intent_page_stages:
+            self.funnel["intent_page_views"] += 1
             if stage == "intent_honeypot_view":
-                funnel["intent_honeypot_views"] += 1
+                self.funnel["intent_honeypot_views"] += 1
             elif stage == "intent_proxy_view":
-                funnel["intent_proxy_views"] += 1
+                self.funnel["intent_proxy_views"] += 1
             elif stage == "intent_deployer_view":
-                funnel["intent_deployer_views"] += 1
-        elif stage in machine_doc_stages:
-            funnel["machine_doc_fetches"] += 1
+                self.funnel["intent_deployer_views"] += 1
+        elif stage in self._machine_doc_stages:
+            self.funnel["machine_doc_fetches"] += 1
         elif stage == "unpaid_402":
-            funnel["valid_unpaid_402_attempts"] += 1
+            self.funnel["valid_unpaid_402_attempts"] += 1
         elif stage == "invalid_address":
-            funnel["invalid_address_requests"] += 1
+            self.funnel["invalid_address_requests"] += 1
         elif stage == "no_bytecode":
-            funnel["no_bytecode_requests"] += 1
+            self.funnel["no_bytecode_requests"] += 1
         elif stage == "paid_request":
-            funnel["paid_requests"] += 1
+            self.funnel["paid_requests"] += 1
 
         if stage:
-            stage_counts[stage] += 1
+            self.stage_counts[stage] += 1
 
         path = entry.get("path")
         if isinstance(path, str) and path:
-            path_counts[path] += 1
+            self.path_counts[path] += 1
 
         host = entry.get("host")
         if isinstance(host, str) and host:
-            host_counts[host] += 1
+            self.host_counts[host] += 1
 
         referer = entry.get("referer")
         if isinstance(referer, str) and referer:
-            referer_counts[referer] += 1
+            self.referer_counts[referer] += 1
 
         if entry.get("traffic_class") == traffic_class:
-            recent.append(entry)
+            self.recent.append(entry)
         else:
             recent_entry = dict(entry)
             recent_entry["traffic_class"] = traffic_class
-            recent.append(recent_entry)
-
-    hourly = [
-        {
-            "hour": hour,
-            "count": bucket["count"],
-            "paid": bucket["paid"],
-            "landing_views": bucket["landing_views"],
-            "how_payment_views": bucket["how_payment_views"],
-            "intent_page_views": bucket["intent_page_views"],
-            "intent_honeypot_views": bucket["intent_honeypot_views"],
-            "intent_proxy_views": bucket["intent_proxy_views"],
-            "intent_deployer_views": bucket["intent_deployer_views"],
-            "machine_doc_fetches": bucket["machine_doc_fetches"],
-            "valid_unpaid_402_attempts": bucket["valid_unpaid_402_attempts"],
-            "invalid_address_requests": bucket["invalid_address_requests"],
-            "no_bytecode_requests": bucket["no_bytecode_requests"],
-            "paid_requests": bucket["paid_requests"],
+            self.recent.append(recent_entry)
+
+    def build_payload(
+        self,
+        *,
+        storage_backend: str = "unknown",
+        storage_path: str = "",
+        storage_durable: bool = False,
+    ) -> dict[str, Any]:
+        """Snapshot the aggregation into the dashboard/stats response shape."""
+        hourly = [
+            {
+                "hour": hour,
+                "count": bucket["count"],
+                "paid": bucket["paid"],
+                "landing_views": bucket["landing_views"],
+                "how_payment_views": bucket["how_payment_views"],
+                "intent_page_views": bucket["intent_page_views"],
+                "intent_honeypot_views": bucket["intent_honeypot_views"],
+                "intent_proxy_views": bucket["intent_proxy_views"],
+                "intent_deployer_views": bucket["intent_deployer_views"],
+                "machine_doc_fetches": bucket["machine_doc_fetches"],
+                "valid_unpaid_402_attempts": bucket["valid_unpaid_402_attempts"],
+                "invalid_address_requests": bucket["invalid_address_requests"],
+                "no_bytecode_requests": bucket["no_bytecode_requests"],
+                "paid_requests": bucket["paid_requests"],
+                "avg_duration_ms": (
+                    round(bucket["dur_sum"] / bucket["dur_n"])
+                    if bucket["dur_n"]
+                    else 0
+                ),
+            }
+            for hour, bucket in sorted(self.hourly_buckets.items())
+        ]
+
+        return {
+            "total_requests": self.total,
+            "paid_requests": self.paid,
+            "storage_backend": storage_backend,
+            "storage_path": storage_path,
+            "storage_durable": storage_durable,
+            "funnel": dict(self.funnel),
+            "traffic_classes": dict(self.traffic_classes),
+            "stage_counts": dict(self.stage_counts),
+            "top_paths": _top_items(self.path_counts, "path"),
+            "top_hosts": _top_items(self.host_counts, "host"),
+            "top_referers": _top_items(self.referer_counts, "referer"),
             "avg_duration_ms": (
-                round(bucket["dur_sum"] / bucket["dur_n"]) if bucket["dur_n"] else 0
+                round(self.duration_sum / self.duration_count)
+                if self.duration_count
+                else 0
             ),
+            "hourly": hourly,
+            "recent": list(self.recent),
         }
-        for hour, bucket in sorted(hourly_buckets.items())
-    ]
 
-    return {
-        "total_requests": total,
-        "paid_requests": paid,
-        "storage_backend": storage_backend,
-        "storage_path": storage_path,
-        "storage_durable": storage_durable,
-        "funnel": funnel,
-        "traffic_classes": traffic_classes,
-        "stage_counts": dict(stage_counts),
-        "top_paths": _top_items(path_counts, "path"),
-        "top_hosts": _top_items(host_counts, "host"),
-        "top_referers": _top_items(referer_counts, "referer"),
-        "avg_duration_ms": round(duration_sum / duration_count) if duration_count else 0,
-        "hourly": hourly,
-        "recent": recent[-20:],
-    }
+    def to_rollup(self) -> dict[str, Any]:
+        """Serialize the counters for the persisted rotation rollup.
+
+        ``recent`` is intentionally excluded: the stats response shows the
+        live tail of the active log, not entries from rotated-out files.
+        """
+        return {
+            "total": self.total,
+            "paid": self.paid,
+            "duration_sum": self.duration_sum,
+            "duration_count": self.duration_count,
+            "funnel": dict(self.funnel),
+            "traffic_classes": dict(self.traffic_classes),
+            "stage_counts": dict(self.stage_counts),
+            "path_counts": dict(self.path_counts),
+            "host_counts": dict(self.host_counts),
+            "referer_counts": dict(self.referer_counts),
+            "hourly_buckets": {
+                hour: dict(bucket) for hour, bucket in self.hourly_buckets.items()
+            },
+        }
+
+    def merge_rollup(self, rollup: Mapping[str, Any]) -> None:
+        """Fold persisted rollup counters into the running aggregation.
+
+        Unknown keys are ignored so a rollup written by an older build
+        never breaks a newer payload shape.
+        """
+        self.total += int(rollup.get("total", 0))
+        self.paid += int(rollup.get("paid", 0))
+        self.duration_sum += float(rollup.get("duration_sum", 0))
+        self.duration_count += int(rollup.get("duration_count", 0))
+        for key, value in dict(rollup.get("funnel") or {}).items():
+            if key in self.funnel:
+                self.funnel[key] += int(value)
+        for key, value in dict(rollup.get("traffic_classes") or {}).items():
+            if key in self.traffic_classes:
+                self.traffic_classes[key] += int(value)
+        self.stage_counts.update(dict(rollup.get("stage_counts") or {}))
+        self.path_counts.update(dict(rollup.get("path_counts") or {}))
+        self.host_counts.update(dict(rollup.get("host_counts") or {}))
+        self.referer_counts.update(dict(rollup.get("referer_counts") or {}))
+        for hour, saved in dict(rollup.get("hourly_buckets") or {}).items():
+            bucket = self.hourly_buckets.get(hour)
+            if bucket is None:
+                bucket = _new_hourly_bucket()
+                self.hourly_buckets[hour] = bucket
+            for key, value in dict(saved).items():
+                if key in bucket:
+                    bucket[key] += int(value)
+
+
+def build_stats_payload(
+    entries: Iterable[dict[str, Any]],
+    *,
+    intent_page_stages: set[str],
+    machine_doc_stages: set[str],
+    storage_backend: str = "unknown",
+    storage_path: str = "",
+    storage_durable: bool = False,
+) -> dict[str, Any]:
+    """Aggregate analytics entries into the dashboard/stats response."""
+    accumulator = StatsAccumulator(
+        intent_page_stages=intent_page_stages,
+        machine_doc_stages=machine_doc_stages,
+    )
+    for entry in entries:
+        accumulator.update(entry)
+    return accumulator.build_payload(
+        storage_backend=storage_backend,
+        storage_path=storage_path,
+        storage_durable=storage_durable,
+    )
+
+
+# Incremental JSONL aggregation state per log path: the accumulator, the byte
+# offset it has consumed up to, the (mtime_ns, size) signature of the last
+# aggregation, and the last payload. Refreshes parse only appended lines.
+_jsonl_stats_cache: dict[str, dict[str, Any]] = {}
+_jsonl_stats_lock = threading.Lock()
+
+
+def clear_jsonl_stats_cache() -> None:
+    """Clear the cached /stats aggregation (useful for testing)."""
+    with _jsonl_stats_lock:
+        _jsonl_stats_cache.clear()
+
+
+def stats_rollup_path(log_path: str) -> str:
+    """Path of the persisted rotation rollup, kept beside the request log."""
+    return os.path.join(
+        os.path.dirname(os.path.abspath(log_path)), "stats_rollup.json"
+    )
+
+
+def load_stats_rollup(rollup_path: str) -> dict[str, Any] | None:
+    """Read the persisted rollup, or None if missing or unreadable."""
+    try:
+        with open(rollup_path, "rb") as handle:
+            rollup = json_loads(handle.read())
+    except (OSError, ValueError, UnicodeDecodeError):
+        return None
+    return rollup if isinstance(rollup, dict) else None
+
+
+def fold_log_into_stats_rollup(
+    rotated_path: str,
+    rollup_path: str,
+    *,
+    intent_page_stages: set[str],
+    machine_doc_stages: set[str],
+) -> None:
+    """Fold a rotated-out request log into the persisted stats rollup.
+
+    Called by the log handler right after rotation: the closing file's
+    counters are added to the rollup so /stats totals keep covering
+    rotated-away history instead of dropping to near zero every rotation.
+    The rollup also survives process restarts. The write goes through a
+    temp file and ``os.replace`` so a crash mid-fold leaves the previous
+    rollup intact.
+    """
+    accumulator = StatsAccumulator(
+        intent_page_stages=intent_page_stages,
+        machine_doc_stages=machine_doc_stages,
+    )
+    existing = load_stats_rollup(rollup_path)
+    if existing is not None:
+        accumulator.merge_rollup(existing)
+    for entry in iter_jsonl_entries(rotated_path):
+        accumulator.update(entry)
+
+    tmp_path = rollup_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        handle.write(json_dumps_compact(accumulator.to_rollup()))
+    os.replace(tmp_path, rollup_path)
+
+
+def _file_signature(path: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def build_jsonl_stats_payload(
+    log_path: str,
+    *,
+    intent_page_stages: set[str],
+    machine_doc_stages: set[str],
+    storage_backend: str = "jsonl",
+    storage_path: str = "",
+    storage_durable: bool = False,
+) -> dict[str, Any]:
+    """Aggregate the JSONL log incrementally.
+
+    While the file is unchanged the last payload is returned as-is; when it
+    grows, only the newly appended bytes are parsed and folded into the
+    persistent accumulator. A shrunken file (rotation/truncation) restarts
+    the aggregation from the persisted rotation rollup, which the log
+    handler updates with the closing file's counters at every rollover —
+    so totals keep covering rotated-away history.
+    """
+    try:
+        stat = os.stat(log_path)
+    except OSError:
+        payload = empty_stats_payload()
+        payload["storage_backend"] = storage_backend
+        payload["storage_path"] = storage_path
+        payload["storage_durable"] = storage_durable
+        return payload
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    rollup_path = stats_rollup_path(log_path)
+    rollup_signature = _file_signature(rollup_path)
+    with _jsonl_stats_lock:
+        state = _jsonl_stats_cache.get(log_path)
+        if state is not None and state.get("rollup_signature") != rollup_signature:
+            # A rotation folded history into the rollup after this state was
+            # seeded; rebuild from the rollup plus the (freshly rotated, so
+            # small) active file so rotated entries count exactly once.
+            state = None
+        if state is not None and state["signature"] == signature:
+            return state["payload"]
+
+        if state is None or stat.st_size < state["offset"]:
+            accumulator = StatsAccumulator(
+                intent_page_stages=intent_page_stages,
+                machine_doc_stages=machine_doc_stages,
+            )
+            rollup = load_stats_rollup(rollup_path)
+            if rollup is not None:
+                accumulator.merge_rollup(rollup)
+            state = {
+                "offset": 0,
+                "accumulator": accumulator,
+                "rollup_signature": rollup_signature,
+            }
+
+        accumulator: StatsAccumulator = state["accumulator"]
+        offset = int(state["offset"])
+        with open(log_path, "rb") as handle:
+            handle.seek(offset)
+            remainder = b""
+            while True:
+                block = handle.read(_JSONL_READ_BLOCK_BYTES)
+                if not block:
+                    break
+                offset += len(block)
+                lines = (remainder + block).split(b"\n")
+                remainder = lines.pop()
+                for line in lines:
+                    entry = _decode_jsonl_entry(line)
+                    if entry is not None:
+                        accumulator.update(entry)
+        # The log writer terminates every entry with a newline, so a
+        # non-empty remainder here is the file's final, unterminated line:
+        # count it now and advance past it.
+        entry = _decode_jsonl_entry(remainder)
+        if entry is not None:
+            accumulator.update(entry)
+
+        payload = accumulator.build_payload(
+            storage_backend=storage_backend,
+            storage_path=storage_path,
+            storage_durable=storage_durable,
+        )
+        state["offset"] = offset
+        state["signature"] = signature
+        state["payload"] = payload
+        _jsonl_stats_cache[log_path] = state
+        return payload
+
+
+# Read the JSONL log in large blocks rather than line-by-line text iteration;
+# one read syscall covers thousands of entries on a grown log.
+_JSONL_READ_BLOCK_BYTES = 1 << 20
+
+
+def _decode_jsonl_entry(line: bytes) -> dict[str, Any] | None:
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        entry = json_loads(line)
+    except (ValueError, UnicodeDecodeError):
+        return None
+    return entry if isinstance(entry, dict) else None
 
 
 def iter_jsonl_entries(log_path: str) -> Iterator[dict[str, Any]]:
@@ -598,17 +900,21 @@ def iter_jsonl_entries(log_path: str) -> Iterator[dict[str, Any]]:
     if not log_path or not os.path.exists(log_path):
         return
 
-    with open(log_path, encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if isinstance(entry, dict):
-                yield entry
+    with open(log_path, "rb") as handle:
+        remainder = b""
+        while True:
+            block = handle.read(_JSONL_READ_BLOCK_BYTES)
+            if not block:
+                break
+            lines = (remainder + block).split(b"\n")
+            remainder = lines.pop()
+            for line in lines:
+                entry = _decode_jsonl_entry(line)
+                if entry is not None:
+                    yield entry
+        entry = _decode_jsonl_entry(remainder)
+        if entry is not None:
+            yield entry
 
 
 def _connect_sqlite(db_path: str) -> sqlite3.Connection:
@@ -619,7 +925,7 @@ def _connect_sqlite(db_path: str) -> sqlite3.Connection:
 
 
 def _entry_fingerprint(entry: dict[str, Any]) -> str:
-    payload = json.dumps(entry, separators=(",", ":"), sort_keys=True)
+    payload = json_dumps_compact(entry, sort_keys=True)
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
@@ -651,7 +957,7 @@ def _bounded_paid_response_json(
     max_bytes: int = PAID_RESPONSE_SNAPSHOT_MAX_BYTES,
 ) -> tuple[str, int, bool]:
     redacted = _redact_paid_response_value(snapshot)
-    payload = json.dumps(redacted, separators=(",", ":"), sort_keys=True)
+    payload = json_dumps_compact(redacted, sort_keys=True)
     original_size = len(payload.encode("utf-8"))
     if original_size <= max_bytes:
         return payload, original_size, False
@@ -664,14 +970,14 @@ def _bounded_paid_response_json(
         "max_bytes": max_bytes,
         "preview": payload[:preview_chars],
     }
-    bounded_payload = json.dumps(bounded, separators=(",", ":"), sort_keys=True)
+    bounded_payload = json_dumps_compact(bounded, sort_keys=True)
     while len(bounded_payload.encode("utf-8")) > max_bytes and preview_chars > 0:
         preview_chars = max(0, preview_chars - 256)
         bounded["preview"] = payload[:preview_chars]
-        bounded_payload = json.dumps(bounded, separators=(",", ":"), sort_keys=True)
+        bounded_payload = json_dumps_compact(bounded, sort_keys=True)
     if len(bounded_payload.encode("utf-8")) > max_bytes:
         minimal = {"truncated": True, "schema_version": PAID_RESPONSE_SNAPSHOT_SCHEMA_VERSION}
-        bounded_payload = json.dumps(minimal, separators=(",", ":"), sort_keys=True)
+        bounded_payload = json_dumps_compact(minimal, sort_keys=True)
     return bounded_payload, original_size, True
 
 
@@ -727,8 +1033,8 @@ def _ensure_sqlite_schema(conn: sqlite3.Connection) -> None:
         ).fetchall()
         for row_id, raw_json in rows:
             try:
-                parsed = json.loads(raw_json)
-            except json.JSONDecodeError:
+                parsed = json_loads(raw_json)
+            except ValueError:
                 fingerprint = hashlib.sha256(raw_json.encode("utf-8")).hexdigest()
             else:
                 if isinstance(parsed, dict):
@@ -840,7 +1146,7 @@ def append_sqlite_entry(
     if not db_path:
         return False
 
-    payload = json.dumps(entry, separators=(",", ":"))
+    payload = json_dumps_compact(entry)
     fingerprint = _entry_fingerprint(entry)
     traffic_class = classify_traffic_class(entry)
     with _connect_sqlite(db_path) as conn:
@@ -915,8 +1221,8 @@ def iter_sqlite_entries(db_path: str) -> Iterator[dict[str, Any]]:
         )
         for (raw_json,) in cursor:
             try:
-                entry = json.loads(raw_json)
-            except json.JSONDecodeError:
+                entry = json_loads(raw_json)
+            except ValueError:
                 continue
             if isinstance(entry, dict):
                 yield entry
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import operator
+import threading
 from typing import Any, Mapping
 
 from risk_api.analysis.action_policy import ActionContext, ActionEvaluation
@@ -22,6 +24,14 @@ _STRICTNESS: dict[PolicyAction, int] = {
     PolicyAction.BLOCK: 3,
 }
 
+# Serialized no-action responses memoized per AnalysisResult identity. The
+# engine's TTL cache hands back the same frozen result object for repeat
+# lookups, so the findings/policy dicts can be reused instead of rebuilt.
+# The result is kept alive in the value so its id() stays unique while cached.
+_SERIALIZED_CACHE_MAX = 128
+_serialized_base_cache: dict[int, tuple[AnalysisResult, dict[str, object]]] = {}
+_serialized_base_cache_lock = threading.Lock()
+
 
 def serialize_analysis_result(
     result: AnalysisResult,
@@ -30,6 +40,13 @@ def serialize_analysis_result(
     action_evaluation: ActionEvaluation | None = None,
 ) -> dict[str, object]:
     """Serialize an analysis result into the public wire shape."""
+    base_request = action_context is None and action_evaluation is None
+    if base_request:
+        with _serialized_base_cache_lock:
+            cached = _serialized_base_cache.get(id(result))
+            if cached is not None and cached[0] is result:
+                return cached[1]
+
     contract_decision = result.decision
     effective_decision = _effective_decision(contract_decision, action_evaluation)
     policy_source = _top_level_policy_source(result, action_evaluation)
@@ -69,6 +86,13 @@ def serialize_analysis_result(
             ),
         }
 
+    if base_request:
+        with _serialized_base_cache_lock:
+            if len(_serialized_base_cache) >= _SERIALIZED_CACHE_MAX:
+                oldest_key = next(iter(_serialized_base_cache))
+                del _serialized_base_cache[oldest_key]
+            _serialized_base_cache[id(result)] = (result, response_data)
+
     return response_data
 
 
@@ -151,14 +175,16 @@ def analysis_result_from_snapshot(snapshot: Mapping[str, Any]) -> AnalysisResult
     )
 
 
+# Precompiled field extraction for the finding wire shape: one C-level
+# attrgetter call per finding instead of five bytecode attribute loads.
+_FINDING_KEYS = ("detector", "severity", "title", "description", "points")
+_FINDING_GETTER = operator.attrgetter(
+    "detector", "severity.value", "title", "description", "points"
+)
+
+
 def _serialize_finding(finding: Finding) -> dict[str, object]:
-    return {
-        "detector": finding.detector,
-        "severity": finding.severity.value,
-        "title": finding.title,
-        "description": finding.description,
-        "points": finding.points,
-    }
+    return dict(zip(_FINDING_KEYS, _FINDING_GETTER(finding)))
 
 
 def _serialize_implementation(implementation: ImplementationResult) -> dict[str, object]:
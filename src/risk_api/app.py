@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import atexit
+import gzip
+import hashlib
 import json
 import logging
+import os
+import queue
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Mapping, cast
+from typing import Any, Callable, Mapping, cast
 from urllib.parse import urlsplit, urlunsplit
 from uuid import uuid4
 
-from flask import Flask, Response, current_app, jsonify, redirect, request
+from flask import Flask, Response, current_app, g, redirect, request
+from werkzeug.exceptions import RequestEntityTooLarge
 
 from risk_api.api_contract import (
     analysis_result_from_snapshot,
@@ -27,14 +35,20 @@ from risk_api.analysis.action_policy import (
 )
 from risk_api.analytics import (
     append_sqlite_entry,
+    build_jsonl_stats_payload,
     build_sqlite_stats_payload,
-    build_stats_payload,
     classify_traffic_class,
-    empty_stats_payload,
+    fold_log_into_stats_rollup,
     init_sqlite_store,
-    iter_jsonl_entries,
+    json_dumps_compact,
+    json_loads,
+    stats_rollup_path,
+)
+from risk_api.analysis.engine import (
+    NoBytecodeError,
+    analyze_contract,
+    warm_up_pipeline,
 )
-from risk_api.analysis.engine import NoBytecodeError, analyze_contract
 from risk_api.analysis.policy import PolicyReasonCode
 from risk_api.chain.rpc import RPCError, get_code
 from risk_api.config import Config, load_config
@@ -43,8 +57,23 @@ from risk_api.proof_reports import REPORT_PAGES, render_report_page
 logger = logging.getLogger(__name__)
 request_logger = logging.getLogger("risk_api.requests")
 
-# Ethereum address pattern: 0x followed by 40 hex chars
-ADDRESS_RE = re.compile(r"^0x[0-9a-fA-F]{40}$")
+# Ethereum address pattern: 0x followed by 40 hex chars. The source string is
+# shared by every schema that embeds it so the spec holds one object, not five.
+ADDRESS_HEX_PATTERN = r"^0x[0-9a-fA-F]{40}$"
+# Kept for OpenAPI schema emission; the hot-path validator below avoids the
+# regex engine entirely.
+ADDRESS_RE = re.compile(ADDRESS_HEX_PATTERN)
+
+_HEX_CHARS = frozenset("0123456789abcdefABCDEF")
+
+
+def _is_address(value: str) -> bool:
+    """Validate an 0x-address with length, prefix, and hex-charset checks."""
+    return (
+        len(value) == 42
+        and value.startswith("0x")
+        and set(value[2:]) <= _HEX_CHARS
+    )
 
 # Routes that require x402 payment
 PROTECTED_ROUTES = {"/analyze"}
@@ -60,6 +89,11 @@ SPENDER_ADDRESS_DESCRIPTION = (
     "(0x-prefixed, 40 hex chars)"
 )
 ANALYZE_REQUEST_FIELD_NAMES = ("address", "action", "spender", "chain")
+# A valid analyze body is a tiny JSON object of short string fields; cap
+# request bodies so a pathological POST cannot push megabytes through the
+# JSON parser (requests above this are rejected with 413).
+MAX_REQUEST_BODY_BYTES = 4096
+OVERSIZED_BODY_ERROR = "Request body too large"
 BASE_CHAIN_NAME = "base"
 APPROVE_EXAMPLE_SPENDER = "0x1111111111111111111111111111111111111111"
 
@@ -78,7 +112,7 @@ def _analyze_input_properties() -> dict[str, object]:
     return {
         "address": {
             "type": "string",
-            "pattern": "^0x[0-9a-fA-F]{40}$",
+            "pattern": ADDRESS_HEX_PATTERN,
             "description": BASE_ADDRESS_DESCRIPTION,
         },
         "action": {
@@ -91,7 +125,7 @@ def _analyze_input_properties() -> dict[str, object]:
         },
         "spender": {
             "type": "string",
-            "pattern": "^0x[0-9a-fA-F]{40}$",
+            "pattern": ADDRESS_HEX_PATTERN,
             "description": (
                 "Required when action='approve'. Spender address the agent "
                 "plans to authorize."
@@ -220,6 +254,171 @@ APPROVE_ACTION_ANALYSIS_EXAMPLE_JSON = json.dumps(
 )
 
 
+def _render_landing_html(base_url: str) -> str:
+    json_ld = json.dumps({
+        "@context": "https://schema.org",
+        "@type": "WebAPI",
+        "name": "Augur",
+        "description": (
+            "Deterministic Base contract admission control for agents on Base. "
+            "Runs deterministic bytecode detectors and returns a decision, "
+            "policy recommendation, supporting findings, and a 0-100 score."
+        ),
+        "url": base_url,
+        "provider": {
+            "@type": "Organization",
+            "name": "risk-api",
+        },
+        "offers": {
+            "@type": "Offer",
+            "price": "0.10",
+            "priceCurrency": "USD",
+            "url": f"{base_url}/analyze",
+            "description": "Per-call pricing via x402 protocol in USDC on Base",
+        },
+        "documentation": f"{base_url}/openapi.json",
+    })
+    faq_json_ld = json.dumps({
+        "@context": "https://schema.org",
+        "@type": "FAQPage",
+        "mainEntity": [
+            {
+                "@type": "Question",
+                "name": "What does Augur do?",
+                "acceptedAnswer": {
+                "@type": "Answer",
+                    "text": (
+                        "Augur is a deterministic Base contract admission-control API "
+                        "for agents and the developers building them. It fetches on-chain "
+                        "bytecode for a contract on Base and runs "
+                        "8 detectors (proxy, reentrancy, selfdestruct, honeypot, hidden mint, "
+                        "fee manipulation, delegatecall, deployer reputation) to produce a "
+                        "effective decision, policy recommendation, supporting findings, and a "
+                        "composite 0-100 score before a workflow decides whether to proceed."
+                    ),
+                },
+            },
+            {
+                "@type": "Question",
+                "name": "How much does it cost?",
+                "acceptedAnswer": {
+                    "@type": "Answer",
+                    "text": (
+                        "$0.10 per call, paid in USDC on Base via the x402 protocol. "
+                        "No subscription, no API key, no signup required."
+                    ),
+                },
+            },
+            {
+                "@type": "Question",
+                "name": "How do AI agents pay for the API?",
+                "acceptedAnswer": {
+                    "@type": "Answer",
+                    "text": (
+                        "Via the x402 protocol: send GET /analyze?address=<contract>, "
+                        "receive a 402 response with payment details, sign a USDC "
+                        "authorization on Base, and retry the request with the "
+                        "PAYMENT-SIGNATURE header. The entire flow is automated by "
+                        "x402-compatible HTTP clients."
+                    ),
+                },
+            },
+            {
+                "@type": "Question",
+                "name": "What risk patterns does Augur detect?",
+                "acceptedAnswer": {
+                    "@type": "Answer",
+                    "text": (
+                        "8 detectors: proxy contracts (EIP-1967/1822/OZ), reentrancy "
+                        "vulnerabilities, selfdestruct capability, honeypot patterns, "
+                        "hidden mint functions, fee manipulation, delegatecall usage, "
+                        "and deployer wallet reputation via an explorer-backed path."
+                    ),
+                },
+            },
+            {
+                "@type": "Question",
+                "name": "What chains are supported?",
+                "acceptedAnswer": {
+                    "@type": "Answer",
+                    "text": "Base (EIP-155:8453). Payment is also in USDC on Base.",
+                },
+            },
+            {
+                "@type": "Question",
+                "name": "Does a safe score mean the contract is guaranteed safe?",
+                "acceptedAnswer": {
+                    "@type": "Answer",
+                    "text": (
+                        'No. "safe" means Augur did not detect major bytecode-level risk '
+                        "signals in this scan. It is not a full security audit or guarantee."
+                    ),
+                },
+            },
+            {
+                "@type": "Question",
+                "name": "Do I need an API key?",
+                "acceptedAnswer": {
+                    "@type": "Answer",
+                    "text": (
+                        "No. x402 payment is the only authentication. Any agent or "
+                        "client with a USDC wallet on Base can call the API immediately."
+                    ),
+                },
+            },
+        ],
+    })
+    return (
+        LANDING_HTML.replace("__BASE_URL__", base_url)
+        .replace("__JSON_LD__", json_ld)
+        .replace("__FAQ_JSON_LD__", faq_json_ld)
+    )
+
+
+
+def _render_robots_txt(base_url: str) -> str:
+    return (
+        "User-agent: *\n"
+        "Allow: /\n"
+        "Allow: /skill.md\n"
+        "Allow: /openapi.json\n"
+        "Allow: /.well-known/\n"
+        "Allow: /agent-metadata.json\n"
+        "Allow: /llms.txt\n"
+        "Allow: /llms-full.txt\n"
+        "Disallow: /stats\n"
+        "Disallow: /dashboard\n"
+        "\n"
+        f"Sitemap: {base_url}/sitemap.xml\n"
+    )
+
+
+def _render_sitemap_xml(base_url: str) -> str:
+    paths = [
+        "/",
+        "/skill.md",
+        "/mcp",
+        "/how-payment-works",
+        *INTENT_PAGES.keys(),
+        *REPORT_PAGES.keys(),
+        "/openapi.json",
+        "/agent-metadata.json",
+        "/.well-known/ai-plugin.json",
+        "/.well-known/agent-card.json",
+        "/.well-known/x402",
+        "/.well-known/api-catalog",
+        "/llms.txt",
+        "/llms-full.txt",
+    ]
+    urls = "\n".join(f"  <url><loc>{base_url}{p}</loc></url>" for p in paths)
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        f"{urls}\n"
+        "</urlset>\n"
+    )
+
+
 def _render_machine_doc(template: str, base_url: str) -> str:
     return (
         template.replace("__BASE_URL__", base_url)
@@ -233,7 +432,21 @@ def _render_machine_doc(template: str, base_url: str) -> str:
 
 
 def _extract_analyze_request_fields() -> tuple[dict[str, str], str | None]:
-    """Read supported analyze fields from query params or JSON body."""
+    """Read supported analyze fields from query params or JSON body.
+
+    Memoized per request on ``flask.g``: the validation hook, the /analyze
+    handler, and the after-request logger all need the same fields, and
+    re-parsing the JSON body three times per request is wasted work.
+    """
+    cached = g.get("analyze_request_fields")
+    if cached is not None:
+        return cached
+    result = _read_analyze_request_fields()
+    g.analyze_request_fields = result
+    return result
+
+
+def _read_analyze_request_fields() -> tuple[dict[str, str], str | None]:
     query_fields = {
         field: request.args.get(field, "").strip()
         for field in ANALYZE_REQUEST_FIELD_NAMES
@@ -241,12 +454,19 @@ def _extract_analyze_request_fields() -> tuple[dict[str, str], str | None]:
     if request.method != "POST" or not request.is_json:
         return query_fields, None
 
-    body = request.get_json(silent=True)
-    if body is None:
-        raw_body = request.get_data(cache=True, as_text=True)
-        if raw_body.strip():
-            return {}, "Malformed JSON body"
+    # Parse the raw bytes with the compact (orjson-backed) codec instead of
+    # Flask's get_json; cache=True keeps the body re-readable for the
+    # after-request logger.
+    try:
+        raw_body = request.get_data(cache=True)
+    except RequestEntityTooLarge:
+        return {}, OVERSIZED_BODY_ERROR
+    if not raw_body.strip():
         return query_fields, None
+    try:
+        body = json_loads(raw_body)
+    except ValueError:
+        return {}, "Malformed JSON body"
 
     if not isinstance(body, dict):
         return {}, "JSON body must be an object containing 'address'"
@@ -310,7 +530,7 @@ def _validate_action_context(
     if not spender:
         return None, "missing_spender", "Missing 'spender' for action 'approve'"
 
-    if not ADDRESS_RE.match(spender):
+    if not _is_address(spender):
         return None, "invalid_spender", f"Invalid Ethereum address: {spender}"
 
     return (
@@ -383,6 +603,33 @@ _BASE_BLUECHIP_OG_BYTES = _load_first_existing_bytes(
     Path(__file__).resolve().parent.parent.parent / "base_bluechip_og.png",
 )
 
+
+def _static_image_etag(image_bytes: bytes | None) -> str | None:
+    if image_bytes is None:
+        return None
+    return f'"{hashlib.md5(image_bytes).hexdigest()}"'
+
+
+_AVATAR_ETAG = _static_image_etag(_AVATAR_BYTES)
+_FAVICON_ETAG = _static_image_etag(_FAVICON_BYTES)
+_BASE_BLUECHIP_OG_ETAG = _static_image_etag(_BASE_BLUECHIP_OG_BYTES)
+
+
+def _static_image_response(
+    image_bytes: bytes | None, etag: str | None, missing_message: str
+) -> Response:
+    """Serve fixed image bytes with an ETag and If-None-Match 304 short-circuit."""
+    if image_bytes is None:
+        return Response(missing_message, status=404)
+    if etag is not None and request.headers.get("If-None-Match") == etag:
+        response = Response(status=304)
+    else:
+        response = Response(image_bytes, content_type="image/png")
+    if etag is not None:
+        response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "public, max-age=86400"
+    return response
+
 # OpenAPI 3.0.3 specification for the risk scoring API
 OPENAPI_SPEC: dict[str, object] = {
     "openapi": "3.0.3",
@@ -425,7 +672,7 @@ OPENAPI_SPEC: dict[str, object] = {
                         "required": True,
                         "schema": {
                             "type": "string",
-                            "pattern": "^0x[0-9a-fA-F]{40}$",
+                            "pattern": ADDRESS_HEX_PATTERN,
                         },
                         "example": SAFE_EXAMPLE_ADDRESS,
                         "description": BASE_ADDRESS_DESCRIPTION,
@@ -449,7 +696,7 @@ OPENAPI_SPEC: dict[str, object] = {
                         "required": False,
                         "schema": {
                             "type": "string",
-                            "pattern": "^0x[0-9a-fA-F]{40}$",
+                            "pattern": ADDRESS_HEX_PATTERN,
                         },
                         "description": SPENDER_ADDRESS_DESCRIPTION,
                     },
@@ -598,7 +845,7 @@ OPENAPI_SPEC: dict[str, object] = {
                         "required": False,
                         "schema": {
                             "type": "string",
-                            "pattern": "^0x[0-9a-fA-F]{40}$",
+                            "pattern": ADDRESS_HEX_PATTERN,
                         },
                         "example": SAFE_EXAMPLE_ADDRESS,
                         "description": BASE_ADDRESS_DESCRIPTION,
@@ -622,7 +869,7 @@ OPENAPI_SPEC: dict[str, object] = {
                         "required": False,
                         "schema": {
                             "type": "string",
-                            "pattern": "^0x[0-9a-fA-F]{40}$",
+                            "pattern": ADDRESS_HEX_PATTERN,
                         },
                         "description": SPENDER_ADDRESS_DESCRIPTION,
                     },
@@ -1721,6 +1968,12 @@ setInterval(refresh,30000);
 </body>
 </html>"""
 
+# The dashboard body is a fixed literal; the 30s auto-refresh only re-fetches
+# /stats, so page revalidations can short-circuit to a 304.
+_DASHBOARD_BODY = DASHBOARD_HTML.encode("utf-8")
+_DASHBOARD_BODY_GZ = gzip.compress(_DASHBOARD_BODY, compresslevel=9)
+_DASHBOARD_ETAG = f'"{hashlib.md5(_DASHBOARD_BODY).hexdigest()}"'
+
 LANDING_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -2854,6 +3107,251 @@ Use any x402-compatible HTTP client. The flow is:
 """
 
 
+# Rendered text/HTML bodies keyed by (doc name, base URL). Pages whose content
+# only varies with the base URL are rendered once and reused. Bounded because
+# base URL follows the request host when PUBLIC_URL is unset.
+_RENDERED_BODY_CACHE_MAX = 32
+_rendered_body_cache: dict[tuple[str, str], str] = {}
+# Guards the evict-then-store below: two threads at capacity can pick the
+# same oldest key, and the loser's del raises KeyError.
+_rendered_body_cache_lock = threading.Lock()
+
+
+def _rendered_body(
+    doc_name: str, base_url: str, render: Callable[[str], str]
+) -> str:
+    """Return a cached render of a base-URL-templated body."""
+    key = (doc_name, base_url)
+    with _rendered_body_cache_lock:
+        body = _rendered_body_cache.get(key)
+    if body is None:
+        # Render outside the lock; concurrent misses render the same
+        # deterministic body and the last store wins.
+        body = render(base_url)
+        with _rendered_body_cache_lock:
+            if len(_rendered_body_cache) >= _RENDERED_BODY_CACHE_MAX:
+                del _rendered_body_cache[next(iter(_rendered_body_cache))]
+            _rendered_body_cache[key] = body
+    return body
+
+
+# Serialized discovery-document bodies and their ETags keyed by (doc name,
+# base URL). The documents only vary with the base URL, so each body is built
+# and JSON-encoded once instead of per request. Bounded because base URL
+# follows the request host when PUBLIC_URL is unset.
+_DISCOVERY_BODY_CACHE_MAX = 32
+_discovery_body_cache: dict[tuple[str, str], tuple[bytes, str]] = {}
+# Guards the evict-then-store below for the shared cache and the per-app
+# caches routed through the same helper: two threads at capacity can pick
+# the same oldest key, and the loser's del raises KeyError.
+_discovery_body_cache_lock = threading.Lock()
+
+
+def _discovery_json_response(
+    doc_name: str,
+    base_url: str,
+    build: Callable[[str], dict[str, object]],
+    *,
+    content_type: str = "application/json",
+    cache: dict[tuple[str, str], tuple[bytes, str]] | None = None,
+) -> Response:
+    """Serve a discovery document from pre-serialized cached bytes.
+
+    Crawler revalidations with a matching ``If-None-Match`` get an empty
+    304 instead of the full body. Documents whose content depends on
+    app-level config pass their own ``cache`` dict so bodies are not shared
+    across app instances.
+    """
+    if cache is None:
+        cache = _discovery_body_cache
+    key = (doc_name, base_url)
+    with _discovery_body_cache_lock:
+        cached = cache.get(key)
+    if cached is None:
+        # Build outside the lock; concurrent misses rebuild the same
+        # deterministic body and the last store wins.
+        body = json_dumps_compact(build(base_url)).encode("utf-8")
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        cached = (body, etag)
+        with _discovery_body_cache_lock:
+            if len(cache) >= _DISCOVERY_BODY_CACHE_MAX:
+                del cache[next(iter(cache))]
+            cache[key] = cached
+    body, etag = cached
+    if request.headers.get("If-None-Match") == etag:
+        response = Response(status=304)
+    else:
+        response = Response(body, content_type=content_type)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return response
+
+
+# Constant JSON bodies serialized once at import; these handlers are hit by
+# health checkers and verification crawlers far more often than anything else.
+_HEALTH_BODY = b'{"status":"ok"}'
+_X402_VERIFICATION_BODY = b'{"x402":"dccd5db92bc9"}'
+
+
+def _request_base_url() -> str:
+    """Base URL for the current request, memoized on ``g``.
+
+    Crawlers hitting several discovery routes in one request cycle and
+    handlers that need the base URL more than once all share one
+    PUBLIC_URL lookup / ``url_root`` rstrip per request.
+    """
+    base_url = g.get("base_url")
+    if base_url is None:
+        base_url = (
+            current_app.config.get("PUBLIC_URL") or request.url_root.rstrip("/")
+        )
+        g.base_url = base_url
+    return base_url
+
+
+def _json_response(payload: Any, status: int = 200) -> Response:
+    """Build a JSON response via the compact (orjson-backed) encoder.
+
+    Skips Flask's reflection-based JSON provider; ``json_dumps_compact``
+    uses orjson when installed and stdlib json otherwise.
+    """
+    return Response(
+        json_dumps_compact(payload), status=status, content_type="application/json"
+    )
+
+
+def _build_ai_plugin_doc(base_url: str) -> dict[str, object]:
+    return {
+        "schema_version": "v1",
+        "name_for_human": "Augur",
+        "name_for_model": "augur",
+        "description_for_human": (
+            "Base mainnet smart contract admission control via x402. "
+            "Analyzes bytecode for proxy, reentrancy, selfdestruct, "
+            "honeypot, hidden mint, fee manipulation, delegatecall, and "
+            "deployer reputation patterns. Returns a first-pass decision, "
+            "policy recommendation, supporting findings, and a 0-100 score."
+        ),
+        "description_for_model": (
+            "Analyze Base mainnet smart contract bytecode. "
+            "Send a Base contract address to /analyze and receive a default "
+            "decision, policy recommendation, detailed findings from 8 "
+            'detectors, and a 0-100 score. "safe" is not a guarantee or audit result. '
+            "Requires x402 payment of $0.10 USDC on Base."
+        ),
+        "auth": {"type": "none"},
+        "api": {
+            "type": "openapi",
+            "url": f"{base_url}/openapi.json",
+        },
+    }
+
+
+def _build_agent_card_doc(base_url: str) -> dict[str, object]:
+    return {
+        "name": "Augur",
+        "description": (
+            "Deterministic Base contract admission control for agents on Base. "
+            "Analyzes bytecode patterns and returns a default decision, "
+            "policy recommendation, supporting findings, and a 0-100 score. "
+            "Pay $0.10/call via x402 in USDC on Base."
+        ),
+        "provider": {"organization": "risk-api"},
+        "documentationUrl": f"{base_url}/skill.md",
+        "iconUrl": f"{base_url}/avatar.png",
+        "version": "1.0.0",
+        "url": base_url,
+        "interfaces": [
+            {
+                "type": "http",
+                "baseUrl": base_url,
+            }
+        ],
+        "capabilities": {
+            "streaming": False,
+            "pushNotifications": False,
+            "extendedAgentCard": False,
+        },
+        "skills": [
+            {
+                "id": "analyze-contract",
+                "name": "Contract Admission Decision (OASF 1304)",
+                "description": (
+                    "Fetch on-chain bytecode for a Base mainnet contract address "
+                    "and run 8 detectors to produce a first-pass decision, "
+                    "policy recommendation, and supporting score."
+                ),
+                "tags": ["oasf:security_privacy"],
+            },
+        ],
+        "security": [],
+        "securitySchemes": {},
+        "defaultInputModes": ["application/json"],
+        "defaultOutputModes": ["application/json"],
+    }
+
+
+def _build_x402_discovery_doc(base_url: str) -> dict[str, object]:
+    return {
+        "version": 1,
+        "resources": [
+            f"{base_url}/analyze",
+        ],
+        "instructions": (
+            "# Augur - Deterministic Base Contract Admission Control\n\n"
+            "Bytecode-level admission control for Base mainnet smart contracts. "
+            "8 detectors: delegatecall, hidden mint, fee-on-transfer, "
+            "selfdestruct, reentrancy patterns, honeypot, proxy detection, "
+            "deployer reputation (explorer-backed). Returns an effective decision, "
+            "policy recommendation, supporting findings, and a 0-100 composite score.\n\n"
+            "## Usage\n\n"
+            "First successful paid call:\n"
+            f"GET /analyze?address={SAFE_EXAMPLE_ADDRESS}\n"
+            "PAYMENT-SIGNATURE: <x402-payment-proof>\n"
+            "Expected 200 JSON includes decision=allow, contract_decision=allow, level=safe, score=0.\n\n"
+            "GET /analyze?address={base_contract_address}\n"
+            "POST /analyze with JSON body: {\"address\": \"0x...\"}\n\n"
+            "## Output\n\n"
+            "- `decision`: primary branch field; allow, warn, manual_review, or block\n"
+            "- `contract_decision`: contract-only policy before optional action-aware escalation\n"
+            "- `recommended_policy`: action equal to decision, summary, and machine-readable reason codes\n"
+            "- `score`: 0-100 (safe=0-15, low=16-35, medium=36-55, "
+            "high=56-75, critical=76-100)\n"
+            '- `safe`: no major bytecode-level risk signals detected in this scan, not a guarantee\n'
+            "- `findings`: array of detector results with severity and points\n"
+            "- `category_scores`: per-category breakdown\n"
+            "- `implementation`: proxy target analysis (when proxy detected)\n\n"
+            "## Pricing\n\n"
+            "$0.10/call via x402 (USDC on Base). No API key needed.\n\n"
+            f"Agent Card: {base_url}/.well-known/agent-card.json\n"
+            f"OpenAPI: {base_url}/openapi.json"
+        ),
+    }
+
+
+def _build_openapi_doc(base_url: str) -> dict[str, object]:
+    return {**OPENAPI_SPEC, "servers": [{"url": base_url}]}
+
+
+_API_CATALOG_CONTENT_TYPE = (
+    'application/linkset+json; profile="https://www.rfc-editor.org/info/rfc9727"'
+)
+
+
+def _build_api_catalog_doc(base_url: str) -> dict[str, object]:
+    return {
+        "linkset": [{
+            "anchor": f"{base_url}/.well-known/api-catalog",
+            "service-desc": [
+                {"href": f"{base_url}/openapi.json", "type": "application/json"},
+            ],
+            "service-doc": [
+                {"href": f"{base_url}/", "type": "text/html"},
+            ],
+        }],
+    }
+
+
 class FlaskHTTPAdapter:
     """Adapts Flask request to x402 HTTPAdapter protocol."""
 
@@ -2872,8 +3370,10 @@ class FlaskHTTPAdapter:
     def get_query_param(self, name: str) -> str | list[str] | None:
         return request.args.get(name)
 
-    def get_query_params(self) -> dict[str, str | list[str]] | None:
-        return dict(request.args)
+    def get_query_params(self) -> Mapping[str, str | list[str]] | None:
+        # request.args already satisfies the Mapping protocol the SDK reads
+        # from; returning it directly avoids a dict copy per gated request.
+        return request.args
 
     def get_url(self) -> str:
         public_url = current_app.config.get("PUBLIC_URL")
@@ -2888,6 +3388,32 @@ class FlaskHTTPAdapter:
         return request.get_json(silent=True)
 
 
+# Background settlement pool, created on first paid request so apps without
+# the payment middleware never spawn the threads. Drained on exit so pending
+# settlements are not dropped by a graceful shutdown.
+_settle_pool_instance: ThreadPoolExecutor | None = None
+_settle_pool_lock = threading.Lock()
+
+
+def _settle_pool() -> ThreadPoolExecutor:
+    global _settle_pool_instance
+    if _settle_pool_instance is None:
+        with _settle_pool_lock:
+            if _settle_pool_instance is None:
+                _settle_pool_instance = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="x402-settle"
+                )
+                atexit.register(_settle_pool_instance.shutdown, wait=True)
+    return _settle_pool_instance
+
+
+def _settle_in_background(http_server: Any, payload: Any, requirements: Any) -> None:
+    try:
+        http_server.process_settlement(payload, requirements)
+    except Exception:
+        logger.exception("x402 settlement failed")
+
+
 def _setup_x402_middleware(app: Flask, config: Config) -> bool:
     """Set up x402 payment middleware. Returns True if successful."""
     try:
@@ -2926,8 +3452,20 @@ def _setup_x402_middleware(app: Flask, config: Config) -> bool:
                 "facilitator may reject requests"
             )
 
+    # Verify + settle hit the facilitator on every paid request; a shared
+    # keep-alive client avoids paying a TCP/TLS handshake per call.
+    import httpx
+
     fac_config = FacilitatorConfig(
-        url=config.facilitator_url, auth_provider=auth_provider
+        url=config.facilitator_url,
+        auth_provider=auth_provider,
+        http_client=httpx.Client(
+            timeout=30.0,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=32, keepalive_expiry=30.0
+            ),
+        ),
     )
     facilitator = HTTPFacilitatorClientSync(fac_config)
     resource_server = x402ResourceServerSync(facilitator)
@@ -3012,19 +3550,22 @@ def _setup_x402_middleware(app: Flask, config: Config) -> bool:
 
     @app.before_request
     def x402_payment_gate():
-        if request.path not in PROTECTED_ROUTES:
+        path = request.path
+        if path not in PROTECTED_ROUTES:
             return None
-        if request.method not in ANALYZE_REQUEST_METHODS:
+        method = request.method
+        if method not in ANALYZE_REQUEST_METHODS:
             return None
 
         # HEAD should be gated same as GET for payment purposes;
         # x402 SDK only registers GET/POST routes.
-        method = "GET" if request.method == "HEAD" else request.method
+        if method == "HEAD":
+            method = "GET"
 
         adapter = FlaskHTTPAdapter()
         context = HTTPRequestContext(
             adapter=adapter,
-            path=request.path,
+            path=path,
             method=method,
         )
         result = http_server.process_http_request(context)
@@ -3033,8 +3574,9 @@ def _setup_x402_middleware(app: Flask, config: Config) -> bool:
             return None
         elif result.type == "payment-verified":
             # Store payment info for potential settlement after response
-            request.environ["x402_payload"] = result.payment_payload
-            request.environ["x402_requirements"] = result.payment_requirements
+            environ = request.environ
+            environ["x402_payload"] = result.payment_payload
+            environ["x402_requirements"] = result.payment_requirements
             return None
         else:
             # payment-error: return 402 with payment requirements
@@ -3053,24 +3595,154 @@ def _setup_x402_middleware(app: Flask, config: Config) -> bool:
 
     @app.after_request
     def x402_settle(response: Response) -> Response:
-        if response.status_code == 200 and request.path in PROTECTED_ROUTES:
-            payload = request.environ.get("x402_payload")
+        # The gate only stashes x402_payload on protected routes, so probing
+        # the environ first doubles as the route check and lets the common
+        # unpaid request skip the path/set lookups entirely.
+        payload = request.environ.get("x402_payload")
+        if payload and response.status_code == 200:
             requirements = request.environ.get("x402_requirements")
-            if payload and requirements:
-                try:
-                    http_server.process_settlement(payload, requirements)
-                except Exception:
-                    logger.exception("x402 settlement failed")
+            if requirements:
+                # Settlement is fire-and-forget (failures were only ever
+                # logged), so run it off the request thread and return the
+                # response without waiting on the facilitator roundtrip.
+                _settle_pool().submit(
+                    _settle_in_background, http_server, payload, requirements
+                )
         return response
 
     logger.info("x402 payment middleware enabled for %s", PROTECTED_ROUTES)
     return True
 
 
+# Log timestamps have whole-second resolution, so the formatted string only
+# changes once a second; strftime/gmtime run at most once per second instead
+# of per request.
+_iso_ts_second = 0
+_iso_ts_string = ""
+
+
+def _iso_utc_now() -> str:
+    global _iso_ts_second, _iso_ts_string
+    now = int(time.time())
+    if now != _iso_ts_second:
+        parts = time.gmtime(now)
+        _iso_ts_string = (
+            f"{parts.tm_year:04d}-{parts.tm_mon:02d}-{parts.tm_mday:02d}T"
+            f"{parts.tm_hour:02d}:{parts.tm_min:02d}:{parts.tm_sec:02d}Z"
+        )
+        _iso_ts_second = now
+    return _iso_ts_string
+
+
+# Rotation bounds for the JSONL request log. /stats aggregates the active
+# file, so capping its size also caps the worst-case cost of a full re-scan.
+REQUEST_LOG_MAX_BYTES = 32 * 1024 * 1024
+REQUEST_LOG_BACKUP_COUNT = 3
+
+
+def _make_batched_log_handler_class() -> type:
+    """Build the batched rotating handler class (lazy import, like the base)."""
+    from logging.handlers import RotatingFileHandler
+
+    class _BatchedRotatingFileHandler(RotatingFileHandler):
+        """Rotating file handler that writes from a background thread.
+
+        Request threads only enqueue records; a daemon thread drains the
+        queue and writes batches with a single flush per batch, so the
+        hot path never pays log I/O and bursts amortize write syscalls.
+        ``flush()`` from any other thread blocks until queued entries are
+        on disk, which keeps /stats (and tests) reading fresh data.
+        """
+
+        _MAX_BATCH = 256
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            super().__init__(*args, **kwargs)
+            self._queue: queue.SimpleQueue = queue.SimpleQueue()
+            self._writer = threading.Thread(
+                target=self._drain, name="request-log-writer", daemon=True
+            )
+            self._writer.start()
+
+        def emit(self, record: logging.LogRecord) -> None:
+            self._queue.put(record)
+
+        def flush(self) -> None:
+            if threading.current_thread() is self._writer:
+                # Per-record flushes from the base emit are suppressed;
+                # _drain flushes once per batch instead.
+                return
+            if not self._writer.is_alive():
+                super().flush()
+                return
+            done = threading.Event()
+            self._queue.put(done)
+            done.wait(timeout=5.0)
+
+        def close(self) -> None:
+            if self._writer.is_alive():
+                self._queue.put(None)
+                self._writer.join(timeout=5.0)
+            super().close()
+
+        def doRollover(self) -> None:
+            super().doRollover()
+            # The file that just filled up is now "<path>.1"; fold its
+            # counters into the persisted rollup so /stats totals keep
+            # covering rotated-away history. Runs on the writer thread
+            # during an already-rare rotation, so request threads never
+            # pay for the re-scan.
+            try:
+                fold_log_into_stats_rollup(
+                    self.baseFilename + ".1",
+                    stats_rollup_path(self.baseFilename),
+                    intent_page_stages=INTENT_PAGE_STAGES,
+                    machine_doc_stages=MACHINE_DOC_STAGES,
+                )
+            except Exception:
+                logger.exception(
+                    "Failed to fold rotated request log into stats rollup"
+                )
+
+        def _drain(self) -> None:
+            while True:
+                item = self._queue.get()
+                waiters: list[threading.Event] = []
+                wrote = 0
+                stop = False
+                while True:
+                    if item is None:
+                        stop = True
+                    elif isinstance(item, threading.Event):
+                        waiters.append(item)
+                    else:
+                        super().emit(item)
+                        wrote += 1
+                    if stop or wrote >= self._MAX_BATCH:
+                        break
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                if wrote:
+                    super().flush()
+                for waiter in waiters:
+                    waiter.set()
+                if stop:
+                    return
+
+    return _BatchedRotatingFileHandler
+
+
+def flush_request_log() -> None:
+    """Block until queued request-log entries have been written to disk."""
+    for handler in list(request_logger.handlers):
+        if getattr(handler, "_risk_api_request_log", False):
+            handler.flush()
+
+
 def _configure_request_log_file(app: Flask) -> None:
     """Attach a file handler to the request logger if REQUEST_LOG_PATH is set."""
-    import os
-
     log_path = os.environ.get("REQUEST_LOG_PATH", "")
     if not log_path:
         return
@@ -3083,7 +3755,13 @@ def _configure_request_log_file(app: Flask) -> None:
             request_logger.removeHandler(handler)
             handler.close()
 
-    handler = logging.FileHandler(log_path, encoding="utf-8")
+    handler_cls = _make_batched_log_handler_class()
+    handler = handler_cls(
+        log_path,
+        encoding="utf-8",
+        maxBytes=REQUEST_LOG_MAX_BYTES,
+        backupCount=REQUEST_LOG_BACKUP_COUNT,
+    )
     handler._risk_api_request_log = True  # type: ignore[attr-defined]
     handler.setFormatter(logging.Formatter("%(message)s"))
     request_logger.addHandler(handler)
@@ -3094,8 +3772,6 @@ def _configure_request_log_file(app: Flask) -> None:
 
 def _configure_analytics_store(app: Flask) -> None:
     """Initialize the durable analytics backend when configured."""
-    import os
-
     db_path = os.environ.get("ANALYTICS_DB_PATH", "")
     if not db_path:
         return
@@ -3118,25 +3794,35 @@ def _setup_request_logging(app: Flask) -> None:
 
     @app.after_request
     def _log_request(response: Response) -> Response:
-        request_id = request.environ.get("request_id")
+        environ = request.environ
+        path = request.path
+
+        request_id = environ.get("request_id")
         if isinstance(request_id, str) and request_id:
             response.headers["X-Request-ID"] = request_id
 
-        if request.environ.get("skip_request_log"):
+        if environ.get("skip_request_log"):
             return response
-        if not _should_log_request(request.path, request.method):
+        if not _should_log_request(path, request.method):
+            return response
+        if not (
+            app.config.get("REQUEST_LOG_PATH")
+            or app.config.get("ANALYTICS_DB_PATH")
+        ):
+            # No log file and no analytics store: building the entry would
+            # be pure per-request waste, so skip it entirely.
             return response
 
-        start = request.environ.get("_req_start")
+        start = environ.get("_req_start")
         duration_ms = (
             round((time.monotonic() - start) * 1000) if start else None
         )
 
         entry: dict[str, object] = {
-            "ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-            "path": request.path,
+            "ts": _iso_utc_now(),
+            "path": path,
             "status": response.status_code,
-            "paid": request.environ.get("x402_payload") is not None,
+            "paid": environ.get("x402_payload") is not None,
             "duration_ms": duration_ms,
             "user_agent": request.headers.get("User-Agent", ""),
             "method": request.method,
@@ -3144,14 +3830,12 @@ def _setup_request_logging(app: Flask) -> None:
             "referer": request.headers.get("Referer", ""),
             "request_id": request_id or "",
         }
-        funnel_stage = request.environ.get("funnel_stage") or _public_request_stage(
-            request.path
-        )
+        funnel_stage = environ.get("funnel_stage") or _public_request_stage(path)
         if isinstance(funnel_stage, str) and funnel_stage:
             entry["funnel_stage"] = funnel_stage
 
-        if request.path == "/analyze":
-            request_fields = request.environ.get("analyze_request_fields")
+        if path == "/analyze":
+            request_fields = environ.get("analyze_request_fields")
             if not isinstance(request_fields, Mapping):
                 request_fields, _ = _extract_analyze_request_fields()
             if isinstance(request_fields, Mapping):
@@ -3163,39 +3847,36 @@ def _setup_request_logging(app: Flask) -> None:
                     entry["spender"] = request_fields["spender"]
                 if request_fields.get("chain"):
                     entry["chain"] = request_fields["chain"]
-            action_spender_trust = request.environ.get("action_spender_trust")
+            action_spender_trust = environ.get("action_spender_trust")
             if (
                 isinstance(action_spender_trust, ApproveSpenderTrust)
                 and action_spender_trust
             ):
                 entry["action_spender_trust"] = action_spender_trust.value
-            error_type = request.environ.get("analyze_error_type")
+            error_type = environ.get("analyze_error_type")
             if isinstance(error_type, str) and error_type:
                 entry["error_type"] = error_type
 
-        if request.path == "/analyze" and response.status_code == 200:
-            try:
-                data = response.get_json(silent=True)
-                if data and isinstance(data, dict):
-                    entry["score"] = data.get("score")
-                    entry["level"] = data.get("level")
-                    action_evaluation = data.get("action_evaluation")
-                    if isinstance(action_evaluation, Mapping):
-                        action_decision = action_evaluation.get("decision")
-                        if isinstance(action_decision, str) and action_decision:
-                            entry["action_decision"] = action_decision
-            except Exception:
-                pass
+        if path == "/analyze" and response.status_code == 200:
+            # analyze() stashes its response dict in the environ, so the
+            # logger reads it directly instead of re-parsing the body JSON.
+            data = environ.get("paid_response_snapshot")
+            if isinstance(data, Mapping) and data:
+                entry["score"] = data.get("score")
+                entry["level"] = data.get("level")
+                action_evaluation = data.get("action_evaluation")
+                if isinstance(action_evaluation, Mapping):
+                    action_decision = action_evaluation.get("decision")
+                    if isinstance(action_decision, str) and action_decision:
+                        entry["action_decision"] = action_decision
 
         entry["traffic_class"] = classify_traffic_class(entry)
-        request_logger.info(json.dumps(entry, separators=(",", ":")))
+        request_logger.info(json_dumps_compact(entry))
 
         db_path = app.config.get("ANALYTICS_DB_PATH", "")
         if isinstance(db_path, str) and db_path:
             try:
-                paid_response_snapshot = request.environ.get(
-                    "paid_response_snapshot"
-                )
+                paid_response_snapshot = environ.get("paid_response_snapshot")
                 append_sqlite_entry(
                     db_path,
                     entry,
@@ -3223,6 +3904,7 @@ def create_app(
 
     app = Flask(__name__)
     app.config["RISK_API_CONFIG"] = config
+    app.config["MAX_CONTENT_LENGTH"] = MAX_REQUEST_BODY_BYTES
     if config.erc8004_agent_id is not None:
         app.config["ERC8004_AGENT_ID"] = config.erc8004_agent_id
     if config.public_url:
@@ -3261,24 +3943,26 @@ def create_app(
 
         if request_error is not None:
             request.environ["funnel_stage"] = "invalid_address"
+            if request_error == OVERSIZED_BODY_ERROR:
+                request.environ["analyze_error_type"] = "oversized_body"
+                return _json_response({"error": request_error}, status=413)
             request.environ["analyze_error_type"] = (
                 "conflicting_request_field"
                 if "Conflicting" in request_error
                 else "invalid_json_body"
             )
-            return jsonify({"error": request_error}), 422
+            return _json_response({"error": request_error}, status=422)
 
         if not address:
             request.environ["funnel_stage"] = "invalid_address"
             request.environ["analyze_error_type"] = "missing_address"
-            return jsonify({"error": "Missing 'address' query parameter"}), 422
+            return _json_response({"error": "Missing 'address' query parameter"}, status=422)
 
-        if not ADDRESS_RE.match(address):
+        if not _is_address(address):
             request.environ["funnel_stage"] = "invalid_address"
             request.environ["analyze_error_type"] = "invalid_address"
-            return (
-                jsonify({"error": f"Invalid Ethereum address: {address}"}),
-                422,
+            return _json_response(
+                {"error": f"Invalid Ethereum address: {address}"}, status=422
             )
 
         action_context, action_error_type, action_error = _validate_action_context(
@@ -3287,7 +3971,7 @@ def create_app(
         if action_error is not None:
             request.environ["funnel_stage"] = "invalid_action_context"
             request.environ["analyze_error_type"] = action_error_type
-            return jsonify({"error": action_error}), 422
+            return _json_response({"error": action_error}, status=422)
 
         # Store validated address for the route handler
         request.environ["validated_address"] = address
@@ -3309,12 +3993,12 @@ def create_app(
         except RPCError as e:
             request.environ["funnel_stage"] = "rpc_error"
             request.environ["analyze_error_type"] = "rpc_error"
-            return jsonify({"error": f"RPC error: {e}"}), 502
+            return _json_response({"error": f"RPC error: {e}"}, status=502)
 
         if _bytecode_size(bytecode_hex) == 0:
             request.environ["funnel_stage"] = "no_bytecode"
             request.environ["analyze_error_type"] = "no_bytecode"
-            return jsonify({"error": _no_bytecode_error(address)}), 422
+            return _json_response({"error": _no_bytecode_error(address)}, status=422)
 
         return None
 
@@ -3323,201 +4007,55 @@ def create_app(
 
     @app.route("/.well-known/x402-verification.json")
     def x402_verification():
-        return jsonify({"x402": "dccd5db92bc9"})
+        return Response(_X402_VERIFICATION_BODY, content_type="application/json")
 
     @app.route("/health")
     def health():
-        return jsonify({"status": "ok"})
+        return Response(_HEALTH_BODY, content_type="application/json")
 
     @app.route("/")
     def landing():
         request.environ["funnel_stage"] = "landing_view"
-        base_url = app.config.get("PUBLIC_URL") or request.url_root.rstrip("/")
-        json_ld = json.dumps({
-            "@context": "https://schema.org",
-            "@type": "WebAPI",
-            "name": "Augur",
-            "description": (
-                "Deterministic Base contract admission control for agents on Base. "
-                "Runs deterministic bytecode detectors and returns a decision, "
-                "policy recommendation, supporting findings, and a 0-100 score."
-            ),
-            "url": base_url,
-            "provider": {
-                "@type": "Organization",
-                "name": "risk-api",
-            },
-            "offers": {
-                "@type": "Offer",
-                "price": "0.10",
-                "priceCurrency": "USD",
-                "url": f"{base_url}/analyze",
-                "description": "Per-call pricing via x402 protocol in USDC on Base",
-            },
-            "documentation": f"{base_url}/openapi.json",
-        })
-        faq_json_ld = json.dumps({
-            "@context": "https://schema.org",
-            "@type": "FAQPage",
-            "mainEntity": [
-                {
-                    "@type": "Question",
-                    "name": "What does Augur do?",
-                    "acceptedAnswer": {
-                    "@type": "Answer",
-                        "text": (
-                            "Augur is a deterministic Base contract admission-control API "
-                            "for agents and the developers building them. It fetches on-chain "
-                            "bytecode for a contract on Base and runs "
-                            "8 detectors (proxy, reentrancy, selfdestruct, honeypot, hidden mint, "
-                            "fee manipulation, delegatecall, deployer reputation) to produce a "
-                            "effective decision, policy recommendation, supporting findings, and a "
-                            "composite 0-100 score before a workflow decides whether to proceed."
-                        ),
-                    },
-                },
-                {
-                    "@type": "Question",
-                    "name": "How much does it cost?",
-                    "acceptedAnswer": {
-                        "@type": "Answer",
-                        "text": (
-                            "$0.10 per call, paid in USDC on Base via the x402 protocol. "
-                            "No subscription, no API key, no signup required."
-                        ),
-                    },
-                },
-                {
-                    "@type": "Question",
-                    "name": "How do AI agents pay for the API?",
-                    "acceptedAnswer": {
-                        "@type": "Answer",
-                        "text": (
-                            "Via the x402 protocol: send GET /analyze?address=<contract>, "
-                            "receive a 402 response with payment details, sign a USDC "
-                            "authorization on Base, and retry the request with the "
-                            "PAYMENT-SIGNATURE header. The entire flow is automated by "
-                            "x402-compatible HTTP clients."
-                        ),
-                    },
-                },
-                {
-                    "@type": "Question",
-                    "name": "What risk patterns does Augur detect?",
-                    "acceptedAnswer": {
-                        "@type": "Answer",
-                        "text": (
-                            "8 detectors: proxy contracts (EIP-1967/1822/OZ), reentrancy "
-                            "vulnerabilities, selfdestruct capability, honeypot patterns, "
-                            "hidden mint functions, fee manipulation, delegatecall usage, "
-                            "and deployer wallet reputation via an explorer-backed path."
-                        ),
-                    },
-                },
-                {
-                    "@type": "Question",
-                    "name": "What chains are supported?",
-                    "acceptedAnswer": {
-                        "@type": "Answer",
-                        "text": "Base (EIP-155:8453). Payment is also in USDC on Base.",
-                    },
-                },
-                {
-                    "@type": "Question",
-                    "name": "Does a safe score mean the contract is guaranteed safe?",
-                    "acceptedAnswer": {
-                        "@type": "Answer",
-                        "text": (
-                            'No. "safe" means Augur did not detect major bytecode-level risk '
-                            "signals in this scan. It is not a full security audit or guarantee."
-                        ),
-                    },
-                },
-                {
-                    "@type": "Question",
-                    "name": "Do I need an API key?",
-                    "acceptedAnswer": {
-                        "@type": "Answer",
-                        "text": (
-                            "No. x402 payment is the only authentication. Any agent or "
-                            "client with a USDC wallet on Base can call the API immediately."
-                        ),
-                    },
-                },
-            ],
-        })
-        html = LANDING_HTML.replace("__BASE_URL__", base_url).replace(
-            "__JSON_LD__", json_ld
-        ).replace("__FAQ_JSON_LD__", faq_json_ld)
-        return Response(html, content_type="text/html")
+        base_url = _request_base_url()
+        return Response(
+            _rendered_body("landing", base_url, _render_landing_html),
+            content_type="text/html",
+        )
 
     @app.route("/robots.txt")
     def robots_txt():
-        base_url = app.config.get("PUBLIC_URL") or request.url_root.rstrip("/")
-        body = (
-            "User-agent: *\n"
-            "Allow: /\n"
-            "Allow: /skill.md\n"
-            "Allow: /openapi.json\n"
-            "Allow: /.well-known/\n"
-            "Allow: /agent-metadata.json\n"
-            "Allow: /llms.txt\n"
-            "Allow: /llms-full.txt\n"
-            "Disallow: /stats\n"
-            "Disallow: /dashboard\n"
-            "\n"
-            f"Sitemap: {base_url}/sitemap.xml\n"
+        base_url = _request_base_url()
+        return Response(
+            _rendered_body("robots", base_url, _render_robots_txt),
+            content_type="text/plain",
         )
-        return Response(body, content_type="text/plain")
 
     @app.route("/sitemap.xml")
     def sitemap_xml():
-        base_url = app.config.get("PUBLIC_URL") or request.url_root.rstrip("/")
-        paths = [
-            "/",
-            "/skill.md",
-            "/mcp",
-            "/how-payment-works",
-            *INTENT_PAGES.keys(),
-            *REPORT_PAGES.keys(),
-            "/openapi.json",
-            "/agent-metadata.json",
-            "/.well-known/ai-plugin.json",
-            "/.well-known/agent-card.json",
-            "/.well-known/x402",
-            "/.well-known/api-catalog",
-            "/llms.txt",
-            "/llms-full.txt",
-        ]
-        urls = "\n".join(
-            f"  <url><loc>{base_url}{p}</loc></url>" for p in paths
-        )
-        xml = (
-            '<?xml version="1.0" encoding="UTF-8"?>\n'
-            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-            f"{urls}\n"
-            "</urlset>\n"
+        base_url = _request_base_url()
+        return Response(
+            _rendered_body("sitemap", base_url, _render_sitemap_xml),
+            content_type="application/xml",
         )
-        return Response(xml, content_type="application/xml")
 
     @app.route("/how-payment-works")
     def how_payment_works():
         request.environ["funnel_stage"] = "how_payment_view"
-        base_url = app.config.get("PUBLIC_URL") or request.url_root.rstrip("/")
+        base_url = _request_base_url()
         html = PAYMENT_GUIDE_HTML.replace("__BASE_URL__", base_url)
         return Response(html, content_type="text/html")
 
     @app.route("/mcp")
     def mcp_guide():
         request.environ["funnel_stage"] = "mcp_guide_view"
-        base_url = app.config.get("PUBLIC_URL") or request.url_root.rstrip("/")
+        base_url = _request_base_url()
         html = MCP_GUIDE_HTML.replace("__BASE_URL__", base_url)
         return Response(html, content_type="text/html")
 
     @app.route("/skill.md")
     def skill_md():
         request.environ["funnel_stage"] = "skill_doc_fetch"
-        base_url = app.config.get("PUBLIC_URL") or request.url_root.rstrip("/")
+        base_url = _request_base_url()
         body = _render_machine_doc(SKILL_MD, base_url)
         return Response(body, content_type="text/plain; charset=utf-8")
 
@@ -3525,9 +4063,9 @@ def create_app(
     def proof_report(slug: str):
         report_path = f"/reports/{slug}"
         if report_path not in REPORT_PAGES:
-            return jsonify({"error": "report not found"}), 404
+            return _json_response({"error": "report not found"}, status=404)
         request.environ["funnel_stage"] = _public_request_stage(report_path)
-        base_url = app.config.get("PUBLIC_URL") or request.url_root.rstrip("/")
+        base_url = _request_base_url()
         return Response(
             render_report_page(base_url, report_path),
             content_type="text/html",
@@ -3540,7 +4078,7 @@ def create_app(
         request.environ["funnel_stage"] = (
             PUBLIC_REQUEST_STAGE_BY_PATH.get(request.path, "intent_page_view")
         )
-        base_url = app.config.get("PUBLIC_URL") or request.url_root.rstrip("/")
+        base_url = _request_base_url()
         return Response(
             _render_intent_page(base_url, request.path),
             content_type="text/html",
@@ -3548,7 +4086,16 @@ def create_app(
 
     @app.route("/dashboard")
     def dashboard():
-        return Response(DASHBOARD_HTML, content_type="text/html")
+        if request.headers.get("If-None-Match") == _DASHBOARD_ETAG:
+            response = Response(status=304)
+        elif "gzip" in request.headers.get("Accept-Encoding", ""):
+            response = Response(_DASHBOARD_BODY_GZ, content_type="text/html")
+            response.headers["Content-Encoding"] = "gzip"
+        else:
+            response = Response(_DASHBOARD_BODY, content_type="text/html")
+        response.headers["ETag"] = _DASHBOARD_ETAG
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
 
     @app.route("/stats")
     def stats():
@@ -3556,7 +4103,7 @@ def create_app(
         analytics_db_path = app.config.get("ANALYTICS_DB_PATH", "")
         log_path = app.config.get("REQUEST_LOG_PATH", "")
         if analytics_db_path:
-            return jsonify(
+            return _json_response(
                 build_sqlite_stats_payload(
                     str(analytics_db_path),
                     intent_page_stages=INTENT_PAGE_STAGES,
@@ -3567,19 +4114,12 @@ def create_app(
                 )
             )
         if not log_path:
-            return jsonify({"error": "logging not configured"}), 501
-
-        import os
-        if not os.path.exists(log_path):
-            payload = empty_stats_payload()
-            payload["storage_backend"] = "jsonl"
-            payload["storage_path"] = str(log_path)
-            payload["storage_durable"] = False
-            return jsonify(payload)
-
-        return jsonify(
-            build_stats_payload(
-                iter_jsonl_entries(str(log_path)),
+            return _json_response({"error": "logging not configured"}, status=501)
+
+        flush_request_log()
+        return _json_response(
+            build_jsonl_stats_payload(
+                str(log_path),
                 intent_page_stages=INTENT_PAGE_STAGES,
                 machine_doc_stages=MACHINE_DOC_STAGES,
                 storage_backend="jsonl",
@@ -3590,183 +4130,88 @@ def create_app(
 
     @app.route("/avatar.png")
     def avatar():
-        if _AVATAR_BYTES is None:
-            return Response("Avatar not found", status=404)
-        return Response(_AVATAR_BYTES, content_type="image/png")
+        return _static_image_response(_AVATAR_BYTES, _AVATAR_ETAG, "Avatar not found")
 
     @app.route("/favicon.png")
     def favicon():
-        if _FAVICON_BYTES is None:
-            return Response("Favicon not found", status=404)
-        return Response(_FAVICON_BYTES, content_type="image/png")
+        return _static_image_response(
+            _FAVICON_BYTES, _FAVICON_ETAG, "Favicon not found"
+        )
 
     @app.route("/og/base-bluechip-bytecode-snapshot.png")
     def base_bluechip_og_image():
-        if _BASE_BLUECHIP_OG_BYTES is None:
-            return Response("OG image not found", status=404)
-        return Response(_BASE_BLUECHIP_OG_BYTES, content_type="image/png")
+        return _static_image_response(
+            _BASE_BLUECHIP_OG_BYTES, _BASE_BLUECHIP_OG_ETAG, "OG image not found"
+        )
 
     @app.route("/openapi.json")
     def openapi_spec():
-        spec = dict(OPENAPI_SPEC)
-        base_url = app.config.get("PUBLIC_URL") or request.url_root.rstrip("/")
-        spec["servers"] = [{"url": base_url}]
-        return jsonify(spec)
+        base_url = _request_base_url()
+        return _discovery_json_response("openapi", base_url, _build_openapi_doc)
 
     @app.route("/.well-known/ai-plugin.json")
     def ai_plugin():
-        base_url = app.config.get("PUBLIC_URL") or request.url_root.rstrip("/")
-        return jsonify({
-            "schema_version": "v1",
-            "name_for_human": "Augur",
-            "name_for_model": "augur",
-            "description_for_human": (
-                "Base mainnet smart contract admission control via x402. "
-                "Analyzes bytecode for proxy, reentrancy, selfdestruct, "
-                "honeypot, hidden mint, fee manipulation, delegatecall, and "
-                "deployer reputation patterns. Returns a first-pass decision, "
-                "policy recommendation, supporting findings, and a 0-100 score."
-            ),
-            "description_for_model": (
-                "Analyze Base mainnet smart contract bytecode. "
-                "Send a Base contract address to /analyze and receive a default "
-                "decision, policy recommendation, detailed findings from 8 "
-                'detectors, and a 0-100 score. "safe" is not a guarantee or audit result. '
-                "Requires x402 payment of $0.10 USDC on Base."
-            ),
-            "auth": {"type": "none"},
-            "api": {
-                "type": "openapi",
-                "url": f"{base_url}/openapi.json",
-            },
-        })
+        base_url = _request_base_url()
+        return _discovery_json_response("ai-plugin", base_url, _build_ai_plugin_doc)
 
     @app.route("/.well-known/agent.json")
     @app.route("/.well-known/agent-card.json")
     def a2a_agent_card():
         """A2A (Agent-to-Agent) protocol agent card for discovery."""
-        base_url = app.config.get("PUBLIC_URL") or request.url_root.rstrip("/")
-        return jsonify({
-            "name": "Augur",
-            "description": (
-                "Deterministic Base contract admission control for agents on Base. "
-                "Analyzes bytecode patterns and returns a default decision, "
-                "policy recommendation, supporting findings, and a 0-100 score. "
-                "Pay $0.10/call via x402 in USDC on Base."
-            ),
-            "provider": {"organization": "risk-api"},
-            "documentationUrl": f"{base_url}/skill.md",
-            "iconUrl": f"{base_url}/avatar.png",
-            "version": "1.0.0",
-            "url": base_url,
-            "interfaces": [
-                {
-                    "type": "http",
-                    "baseUrl": base_url,
-                }
-            ],
-            "capabilities": {
-                "streaming": False,
-                "pushNotifications": False,
-                "extendedAgentCard": False,
-            },
-            "skills": [
-                {
-                    "id": "analyze-contract",
-                    "name": "Contract Admission Decision (OASF 1304)",
-                    "description": (
-                        "Fetch on-chain bytecode for a Base mainnet contract address "
-                        "and run 8 detectors to produce a first-pass decision, "
-                        "policy recommendation, and supporting score."
-                    ),
-                    "tags": ["oasf:security_privacy"],
-                },
-            ],
-            "security": [],
-            "securitySchemes": {},
-            "defaultInputModes": ["application/json"],
-            "defaultOutputModes": ["application/json"],
-        })
+        base_url = _request_base_url()
+        return _discovery_json_response("agent-card", base_url, _build_agent_card_doc)
 
     @app.route("/llms.txt")
     def llms_txt():
-        base_url = app.config.get("PUBLIC_URL") or request.url_root.rstrip("/")
+        base_url = _request_base_url()
         body = _render_machine_doc(LLMS_TXT, base_url)
         return Response(body, content_type="text/plain; charset=utf-8")
 
     @app.route("/llms-full.txt")
     def llms_full_txt():
-        base_url = app.config.get("PUBLIC_URL") or request.url_root.rstrip("/")
+        base_url = _request_base_url()
         body = _render_machine_doc(LLMS_FULL_TXT, base_url)
         return Response(body, content_type="text/plain; charset=utf-8")
 
     @app.route("/.well-known/x402")
     def wellknown_x402():
         """x402 discovery document for x402scan and compatible crawlers."""
-        base_url = app.config.get("PUBLIC_URL") or request.url_root.rstrip("/")
-        return jsonify({
-            "version": 1,
-            "resources": [
-                f"{base_url}/analyze",
-            ],
-            "instructions": (
-                "# Augur - Deterministic Base Contract Admission Control\n\n"
-                "Bytecode-level admission control for Base mainnet smart contracts. "
-                "8 detectors: delegatecall, hidden mint, fee-on-transfer, "
-                "selfdestruct, reentrancy patterns, honeypot, proxy detection, "
-                "deployer reputation (explorer-backed). Returns an effective decision, "
-                "policy recommendation, supporting findings, and a 0-100 composite score.\n\n"
-                "## Usage\n\n"
-                "First successful paid call:\n"
-                f"GET /analyze?address={SAFE_EXAMPLE_ADDRESS}\n"
-                "PAYMENT-SIGNATURE: <x402-payment-proof>\n"
-                "Expected 200 JSON includes decision=allow, contract_decision=allow, level=safe, score=0.\n\n"
-                "GET /analyze?address={base_contract_address}\n"
-                "POST /analyze with JSON body: {\"address\": \"0x...\"}\n\n"
-                "## Output\n\n"
-                "- `decision`: primary branch field; allow, warn, manual_review, or block\n"
-                "- `contract_decision`: contract-only policy before optional action-aware escalation\n"
-                "- `recommended_policy`: action equal to decision, summary, and machine-readable reason codes\n"
-                "- `score`: 0-100 (safe=0-15, low=16-35, medium=36-55, "
-                "high=56-75, critical=76-100)\n"
-                '- `safe`: no major bytecode-level risk signals detected in this scan, not a guarantee\n'
-                "- `findings`: array of detector results with severity and points\n"
-                "- `category_scores`: per-category breakdown\n"
-                "- `implementation`: proxy target analysis (when proxy detected)\n\n"
-                "## Pricing\n\n"
-                "$0.10/call via x402 (USDC on Base). No API key needed.\n\n"
-                f"Agent Card: {base_url}/.well-known/agent-card.json\n"
-                f"OpenAPI: {base_url}/openapi.json"
-            ),
-        })
+        base_url = _request_base_url()
+        return _discovery_json_response(
+            "x402-discovery", base_url, _build_x402_discovery_doc
+        )
 
     @app.route("/.well-known/api-catalog")
     def api_catalog():
         """RFC 9727 API Catalog for machine discovery of API descriptions."""
-        base_url = app.config.get("PUBLIC_URL") or request.url_root.rstrip("/")
-        catalog = {
-            "linkset": [{
-                "anchor": f"{base_url}/.well-known/api-catalog",
-                "service-desc": [
-                    {"href": f"{base_url}/openapi.json", "type": "application/json"},
-                ],
-                "service-doc": [
-                    {"href": f"{base_url}/", "type": "text/html"},
-                ],
-            }],
-        }
-        return Response(
-            json.dumps(catalog),
-            content_type=(
-                'application/linkset+json;'
-                ' profile="https://www.rfc-editor.org/info/rfc9727"'
-            ),
+        base_url = _request_base_url()
+        return _discovery_json_response(
+            "api-catalog",
+            base_url,
+            _build_api_catalog_doc,
+            content_type=_API_CATALOG_CONTENT_TYPE,
         )
 
+    # Per-app cache: the metadata body depends on app-level config (wallet
+    # address, ERC-8004 agent id), so it cannot share the module-level
+    # discovery cache. updatedAt is consequently frozen at first build,
+    # which gives registries a stable timestamp for the process lifetime.
+    agent_metadata_body_cache: dict[tuple[str, str], tuple[bytes, str]] = {}
+    # Exposed so tests sharing one app instance can invalidate after
+    # mutating the config the body is built from.
+    app.extensions["agent_metadata_body_cache"] = agent_metadata_body_cache
+
     @app.route("/agent-metadata.json")
     def agent_metadata():
         """ERC-8004 agent registration metadata."""
-        base_url = app.config.get("PUBLIC_URL") or request.url_root.rstrip("/")
+        return _discovery_json_response(
+            "agent-metadata",
+            _request_base_url(),
+            _build_agent_metadata_doc,
+            cache=agent_metadata_body_cache,
+        )
+
+    def _build_agent_metadata_doc(base_url: str) -> dict[str, object]:
         wallet_addr = config.wallet_address
         metadata: dict[str, object] = {
             "type": "https://eips.ethereum.org/EIPS/eip-8004#registration-v1",
@@ -3835,7 +4280,7 @@ def create_app(
                 }
             ]
 
-        return jsonify(metadata)
+        return metadata
 
     @app.route("/analyze", methods=["GET", "POST"])
     def analyze():
@@ -3850,11 +4295,11 @@ def create_app(
         except NoBytecodeError as e:
             request.environ["funnel_stage"] = "no_bytecode"
             request.environ["analyze_error_type"] = "no_bytecode"
-            return jsonify({"error": str(e)}), 422
+            return _json_response({"error": str(e)}, status=422)
         except RPCError as e:
             request.environ["funnel_stage"] = "rpc_error"
             request.environ["analyze_error_type"] = "rpc_error"
-            return jsonify({"error": f"RPC error: {e}"}), 502
+            return _json_response({"error": f"RPC error: {e}"}, status=502)
 
         if request.environ.get("x402_payload") is not None:
             request.environ["funnel_stage"] = "paid_request"
@@ -3882,6 +4327,12 @@ def create_app(
             action_evaluation=action_evaluation,
         )
         request.environ["paid_response_snapshot"] = response_data
-        return jsonify(response_data)
+        return _json_response(response_data)
+
+    # Warm the pure-Python analysis pipeline (no RPC) so the first paid
+    # request does not pay first-call import/compile costs; with gunicorn's
+    # preload_app this runs once in the master before workers fork.
+    if os.environ.get("RISK_API_WARMUP", "1") == "1":
+        warm_up_pipeline()
 
     return app
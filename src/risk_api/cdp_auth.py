@@ -10,16 +10,29 @@ Requires: PyJWT, cryptography
 from __future__ import annotations
 
 import base64
-import random
+import functools
+import hashlib
+import os
+import threading
 import time
-from urllib.parse import urlparse
 
 import jwt
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
+# Signed header sets are reused for 60s — half the 120s JWT validity — so
+# Ed25519 signing drops out of the per-request facilitator auth path.
+_HEADERS_TTL_SECONDS = 60
+_headers_cache: dict[tuple[str, str, str], tuple[dict[str, dict[str, str]], float]] = {}
+_headers_lock = threading.Lock()
 
+
+@functools.lru_cache(maxsize=4)
 def _parse_ed25519_key(secret: str) -> Ed25519PrivateKey:
-    """Parse base64-encoded Ed25519 private key (64 bytes: 32 seed + 32 pub)."""
+    """Parse base64-encoded Ed25519 private key (64 bytes: 32 seed + 32 pub).
+
+    Cached: the secret never changes within a process, so the base64 decode
+    and key reconstruction happen once instead of on every header refresh.
+    """
     decoded = base64.b64decode(secret)
     if len(decoded) != 64:
         raise ValueError(
@@ -30,7 +43,7 @@ def _parse_ed25519_key(secret: str) -> Ed25519PrivateKey:
 
 def _generate_nonce() -> str:
     """Generate a 16-digit random nonce for the JWT header."""
-    return "".join(random.choices("0123456789", k=16))
+    return f"{int.from_bytes(os.urandom(7), 'big') % 10**16:016d}"
 
 
 def _build_jwt(
@@ -53,8 +66,10 @@ def _build_jwt(
         Signed JWT string.
     """
     now = int(time.time())
-    parsed = urlparse(f"{host}{path}")
-    uri = f"{method} {parsed.netloc}{parsed.path}"
+    # Strip the scheme instead of round-tripping through urlparse; the CDP
+    # uri claim is "<method> <netloc><path>".
+    netloc_and_path = host.split("://", 1)[-1]
+    uri = f"{method} {netloc_and_path}{path}"
 
     header = {
         "alg": "EdDSA",
@@ -88,7 +103,22 @@ def create_cdp_auth_headers(
 
     Returns:
         Dict with 'verify', 'settle', 'supported' keys, each containing auth headers.
+
+    Fresh tokens are only signed once the cached set is older than 60s;
+    within that window the same headers are returned.
     """
+    # Hash the secret for the cache key so it does not sit in key tuples.
+    secret_fingerprint = hashlib.blake2b(
+        key_secret.encode("utf-8"), digest_size=8
+    ).hexdigest()
+    cache_key = (key_id, secret_fingerprint, facilitator_url)
+    with _headers_lock:
+        entry = _headers_cache.get(cache_key)
+        if entry is not None:
+            headers, ts = entry
+            if time.monotonic() - ts <= _HEADERS_TTL_SECONDS:
+                return headers
+
     private_key = _parse_ed25519_key(key_secret)
     host = facilitator_url.rstrip("/")
 
@@ -96,8 +126,17 @@ def create_cdp_auth_headers(
         token = _build_jwt(key_id, private_key, method, host, f"/{endpoint}")
         return {"Authorization": f"Bearer {token}"}
 
-    return {
+    headers = {
         "verify": _headers_for("verify"),
         "settle": _headers_for("settle"),
         "supported": _headers_for("supported", method="GET"),
     }
+    with _headers_lock:
+        _headers_cache[cache_key] = (headers, time.monotonic())
+    return headers
+
+
+def clear_auth_header_cache() -> None:
+    """Clear cached auth header sets (useful for testing)."""
+    with _headers_lock:
+        _headers_cache.clear()
@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 import functools
+import threading
+import time
+from typing import Any, Callable, TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+_F = TypeVar("_F", bound=Callable[..., Any])
 
 
 class RPCError(Exception):
@@ -15,7 +21,67 @@ class RPCError(Exception):
         self.code = code
 
 
-@functools.lru_cache(maxsize=64)
+# Shared session so cache misses reuse pooled connections instead of paying
+# a fresh TCP+TLS handshake per call. Both RPC methods are idempotent reads,
+# so retrying POSTs on transient gateway errors is safe.
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.1,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=None,
+    ),
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+
+def _ttl_cache(maxsize: int, ttl_seconds: float) -> Callable[[_F], _F]:
+    """lru_cache-style decorator with per-entry TTL and LRU eviction.
+
+    Unlike functools.lru_cache, entries expire after ttl_seconds, so cached
+    bytecode and storage values have bounded staleness. Thread-safe so
+    gthread workers can share one cache; exposes cache_clear() to stay
+    drop-in compatible with clear_cache().
+    """
+
+    def decorator(func: _F) -> _F:
+        cache: dict[tuple[Any, ...], tuple[Any, float]] = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args: Any) -> Any:
+            with lock:
+                entry = cache.get(args)
+                if entry is not None:
+                    value, ts = entry
+                    if time.monotonic() - ts <= ttl_seconds:
+                        # Reinsert so hot keys survive eviction.
+                        del cache[args]
+                        cache[args] = entry
+                        return value
+                    del cache[args]
+            value = func(*args)
+            with lock:
+                if len(cache) >= maxsize:
+                    del cache[next(iter(cache))]
+                cache[args] = (value, time.monotonic())
+            return value
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@_ttl_cache(maxsize=1024, ttl_seconds=600)
 def get_code(address: str, rpc_url: str) -> str:
     """Fetch contract bytecode via eth_getCode.
 
@@ -30,7 +96,7 @@ def get_code(address: str, rpc_url: str) -> str:
     }
 
     try:
-        resp = requests.post(rpc_url, json=payload, timeout=10)
+        resp = _session.post(rpc_url, json=payload, timeout=10)
         resp.raise_for_status()
     except (requests.RequestException, ConnectionError) as e:
         raise RPCError(f"RPC request failed: {e}") from e
@@ -54,7 +120,7 @@ def get_code(address: str, rpc_url: str) -> str:
     return result
 
 
-@functools.lru_cache(maxsize=128)
+@_ttl_cache(maxsize=512, ttl_seconds=30)
 def get_storage_at(address: str, slot: str, rpc_url: str) -> str:
     """Fetch storage value via eth_getStorageAt.
 
@@ -69,7 +135,7 @@ def get_storage_at(address: str, slot: str, rpc_url: str) -> str:
     }
 
     try:
-        resp = requests.post(rpc_url, json=payload, timeout=10)
+        resp = _session.post(rpc_url, json=payload, timeout=10)
         resp.raise_for_status()
     except (requests.RequestException, ConnectionError) as e:
         raise RPCError(f"RPC request failed: {e}") from e
@@ -93,7 +159,57 @@ def get_storage_at(address: str, slot: str, rpc_url: str) -> str:
     return result
 
 
+@_ttl_cache(maxsize=512, ttl_seconds=30)
+def get_storage_at_batch(
+    address: str, slots: tuple[str, ...], rpc_url: str
+) -> tuple[str | None, ...]:
+    """Fetch several storage slots in one JSON-RPC batch POST.
+
+    Returns one value per slot, in request order; a slot whose sub-request
+    failed is None. Raises RPCError when the whole batch fails.
+    """
+    payload = [
+        {
+            "jsonrpc": "2.0",
+            "method": "eth_getStorageAt",
+            "params": [address, slot, "latest"],
+            "id": request_id,
+        }
+        for request_id, slot in enumerate(slots, start=1)
+    ]
+
+    try:
+        resp = _session.post(rpc_url, json=payload, timeout=10)
+        resp.raise_for_status()
+    except (requests.RequestException, ConnectionError) as e:
+        raise RPCError(f"RPC request failed: {e}") from e
+
+    try:
+        data = resp.json()
+    except ValueError as e:
+        raise RPCError(f"RPC returned invalid JSON: {e}") from e
+
+    if not isinstance(data, list):
+        # Nodes that reject batch payloads answer with a single error object.
+        err = data.get("error", {}) if isinstance(data, dict) else {}
+        raise RPCError(
+            f"RPC error: {err.get('message', 'batch request rejected')}",
+            code=err.get("code"),
+        )
+
+    by_id = {item.get("id"): item for item in data if isinstance(item, dict)}
+    results: list[str | None] = []
+    for request_id in range(1, len(slots) + 1):
+        item = by_id.get(request_id)
+        if item is None or "error" in item:
+            results.append(None)
+        else:
+            results.append(item.get("result"))
+    return tuple(results)
+
+
 def clear_cache() -> None:
-    """Clear LRU caches (useful for testing)."""
+    """Clear RPC response caches (useful for testing)."""
     get_code.cache_clear()
     get_storage_at.cache_clear()
+    get_storage_at_batch.cache_clear()
@@ -13,6 +13,10 @@ from dotenv import load_dotenv
 CDP_KEY_FILE = Path.home() / ".config" / "risk-api" / "cdp_api_key.json"
 ADDRESS_RE = re.compile(r"^0x[0-9a-fA-F]{40}$")
 
+# load_dotenv scans the filesystem for a .env file; once per process is
+# enough — later load_config calls read straight from os.environ.
+_dotenv_loaded = False
+
 
 class ConfigError(Exception):
     """Raised when required configuration is missing."""
@@ -62,7 +66,10 @@ def load_config() -> Config:
 
     Raises ConfigError if WALLET_ADDRESS is not set.
     """
-    load_dotenv()
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
 
     wallet = os.environ.get("WALLET_ADDRESS", "")
     if not wallet:
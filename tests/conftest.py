@@ -1,13 +1,32 @@
 import base64
 import json
+from functools import lru_cache
 from unittest.mock import patch
 
 import pytest
+import responses
 from flask import Response, request
 
+from risk_api.analytics import json_loads
 from risk_api.app import ANALYZE_REQUEST_METHODS, PROTECTED_ROUTES, create_app
 from risk_api.config import Config
 
+
+def jload(resp):
+    """Parse a test response body with the orjson-backed codec when available."""
+    return json_loads(resp.data)
+
+
+@lru_cache(maxsize=16)
+def decode_payment_required(header: str) -> dict:
+    """Decode a base64 Payment-Required header into its JSON payload.
+
+    Memoized: the fake x402 gate emits identical headers for identical
+    requests, so repeated 402 assertions share one decode. Callers must
+    treat the returned dict as read-only.
+    """
+    return json_loads(base64.b64decode(header))
+
 # Bazaar extension data matching what _setup_x402_middleware registers.
 # Kept here so x402 gate tests don't need the real (slow) SDK imports.
 _EXAMPLE_OUTPUT = {
@@ -149,7 +168,12 @@ def _fake_x402_middleware_setup(app, config: Config) -> bool:
     return True
 
 
-@pytest.fixture()
+# Session-scoped apps shared across tests; _restore_app_state below snapshots
+# and restores their mutable config around every test.
+_session_apps: list = []
+
+
+@pytest.fixture(scope="session")
 def test_config():
     return Config(
         wallet_address="0x13580b9C6A9AfBfE4C739e74136C1dA174dB9891",
@@ -162,15 +186,20 @@ def test_config():
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def app(test_config):
-    """App without x402 middleware — for testing route logic."""
+    """App without x402 middleware — for testing route logic.
+
+    Built once per session; app construction (OpenAPI spec, middleware
+    wiring) dominates fast route tests otherwise.
+    """
     app = create_app(config=test_config, enable_x402=False)
     app.config["TESTING"] = True
+    _session_apps.append(app)
     return app
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def app_with_x402(test_config):
     """App with x402 payment gate — lightweight fake, no SDK imports.
 
@@ -178,13 +207,112 @@ def app_with_x402(test_config):
     Payment-Required headers for protected routes, matching the real
     x402 SDK's response structure including Bazaar extensions.
     """
+    # Both patches only need to cover create_app(); leaving them active for
+    # the whole session would silently swap the validation hook's bytecode
+    # source for every later test.
     with patch(
         "risk_api.app._setup_x402_middleware",
         side_effect=lambda app, config: _fake_x402_middleware_setup(app, config),
     ), patch("risk_api.app.get_code", return_value="0x60006000"):
         app = create_app(config=test_config, enable_x402=True)
-        app.config["TESTING"] = True
-        yield app
+    app.config["TESTING"] = True
+    _session_apps.append(app)
+    return app
+
+
+@pytest.fixture(autouse=True)
+def _restore_app_state():
+    """Undo per-test mutations of the shared session apps.
+
+    Snapshots each live app's config before the test and restores it after,
+    and clears the per-app agent-metadata body cache so config-dependent
+    bodies are rebuilt.
+    """
+    snapshots = [(app, dict(app.config)) for app in _session_apps]
+    yield
+    for app, saved in snapshots:
+        app.config.clear()
+        app.config.update(saved)
+    for app in _session_apps:
+        cache = app.extensions.get("agent_metadata_body_cache")
+        if cache is not None:
+            cache.clear()
+
+
+@pytest.fixture(scope="module")
+def _responses_mock():
+    """One RequestsMock per module: patch requests once, not per test."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        yield rsps
+
+
+@pytest.fixture()
+def mocked_responses(_responses_mock):
+    """Module-shared RequestsMock, reset around each test.
+
+    Starting and stopping a RequestsMock patches and unpatches the requests
+    transport; sharing one started mock per module keeps that cost off every
+    individual RPC test while reset() isolates the registered mocks.
+    """
+    _responses_mock.reset()
+    yield _responses_mock
+    _responses_mock.reset()
+
+
+class _RPCStub:
+    """Canned in-process replacement for the analyzer's RPC surface."""
+
+    _ZERO_WORD = "0x" + "0" * 64
+
+    def __init__(self) -> None:
+        self._default_code = "0x"
+        self._codes: dict[str, str] = {}
+        self._impl_address: str | None = None
+
+    def set_code(self, bytecode: str, address: str | None = None) -> None:
+        """Serve bytecode for every address, or pin it to one address."""
+        if address is None:
+            self._default_code = bytecode
+        else:
+            self._codes[address.lower()] = bytecode
+
+    def set_impl(self, impl_address: str) -> None:
+        """Make the first proxy storage slot resolve to impl_address."""
+        self._impl_address = impl_address
+
+    def _get_code(self, address: str, rpc_url: str) -> str:
+        return self._codes.get(address.lower(), self._default_code)
+
+    def _get_storage_at_batch(
+        self, address: str, slots: tuple[str, ...], rpc_url: str
+    ) -> tuple[str, ...]:
+        if self._impl_address is None:
+            return tuple(self._ZERO_WORD for _ in slots)
+        word = "0x" + "0" * 24 + self._impl_address[2:].lower()
+        return (word,) + tuple(self._ZERO_WORD for _ in slots[1:])
+
+
+@pytest.fixture()
+def stub_rpc(monkeypatch):
+    """Stub the analysis engine's RPC calls in-process, bypassing HTTP.
+
+    Tests that only need "this address has this bytecode" skip the whole
+    requests/urllib3 stack that a responses mock still exercises. The
+    deployer reputation probe is disabled outright, which also skips its
+    connection-error retry backoff.
+    """
+    from risk_api.analysis import engine
+
+    stub = _RPCStub()
+    monkeypatch.setattr(engine, "get_code", stub._get_code)
+    # The pre-paywall validation hook fetches bytecode through its own
+    # imported name; patch it too or stubbed tests hit the live RPC.
+    monkeypatch.setattr("risk_api.app.get_code", stub._get_code)
+    monkeypatch.setattr(engine, "get_storage_at_batch", stub._get_storage_at_batch)
+    monkeypatch.setattr(
+        engine, "detect_deployer_reputation", lambda address, api_key: []
+    )
+    return stub
 
 
 @pytest.fixture()
@@ -194,4 +322,28 @@ def client(app):
 
 @pytest.fixture()
 def client_with_x402(app_with_x402):
-    return app_with_x402.test_client()
+    # The pre-paywall validation hook probes bytecode before the 402 fires;
+    # serve a valid stub for it, scoped to tests using the gated client.
+    with patch("risk_api.app.get_code", return_value="0x60006000"):
+        yield app_with_x402.test_client()
+
+
+@pytest.fixture(scope="session")
+def openapi_spec(app):
+    """Decoded /openapi.json for the default test config, fetched once.
+
+    The spec is deterministic for a fixed config, so content tests share one
+    generation and decode. Treat as read-only; tests exercising PUBLIC_URL
+    overrides keep fetching live.
+    """
+    return jload(app.test_client().get("/openapi.json"))
+
+
+@pytest.fixture(params=["client", "client_with_x402"])
+def any_client(request):
+    """Run a test against both the plain and the x402-gated app.
+
+    Lets one test body cover an endpoint's behavior and its paywall
+    exemption in a single place.
+    """
+    return request.getfixturevalue(request.param)
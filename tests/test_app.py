@@ -1,11 +1,15 @@
 import json
+import re
 from typing import Any, cast
 
 import pytest
 import responses
+from responses.registries import OrderedRegistry
 from flask import Response, request
 from unittest.mock import patch
 
+from tests.conftest import decode_payment_required, jload
+
 from risk_api.api_contract import analysis_result_from_snapshot
 from risk_api.app import (
     APPROVE_ACTION_ANALYSIS_EXAMPLE,
@@ -13,6 +17,7 @@ from risk_api.app import (
     PROXY_EXAMPLE_ADDRESS,
     SAFE_ANALYSIS_EXAMPLE,
     create_app,
+    flush_request_log,
 )
 from risk_api.analysis.engine import clear_analysis_cache
 from risk_api.analysis.policy import derive_policy
@@ -23,13 +28,69 @@ from risk_api.proof_reports import REPORT_PAGES
 
 RPC_URL = "https://mainnet.base.org"
 
+# Frequently used test addresses (0x + repeated byte), precomputed once.
+ADDR_AA = "0x" + "aa" * 20
+ADDR_AB = "0x" + "ab" * 20
+ADDR_CD = "0x" + "cd" * 20
+ADDR_F4 = "0x" + "f4" * 20
+ADDR_12 = "0x" + "12" * 20
+ADDR_34 = "0x" + "34" * 20
+
+# Shared bytecode fixtures + JSON-RPC envelopes; hoisted so tests reference
+# one constant instead of rebuilding identical literals per test.
+SAFE_BYTECODE = "0x" + "6080604052" + "00" * 200
+SELFDESTRUCT_BYTECODE = "0x" + "ff" + "00" * 200
+RPC_OK_SAFE = {"jsonrpc": "2.0", "id": 1, "result": SAFE_BYTECODE}
+RPC_OK_SELFDESTRUCT = {"jsonrpc": "2.0", "id": 1, "result": SELFDESTRUCT_BYTECODE}
+PROXY_BYTECODE = (
+    "0x7f"
+    + "360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc"
+    + "f4"
+    + "00" * 200
+)
+RPC_OK_PROXY = {"jsonrpc": "2.0", "id": 1, "result": PROXY_BYTECODE}
+
+
+def _rpc_code(bytecode: str) -> dict[str, Any]:
+    """JSON-RPC eth_getCode envelope for a one-off bytecode."""
+    return {"jsonrpc": "2.0", "id": 1, "result": bytecode}
+
+ZERO_WORD = "0x" + "0" * 64
+
+
+def _impl_slot_batch(impl_addr_hex: str) -> list[dict[str, Any]]:
+    """JSON-RPC batch response with the first proxy slot holding impl_addr_hex."""
+    return [
+        {"jsonrpc": "2.0", "id": 1, "result": "0x" + "0" * 24 + impl_addr_hex},
+        {"jsonrpc": "2.0", "id": 2, "result": ZERO_WORD},
+        {"jsonrpc": "2.0", "id": 3, "result": ZERO_WORD},
+    ]
 
-def setup_function():
-    clear_cache()
-    clear_analysis_cache()
 
+IMPL_SLOT_BATCH_AB = _impl_slot_batch("ab" * 20)
+IMPL_SLOT_BATCH_CD = _impl_slot_batch("cd" * 20)
 
-def teardown_function():
+ADDR_RE = re.compile(r"^0x[0-9a-f]{40}$")
+
+
+def _assert_valid_address(value: str) -> None:
+    """Assert value is a normalized (lowercase) 0x-prefixed EVM address."""
+    assert ADDR_RE.fullmatch(value), f"not a normalized address: {value}"
+
+
+@pytest.fixture(autouse=True)
+def _cache_reset(request):
+    """Clear RPC/analysis caches only around tests that populate them.
+
+    Pure-route tests (landing page, discovery docs, robots) never touch the
+    caches, so they skip the clears entirely.
+    """
+    if request.node.get_closest_marker("uses_rpc_cache") is None:
+        yield
+        return
+    clear_cache()
+    clear_analysis_cache()
+    yield
     clear_cache()
     clear_analysis_cache()
 
@@ -37,7 +98,7 @@ def teardown_function():
 def test_health_endpoint(client):
     resp = client.get("/health")
     assert resp.status_code == 200
-    assert resp.get_json() == {"status": "ok"}
+    assert jload(resp) == {"status": "ok"}
 
 
 def test_non_canonical_host_redirects_to_public_url(test_config):
@@ -56,7 +117,7 @@ def test_non_canonical_host_redirects_to_public_url(test_config):
 def test_non_canonical_host_redirect_preserves_query_string(test_config):
     app = create_app(config=test_config, enable_x402=False)
     app.config["PUBLIC_URL"] = "https://augurrisk.com"
-    addr = "0x" + "ab" * 20
+    addr = ADDR_AB
 
     resp = app.test_client().get(
         f"/analyze?address={addr}",
@@ -98,26 +159,233 @@ def test_health_skips_canonical_host_redirect(test_config):
 def test_x402_verification_endpoint(client):
     resp = client.get("/.well-known/x402-verification.json")
     assert resp.status_code == 200
-    assert resp.get_json() == {"x402": "dccd5db92bc9"}
+    assert jload(resp) == {"x402": "dccd5db92bc9"}
+
+
+def _is_html(resp):
+    return resp.content_type.startswith("text/html")
 
 
-def test_x402_verification_not_behind_paywall(client_with_x402):
-    resp = client_with_x402.get("/.well-known/x402-verification.json")
+@pytest.mark.parametrize(
+    ("path", "check"),
+    [
+        (
+            "/.well-known/x402-verification.json",
+            lambda r: jload(r)["x402"] == "dccd5db92bc9",
+        ),
+        ("/agent-metadata.json", lambda r: jload(r)["x402Support"] is True),
+        (
+            "/.well-known/ai-plugin.json",
+            lambda r: jload(r)["schema_version"] == "v1",
+        ),
+        ("/.well-known/agent.json", lambda r: jload(r)["name"] == "Augur"),
+        ("/.well-known/agent-card.json", lambda r: jload(r)["name"] == "Augur"),
+        ("/.well-known/x402", lambda r: jload(r)["version"] == 1),
+        ("/", _is_html),
+        ("/how-payment-works", _is_html),
+        ("/mcp", _is_html),
+        ("/reports/base-bluechip-bytecode-snapshot", _is_html),
+        ("/reports/base-weth-before-after", _is_html),
+        ("/honeypot-detection-api", _is_html),
+        ("/proxy-risk-api", _is_html),
+        ("/deployer-reputation-api", _is_html),
+        ("/.well-known/api-catalog", lambda r: "linkset" in jload(r)),
+        ("/llms.txt", lambda r: b"# Augur" in r.data),
+        ("/llms-full.txt", lambda r: b"# Augur" in r.data),
+        ("/skill.md", lambda r: b"name: augur" in r.data),
+    ],
+    ids=lambda val: val if isinstance(val, str) else "",
+)
+def test_discovery_endpoints_not_behind_paywall(client_with_x402, path, check):
+    """Every discovery endpoint must stay exempt from the x402 payment gate."""
+    resp = client_with_x402.get(path)
     assert resp.status_code == 200
-    assert resp.get_json()["x402"] == "dccd5db92bc9"
+    assert check(resp)
+
+
+@pytest.fixture()
+def public_url_client(app):
+    """Client for the shared app with PUBLIC_URL set to the canonical origin.
+
+    The autouse _restore_app_state fixture in conftest restores the config
+    mutation after each test.
+    """
+    app.config["PUBLIC_URL"] = "https://augurrisk.com"
+    return app.test_client()
+
+
+def _contains_all(*needles):
+    def check(resp):
+        text = resp.data.decode()
+        return all(needle in text for needle in needles)
+
+    return check
+
+
+def _agent_card_public_url_check(resp):
+    data = jload(resp)
+    return (
+        data["url"] == "https://augurrisk.com"
+        and data["interfaces"][0]["baseUrl"] == "https://augurrisk.com"
+    )
+
+
+def _wellknown_x402_public_url_check(resp):
+    data = jload(resp)
+    return (
+        data["resources"][0] == "https://augurrisk.com/analyze"
+        and "augurrisk.com" in data["instructions"]
+    )
+
+
+def _api_catalog_public_url_check(resp):
+    linkset = jload(resp)["linkset"][0]
+    return (
+        linkset["anchor"] == "https://augurrisk.com/.well-known/api-catalog"
+        and linkset["service-desc"][0]["href"] == "https://augurrisk.com/openapi.json"
+    )
+
+
+@pytest.mark.parametrize(
+    ("path", "check"),
+    [
+        (
+            "/agent-metadata.json",
+            lambda r: jload(r)["services"][0]["endpoint"]
+            == "https://augurrisk.com/",
+        ),
+        (
+            "/openapi.json",
+            lambda r: jload(r)["servers"][0]["url"] == "https://augurrisk.com",
+        ),
+        (
+            "/.well-known/ai-plugin.json",
+            lambda r: jload(r)["api"]["url"]
+            == "https://augurrisk.com/openapi.json",
+        ),
+        ("/.well-known/agent.json", _agent_card_public_url_check),
+        (
+            "/.well-known/agent-card.json",
+            lambda r: jload(r)["url"] == "https://augurrisk.com",
+        ),
+        ("/.well-known/x402", _wellknown_x402_public_url_check),
+        (
+            "/",
+            _contains_all(
+                "https://augurrisk.com/skill.md",
+                "https://augurrisk.com/openapi.json",
+                "https://augurrisk.com/how-payment-works",
+                "https://augurrisk.com/honeypot-detection-api",
+                "https://augurrisk.com/reports/base-bluechip-bytecode-snapshot",
+                "https://augurrisk.com/avatar.png",
+            ),
+        ),
+        (
+            "/how-payment-works",
+            _contains_all(
+                "https://augurrisk.com/.well-known/x402",
+                "https://augurrisk.com/openapi.json",
+                "https://github.com/JleviEderer/risk-api",
+            ),
+        ),
+        (
+            "/mcp",
+            _contains_all(
+                "https://augurrisk.com/how-payment-works",
+                "https://augurrisk.com/openapi.json",
+                "https://augurrisk.com/.well-known/x402",
+            ),
+        ),
+        (
+            "/reports/base-bluechip-bytecode-snapshot",
+            _contains_all(
+                "https://augurrisk.com/",
+                "https://augurrisk.com/how-payment-works",
+                "https://augurrisk.com/openapi.json",
+            ),
+        ),
+        (
+            "/reports/base-weth-before-after",
+            _contains_all(
+                "https://augurrisk.com/",
+                "https://augurrisk.com/how-payment-works",
+                "https://augurrisk.com/openapi.json",
+            ),
+        ),
+        (
+            "/honeypot-detection-api",
+            _contains_all(
+                "https://augurrisk.com/",
+                "https://augurrisk.com/how-payment-works",
+                "https://augurrisk.com/openapi.json",
+            ),
+        ),
+        (
+            "/proxy-risk-api",
+            _contains_all(
+                "https://augurrisk.com/",
+                "https://augurrisk.com/how-payment-works",
+                "https://augurrisk.com/openapi.json",
+            ),
+        ),
+        (
+            "/deployer-reputation-api",
+            _contains_all(
+                "https://augurrisk.com/",
+                "https://augurrisk.com/how-payment-works",
+                "https://augurrisk.com/openapi.json",
+            ),
+        ),
+        ("/robots.txt", _contains_all("https://augurrisk.com/sitemap.xml")),
+        ("/sitemap.xml", _contains_all("https://augurrisk.com/")),
+        ("/.well-known/api-catalog", _api_catalog_public_url_check),
+        (
+            "/llms.txt",
+            _contains_all(
+                "https://augurrisk.com/skill.md",
+                "https://augurrisk.com/analyze",
+                "https://augurrisk.com/mcp",
+                "https://augurrisk.com/openapi.json",
+            ),
+        ),
+        (
+            "/llms-full.txt",
+            _contains_all(
+                "https://augurrisk.com/skill.md",
+                "https://augurrisk.com/mcp",
+                "https://augurrisk.com/analyze",
+            ),
+        ),
+        (
+            "/skill.md",
+            _contains_all(
+                "homepage: https://augurrisk.com",
+                "https://augurrisk.com/analyze",
+                "https://augurrisk.com/openapi.json",
+                "https://augurrisk.com/mcp",
+            ),
+        ),
+    ],
+    ids=lambda val: val if isinstance(val, str) else "",
+)
+def test_discovery_endpoints_use_public_url(public_url_client, path, check):
+    """Every discovery endpoint must build its links from PUBLIC_URL when set."""
+    resp = public_url_client.get(path)
+    assert resp.status_code == 200
+    assert check(resp)
 
 
 def test_missing_address(client):
     resp = client.get("/analyze")
     assert resp.status_code == 422
-    data = resp.get_json()
+    data = jload(resp)
     assert "Missing" in data["error"]
 
 
 def test_invalid_address_too_short(client):
     resp = client.get("/analyze?address=0x1234")
     assert resp.status_code == 422
-    data = resp.get_json()
+    data = jload(resp)
     assert "Invalid" in data["error"]
 
 
@@ -131,18 +399,24 @@ def test_invalid_address_bad_chars(client):
     assert resp.status_code == 422
 
 
-@responses.activate
-def test_analyze_success(client):
-    bytecode = "0x" + "6080604052" + "00" * 200
-    responses.post(
-        RPC_URL,
-        json={"jsonrpc": "2.0", "id": 1, "result": bytecode},
-    )
-    addr = "0x" + "ab" * 20
-    resp = client.get(f"/analyze?address={addr}")
-    assert resp.status_code == 200
-    data = resp.get_json()
-    assert data["address"] == addr
+@pytest.mark.uses_rpc_cache
+@pytest.mark.parametrize(
+    ("method", "kwargs"),
+    [
+        ("get", {"query_string": {"address": ADDR_AB}}),
+        ("post", {"json": {"address": ADDR_AB}}),
+        ("post", {"query_string": {"address": ADDR_AB}}),
+    ],
+    ids=["get-query", "post-json-body", "post-query"],
+)
+def test_analyze_happy_path(client, method, kwargs, mocked_responses):
+    """Every analyze transport returns the same full, non-proxy result shape."""
+    mocked_responses.post(RPC_URL, json=RPC_OK_SAFE)
+    resp = getattr(client, method)("/analyze", **kwargs)
+    assert resp.status_code == 200
+    data = jload(resp)
+    assert data["address"] == ADDR_AB
+    _assert_valid_address(data["address"])
     assert data["score"] == 0
     assert data["level"] == "safe"
     assert data["decision"] == "allow"
@@ -151,24 +425,25 @@ def test_analyze_success(client):
     assert data["recommended_policy"]["reason_codes"] == []
     assert isinstance(data["findings"], list)
     assert isinstance(data["category_scores"], dict)
+    assert "implementation" not in data
 
 
-@responses.activate
-def test_analyze_no_bytecode_returns_422(client):
-    responses.post(
+@pytest.mark.uses_rpc_cache
+def test_analyze_no_bytecode_returns_422(client, mocked_responses):
+    mocked_responses.post(
         RPC_URL,
-        json={"jsonrpc": "2.0", "id": 1, "result": "0x"},
+        json=_rpc_code("0x"),
     )
-    addr = "0x" + "aa" * 20
+    addr = ADDR_AA
     resp = client.get(f"/analyze?address={addr}")
     assert resp.status_code == 422
-    data = resp.get_json()
+    data = jload(resp)
     assert data["error"] == f"No contract bytecode found at Base address: {addr}"
 
 
-@responses.activate
-def test_analyze_rpc_error(client):
-    responses.post(
+@pytest.mark.uses_rpc_cache
+def test_analyze_rpc_error(client, mocked_responses):
+    mocked_responses.post(
         RPC_URL,
         json={
             "jsonrpc": "2.0",
@@ -176,25 +451,21 @@ def test_analyze_rpc_error(client):
             "error": {"code": -32000, "message": "server busy"},
         },
     )
-    addr = "0x" + "cd" * 20
+    addr = ADDR_CD
     resp = client.get(f"/analyze?address={addr}")
     assert resp.status_code == 502
-    data = resp.get_json()
+    data = jload(resp)
     assert "RPC error" in data["error"]
 
 
-@responses.activate
-def test_analyze_with_findings(client):
+@pytest.mark.uses_rpc_cache
+def test_analyze_with_findings(client, mocked_responses):
     # Bytecode with SELFDESTRUCT
-    bytecode = "0x" + "ff" + "00" * 200
-    responses.post(
-        RPC_URL,
-        json={"jsonrpc": "2.0", "id": 1, "result": bytecode},
-    )
+    mocked_responses.post(RPC_URL, json=RPC_OK_SELFDESTRUCT)
     addr = "0x" + "ef" * 20
     resp = client.get(f"/analyze?address={addr}")
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["score"] >= 30
     assert data["decision"] in {"warn", "manual_review", "block"}
     assert len(data["findings"]) > 0
@@ -205,7 +476,7 @@ def test_analyze_missing_address_returns_422_without_payment(client_with_x402):
     """Missing address returns 422 before x402 payment processing."""
     resp = client_with_x402.get("/analyze")
     assert resp.status_code == 422
-    data = resp.get_json()
+    data = jload(resp)
     assert "Missing" in data["error"]
 
 
@@ -213,17 +484,17 @@ def test_analyze_invalid_address_returns_422_without_payment(client_with_x402):
     """Invalid address returns 422 before x402 payment processing."""
     resp = client_with_x402.get("/analyze?address=0x1234")
     assert resp.status_code == 422
-    data = resp.get_json()
+    data = jload(resp)
     assert "Invalid" in data["error"]
 
 
 def test_analyze_no_bytecode_returns_422_without_payment(client_with_x402):
     """No-bytecode address returns 422 before x402 payment processing."""
-    addr = "0x" + "aa" * 20
+    addr = ADDR_AA
     with patch("risk_api.app.get_code", return_value="0x"):
         resp = client_with_x402.get(f"/analyze?address={addr}")
     assert resp.status_code == 422
-    data = resp.get_json()
+    data = jload(resp)
     assert data["error"] == f"No contract bytecode found at Base address: {addr}"
 
 
@@ -235,7 +506,7 @@ def test_analyze_head_without_address_returns_422(client_with_x402):
 
 def test_analyze_head_with_address_returns_402(client_with_x402):
     """HEAD /analyze with valid address returns 402 (payment required)."""
-    addr = "0x" + "ab" * 20
+    addr = ADDR_AB
     resp = client_with_x402.head(f"/analyze?address={addr}")
     assert resp.status_code == 402
 
@@ -272,23 +543,21 @@ def test_analyze_unsupported_methods_stay_405_with_x402(client_with_x402, method
 
 def test_x402_returns_402_without_payment(client_with_x402):
     """With x402 middleware enabled, /analyze should return 402 without payment."""
-    addr = "0x" + "ab" * 20
+    addr = ADDR_AB
     resp = client_with_x402.get(f"/analyze?address={addr}")
     assert resp.status_code == 402
 
 
 def test_x402_402_response_has_bazaar_extension(client_with_x402):
     """402 response Payment-Required header should include bazaar discovery extension."""
-    import base64
-
-    addr = "0x" + "ab" * 20
+    addr = ADDR_AB
     resp = client_with_x402.get(f"/analyze?address={addr}")
     assert resp.status_code == 402
 
     # Payment-Required header is base64-encoded JSON
     pr_header = resp.headers.get("Payment-Required")
     assert pr_header is not None, "Missing Payment-Required header"
-    pr_data = json.loads(base64.b64decode(pr_header))
+    pr_data = decode_payment_required(pr_header)
 
     # Must have extensions.bazaar with input schema
     assert "extensions" in pr_data, f"No extensions in 402 response: {list(pr_data.keys())}"
@@ -324,15 +593,13 @@ def test_x402_402_response_has_bazaar_extension(client_with_x402):
 
 def test_x402_402_post_has_bazaar_body_extension(client_with_x402):
     """POST 402 response should include bazaar body discovery extension."""
-    import base64
-
-    addr = "0x" + "ab" * 20
+    addr = ADDR_AB
     resp = client_with_x402.post("/analyze", json={"address": addr})
     assert resp.status_code == 402
 
     pr_header = resp.headers.get("Payment-Required")
     assert pr_header is not None
-    pr_data = json.loads(base64.b64decode(pr_header))
+    pr_data = decode_payment_required(pr_header)
 
     bazaar = pr_data.get("extensions", {}).get("bazaar")
     assert bazaar is not None, "No bazaar extension in POST 402 response"
@@ -356,22 +623,21 @@ def test_x402_health_not_gated(client_with_x402):
     """/health should NOT be behind the payment gate."""
     resp = client_with_x402.get("/health")
     assert resp.status_code == 200
-    assert resp.get_json() == {"status": "ok"}
+    assert jload(resp) == {"status": "ok"}
 
 
 def test_agent_metadata_endpoint(client):
     resp = client.get("/agent-metadata.json")
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["type"] == "https://eips.ethereum.org/EIPS/eip-8004#registration-v1"
     assert data["name"] == "Augur"
     assert "Deterministic Base contract admission control for agents on Base" in data["description"]
     assert "not a guarantee or audit" in data["description"]
     assert data["x402Support"] is True
     assert data["active"] is True
-    assert len(data["services"]) == 4
-    service_names = [s["name"] for s in data["services"]]
-    assert service_names == ["web", "A2A", "OASF", "agentWallet"]
+    # Order is part of the contract: registries render services as listed.
+    assert [s["name"] for s in data["services"]] == ["web", "A2A", "OASF", "agentWallet"]
     assert "registrations" not in data
     # New discovery fields
     assert "/avatar.png" in data["image"]
@@ -383,22 +649,15 @@ def test_agent_metadata_endpoint(client):
         "network": "eip155:8453",
     }
     assert "/openapi.json" in data["openapi_url"]
-    assert isinstance(data["capabilities"], list)
-    assert "contract admission control" in data["capabilities"]
-    assert "proxy detection" in data["capabilities"]
-
-
-def test_agent_metadata_uses_public_url(app):
-    app.config["PUBLIC_URL"] = "https://augurrisk.com"
-    with app.test_client() as c:
-        resp = c.get("/agent-metadata.json")
-        data = resp.get_json()
-        assert data["services"][0]["endpoint"] == "https://augurrisk.com/"
+    capabilities = data["capabilities"]
+    assert isinstance(capabilities, list)
+    assert "contract admission control" in capabilities
+    assert "proxy detection" in capabilities
 
 
 def test_agent_metadata_falls_back_to_request_url(client):
     resp = client.get("/agent-metadata.json")
-    data = resp.get_json()
+    data = jload(resp)
     endpoint = data["services"][0]["endpoint"]
     assert "localhost" in endpoint or "127.0.0.1" in endpoint
 
@@ -407,52 +666,52 @@ def test_agent_metadata_with_agent_id(app):
     app.config["ERC8004_AGENT_ID"] = 12345
     with app.test_client() as c:
         resp = c.get("/agent-metadata.json")
-        data = resp.get_json()
+        data = jload(resp)
         assert "registrations" in data
         assert data["registrations"][0]["agentId"] == 12345
 
 
-def test_agent_metadata_not_behind_paywall(client_with_x402):
-    resp = client_with_x402.get("/agent-metadata.json")
-    assert resp.status_code == 200
-    assert resp.get_json()["x402Support"] is True
-
-
 def test_agent_card_includes_skill_doc_and_icon(client):
     resp = client.get("/.well-known/agent-card.json")
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["documentationUrl"].endswith("/skill.md")
     assert data["iconUrl"].endswith("/avatar.png")
 
 
-@responses.activate
+@pytest.mark.uses_rpc_cache
+@responses.activate(registry=OrderedRegistry)
 def test_analyze_proxy_response_includes_implementation(client):
-    """API response includes implementation object for proxy contracts."""
-    eip1967 = "360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc"
-    proxy_bytecode = "0x7f" + eip1967 + "f4" + "00" * 200
-
-    impl_addr_hex = "ab" * 20
-    impl_addr_padded = "0x" + "0" * 24 + impl_addr_hex
-    impl_bytecode = "0x" + "ff" + "00" * 200  # SELFDESTRUCT
+    """API response includes implementation object for proxy contracts.
 
+    The mocks are strictly sequential (proxy code, deployer reputation
+    probe, storage batch, implementation code), so the ordered registry
+    serves them in order without URL matching and fails loudly if the call
+    sequence ever changes.
+    """
     # get_code for proxy
-    responses.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": proxy_bytecode})
+    responses.post(RPC_URL, json=RPC_OK_PROXY)
+    # deployer reputation probe (soft error -> detector degrades, no retry)
+    responses.get(
+        "https://base.blockscout.com/api",
+        json={"status": "0", "message": "NOTOK", "result": "Error"},
+    )
     # storage slot returns impl address
-    responses.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": impl_addr_padded})
+    responses.post(RPC_URL, json=IMPL_SLOT_BATCH_AB)
     # get_code for implementation
-    responses.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": impl_bytecode})
+    responses.post(RPC_URL, json=RPC_OK_SELFDESTRUCT)
 
     addr = "0x" + "ee" * 20
     resp = client.get(f"/analyze?address={addr}")
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
 
     assert "implementation" in data
     assert "decision" in data
     assert "recommended_policy" in data
     impl = data["implementation"]
-    assert impl["address"] == "0x" + impl_addr_hex
+    assert impl["address"] == ADDR_AB
+    _assert_valid_address(impl["address"])
     assert impl["bytecode_size"] > 0
     assert isinstance(impl["findings"], list)
     assert isinstance(impl["category_scores"], dict)
@@ -462,79 +721,64 @@ def test_analyze_proxy_response_includes_implementation(client):
     )
 
 
-@responses.activate
-def test_analyze_non_proxy_no_implementation_key(client):
-    """Non-proxy contracts should NOT have implementation key."""
-    bytecode = "0x" + "6080604052" + "00" * 200
-    responses.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": bytecode})
-
-    addr = "0x" + "dd" * 20
-    resp = client.get(f"/analyze?address={addr}")
-    assert resp.status_code == 200
-    data = resp.get_json()
-
-    assert "implementation" not in data
-    assert data["decision"] == "allow"
-
-
-@responses.activate
-def test_analyze_raw_delegatecall_response_requires_manual_review(client):
+@pytest.mark.uses_rpc_cache
+def test_analyze_raw_delegatecall_response_requires_manual_review(client, stub_rpc):
     bytecode = "0x" + "f4" + "00" * 200
-    responses.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": bytecode})
+    stub_rpc.set_code(bytecode)
 
     addr = "0x" + "de" * 20
     resp = client.get(f"/analyze?address={addr}")
 
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["score"] == 15
     assert data["level"] == "safe"
     assert data["decision"] == "manual_review"
     assert "raw_delegatecall_surface" in data["recommended_policy"]["reason_codes"]
 
 
-@responses.activate
-def test_analyze_hidden_mint_response_requires_manual_review(client):
+@pytest.mark.uses_rpc_cache
+def test_analyze_hidden_mint_response_requires_manual_review(client, stub_rpc):
     bytecode = "0x63a0712d68" + "00" * 200
-    responses.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": bytecode})
+    stub_rpc.set_code(bytecode)
 
     addr = "0x" + "ba" * 20
     resp = client.get(f"/analyze?address={addr}")
 
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["score"] == 25
     assert data["level"] == "low"
     assert data["decision"] == "manual_review"
     assert "hidden_mint_signal" in data["recommended_policy"]["reason_codes"]
 
 
-@responses.activate
-def test_analyze_fee_manipulation_response_warns_even_when_score_is_safe(client):
+@pytest.mark.uses_rpc_cache
+def test_analyze_fee_manipulation_response_warns_even_when_score_is_safe(client, stub_rpc):
     bytecode = "0x6369fe0e2d" + "00" * 200
-    responses.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": bytecode})
+    stub_rpc.set_code(bytecode)
 
     addr = "0x" + "f1" * 20
     resp = client.get(f"/analyze?address={addr}")
 
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["score"] == 15
     assert data["level"] == "safe"
     assert data["decision"] == "warn"
     assert "fee_manipulation_signal" in data["recommended_policy"]["reason_codes"]
 
 
-@responses.activate
-def test_analyze_limit_alias_response_warns_without_double_count(client):
+@pytest.mark.uses_rpc_cache
+def test_analyze_limit_alias_response_warns_without_double_count(client, stub_rpc):
     bytecode = "0x63f34eb0b8635c85974f6374010ece63e99c9d0963f1d5f517" + "00" * 200
-    responses.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": bytecode})
+    stub_rpc.set_code(bytecode)
 
-    addr = "0x" + "f4" * 20
+    addr = ADDR_F4
     resp = client.get(f"/analyze?address={addr}")
 
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["score"] == 15
     assert data["level"] == "safe"
     assert data["decision"] == "warn"
@@ -543,80 +787,80 @@ def test_analyze_limit_alias_response_warns_without_double_count(client):
     assert "fee_manipulation_signal" in data["recommended_policy"]["reason_codes"]
 
 
-@responses.activate
-def test_analyze_pause_selector_response_warns_even_when_score_is_safe(client):
+@pytest.mark.uses_rpc_cache
+def test_analyze_pause_selector_response_warns_even_when_score_is_safe(client, stub_rpc):
     bytecode = "0x638456cb59" + "00" * 200
-    responses.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": bytecode})
+    stub_rpc.set_code(bytecode)
 
     addr = "0x" + "f2" * 20
     resp = client.get(f"/analyze?address={addr}")
 
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["score"] == 5
     assert data["level"] == "safe"
     assert data["decision"] == "warn"
     assert "suspicious_selector_signal" in data["recommended_policy"]["reason_codes"]
 
 
-@responses.activate
-def test_analyze_trading_toggle_response_warns_even_when_score_is_safe(client):
+@pytest.mark.uses_rpc_cache
+def test_analyze_trading_toggle_response_warns_even_when_score_is_safe(client, stub_rpc):
     bytecode = "0x63c2e5ec04638a8c523c" + "00" * 200
-    responses.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": bytecode})
+    stub_rpc.set_code(bytecode)
 
     addr = "0x" + "f5" * 20
     resp = client.get(f"/analyze?address={addr}")
 
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["score"] == 10
     assert data["level"] == "safe"
     assert data["decision"] == "warn"
     assert "suspicious_selector_signal" in data["recommended_policy"]["reason_codes"]
 
 
-@responses.activate
-def test_analyze_fee_bypass_alias_response_warns_even_when_score_is_safe(client):
+@pytest.mark.uses_rpc_cache
+def test_analyze_fee_bypass_alias_response_warns_even_when_score_is_safe(client, stub_rpc):
     bytecode = "0x63c024666863f3d7a2f8" + "00" * 200
-    responses.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": bytecode})
+    stub_rpc.set_code(bytecode)
 
     addr = "0x" + "f6" * 20
     resp = client.get(f"/analyze?address={addr}")
 
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["score"] == 10
     assert data["level"] == "safe"
     assert data["decision"] == "warn"
     assert "suspicious_selector_signal" in data["recommended_policy"]["reason_codes"]
 
 
-@responses.activate
-def test_analyze_whitelist_and_cooldown_toggle_response_warns_even_when_score_is_safe(client):
+@pytest.mark.uses_rpc_cache
+def test_analyze_whitelist_and_cooldown_toggle_response_warns_even_when_score_is_safe(client, stub_rpc):
     bytecode = "0x63052d9e7e636353623d639a9cf8db" + "00" * 200
-    responses.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": bytecode})
+    stub_rpc.set_code(bytecode)
 
     addr = "0x" + "f7" * 20
     resp = client.get(f"/analyze?address={addr}")
 
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["score"] == 15
     assert data["level"] == "safe"
     assert data["decision"] == "warn"
     assert "suspicious_selector_signal" in data["recommended_policy"]["reason_codes"]
 
 
-@responses.activate
-def test_analyze_blacklist_selector_without_transfer_warns(client):
+@pytest.mark.uses_rpc_cache
+def test_analyze_blacklist_selector_without_transfer_warns(client, stub_rpc):
     bytecode = "0x6344337ea1" + "00" * 200
-    responses.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": bytecode})
+    stub_rpc.set_code(bytecode)
 
     addr = "0x" + "f3" * 20
     resp = client.get(f"/analyze?address={addr}")
 
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["score"] == 5
     assert data["level"] == "safe"
     assert data["decision"] == "warn"
@@ -624,22 +868,17 @@ def test_analyze_blacklist_selector_without_transfer_warns(client):
     assert "suspicious_selector_signal" in data["recommended_policy"]["reason_codes"]
 
 
-@responses.activate
-def test_analyze_proxy_no_code_response_requires_manual_review(client):
-    eip1967 = "360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc"
-    proxy_bytecode = "0x7f" + eip1967 + "f4" + "00" * 200
-    impl_addr_hex = "cd" * 20
-    impl_addr_padded = "0x" + "0" * 24 + impl_addr_hex
-
-    responses.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": proxy_bytecode})
-    responses.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": impl_addr_padded})
-    responses.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": "0x"})
+@pytest.mark.uses_rpc_cache
+def test_analyze_proxy_no_code_response_requires_manual_review(client, mocked_responses):
+    mocked_responses.post(RPC_URL, json=RPC_OK_PROXY)
+    mocked_responses.post(RPC_URL, json=IMPL_SLOT_BATCH_CD)
+    mocked_responses.post(RPC_URL, json=_rpc_code("0x"))
 
     addr = "0x" + "c4" * 20
     resp = client.get(f"/analyze?address={addr}")
 
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["score"] == 40
     assert data["level"] == "medium"
     assert data["decision"] == "manual_review"
@@ -650,58 +889,21 @@ def test_analyze_proxy_no_code_response_requires_manual_review(client):
     )
 
 
-@responses.activate
-def test_analyze_post_with_json_body(client):
-    """POST /analyze with address in JSON body should work."""
-    bytecode = "0x" + "6080604052" + "00" * 200
-    responses.post(
-        RPC_URL,
-        json={"jsonrpc": "2.0", "id": 1, "result": bytecode},
-    )
-    addr = "0x" + "ab" * 20
-    resp = client.post("/analyze", json={"address": addr})
-    assert resp.status_code == 200
-    data = resp.get_json()
-    assert data["address"] == addr
-    assert data["score"] == 0
-    assert data["decision"] == "allow"
-
-
-@responses.activate
-def test_analyze_post_with_query_param(client):
-    """POST /analyze with address in query param should also work."""
-    bytecode = "0x" + "6080604052" + "00" * 200
-    responses.post(
-        RPC_URL,
-        json={"jsonrpc": "2.0", "id": 1, "result": bytecode},
-    )
-    addr = "0x" + "ab" * 20
-    resp = client.post(f"/analyze?address={addr}")
-    assert resp.status_code == 200
-    data = resp.get_json()
-    assert data["address"] == addr
-    assert data["decision"] == "allow"
-
-
-@responses.activate
-def test_analyze_post_with_matching_query_and_json_body(client):
+@pytest.mark.uses_rpc_cache
+def test_analyze_post_with_matching_query_and_json_body(client, mocked_responses):
     """POST /analyze should accept matching query and JSON addresses."""
-    bytecode = "0x" + "6080604052" + "00" * 200
-    responses.post(
-        RPC_URL,
-        json={"jsonrpc": "2.0", "id": 1, "result": bytecode},
-    )
-    addr = "0x" + "ab" * 20
+    mocked_responses.post(RPC_URL, json=RPC_OK_SAFE)
+    addr = ADDR_AB
     resp = client.post(f"/analyze?address={addr}", json={"address": addr})
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["address"] == addr
     assert data["decision"] == "allow"
 
 
 def test_analyze_post_rejects_conflicting_query_and_json_addresses(client):
-    query_addr = "0x" + "ab" * 20
-    body_addr = "0x" + "cd" * 20
+    query_addr = ADDR_AB
+    body_addr = ADDR_CD
 
     resp = client.post(
         f"/analyze?address={query_addr}",
@@ -709,7 +911,7 @@ def test_analyze_post_rejects_conflicting_query_and_json_addresses(client):
     )
 
     assert resp.status_code == 422
-    data = resp.get_json()
+    data = jload(resp)
     assert data["error"] == "Conflicting 'address' values in query parameter and JSON body"
 
 
@@ -721,7 +923,7 @@ def test_analyze_post_rejects_malformed_json_body(client):
     )
 
     assert resp.status_code == 422
-    data = resp.get_json()
+    data = jload(resp)
     assert data["error"] == "Malformed JSON body"
 
 
@@ -733,26 +935,33 @@ def test_analyze_post_rejects_non_object_json_body(client):
     )
 
     assert resp.status_code == 422
-    data = resp.get_json()
+    data = jload(resp)
     assert data["error"] == "JSON body must be an object containing 'address'"
 
 
-@responses.activate
-def test_analyze_get_with_approve_action_returns_action_evaluation(client):
-    bytecode = "0x" + "6080604052" + "00" * 200
-    responses.post(
-        RPC_URL,
-        json={"jsonrpc": "2.0", "id": 1, "result": bytecode},
+def test_analyze_post_rejects_oversized_body_with_413(client):
+    oversized = '{"address": "' + "a" * 8192 + '"}'
+    resp = client.post(
+        "/analyze",
+        data=oversized,
+        content_type="application/json",
     )
 
-    addr = "0x" + "ab" * 20
-    spender = "0x" + "12" * 20
+    assert resp.status_code == 413
+
+
+@pytest.mark.uses_rpc_cache
+def test_analyze_get_with_approve_action_returns_action_evaluation(client, mocked_responses):
+    mocked_responses.post(RPC_URL, json=RPC_OK_SAFE)
+
+    addr = ADDR_AB
+    spender = ADDR_12
     resp = client.get(
         f"/analyze?address={addr}&action=approve&spender={spender}&chain=base"
     )
 
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["decision"] == "warn"
     assert data["contract_decision"] == "allow"
     assert data["recommended_policy"]["action"] == "warn"
@@ -768,20 +977,17 @@ def test_analyze_get_with_approve_action_returns_action_evaluation(client):
     ]["reason_codes"]
 
 
-@responses.activate
-def test_analyze_warn_contract_with_approve_action_escalates_to_manual_review(client):
+@pytest.mark.uses_rpc_cache
+def test_analyze_warn_contract_with_approve_action_escalates_to_manual_review(client, stub_rpc):
     bytecode = "0x63f34eb0b8" + "00" * 200
-    responses.post(
-        RPC_URL,
-        json={"jsonrpc": "2.0", "id": 1, "result": bytecode},
-    )
+    stub_rpc.set_code(bytecode)
 
-    addr = "0x" + "f4" * 20
-    spender = "0x" + "34" * 20
+    addr = ADDR_F4
+    spender = ADDR_34
     resp = client.get(f"/analyze?address={addr}&action=approve&spender={spender}")
 
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["decision"] == "manual_review"
     assert data["contract_decision"] == "warn"
     assert data["recommended_policy"]["action"] == "manual_review"
@@ -795,8 +1001,8 @@ def test_analyze_warn_contract_with_approve_action_escalates_to_manual_review(cl
 
 
 def test_analyze_allowlisted_approve_action_can_preserve_allow(test_config):
-    addr = "0x" + "ab" * 20
-    spender = "0x" + "12" * 20
+    addr = ADDR_AB
+    spender = ADDR_12
     app = create_app(
         config=Config(
             wallet_address=test_config.wallet_address,
@@ -840,7 +1046,7 @@ def test_analyze_allowlisted_approve_action_can_preserve_allow(test_config):
         resp = client.get(f"/analyze?address={addr}&action=approve&spender={spender}")
 
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["decision"] == "allow"
     assert data["contract_decision"] == "allow"
     assert data["recommended_policy"]["action"] == "allow"
@@ -852,9 +1058,9 @@ def test_analyze_allowlisted_approve_action_can_preserve_allow(test_config):
 
 
 def test_analyze_non_allowlisted_approve_action_escalates_to_manual_review(test_config):
-    addr = "0x" + "ab" * 20
-    trusted_spender = "0x" + "12" * 20
-    request_spender = "0x" + "34" * 20
+    addr = ADDR_AB
+    trusted_spender = ADDR_12
+    request_spender = ADDR_34
     app = create_app(
         config=Config(
             wallet_address=test_config.wallet_address,
@@ -900,7 +1106,7 @@ def test_analyze_non_allowlisted_approve_action_escalates_to_manual_review(test_
         )
 
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["decision"] == "manual_review"
     assert data["contract_decision"] == "allow"
     assert data["recommended_policy"]["action"] == "manual_review"
@@ -911,8 +1117,8 @@ def test_analyze_non_allowlisted_approve_action_escalates_to_manual_review(test_
 
 
 def test_analyze_post_with_json_action_body_returns_effective_decision(client):
-    addr = "0x" + "ab" * 20
-    spender = "0x" + "12" * 20
+    addr = ADDR_AB
+    spender = ADDR_12
     clean_result = analysis_result_from_snapshot(
         {
             "address": addr,
@@ -945,7 +1151,7 @@ def test_analyze_post_with_json_action_body_returns_effective_decision(client):
         )
 
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["decision"] == "warn"
     assert data["contract_decision"] == "allow"
     assert data["recommended_policy"]["action"] == "warn"
@@ -958,56 +1164,56 @@ def test_analyze_post_with_json_action_body_returns_effective_decision(client):
 
 
 def test_analyze_rejects_unsupported_action_before_payment(client_with_x402):
-    addr = "0x" + "ab" * 20
+    addr = ADDR_AB
     resp = client_with_x402.get(f"/analyze?address={addr}&action=swap")
 
     assert resp.status_code == 422
-    data = resp.get_json()
+    data = jload(resp)
     assert data["error"] == "Unsupported action: swap. Only 'approve' is currently supported."
 
 
 def test_analyze_rejects_unsupported_chain_before_payment(client_with_x402):
-    addr = "0x" + "ab" * 20
+    addr = ADDR_AB
     resp = client_with_x402.get(f"/analyze?address={addr}&action=approve&chain=ethereum")
 
     assert resp.status_code == 422
-    data = resp.get_json()
+    data = jload(resp)
     assert data["error"] == "Unsupported chain: ethereum. Only 'base' is currently supported."
 
 
 def test_analyze_rejects_missing_spender_for_approve_before_payment(client_with_x402):
-    addr = "0x" + "ab" * 20
+    addr = ADDR_AB
     resp = client_with_x402.get(f"/analyze?address={addr}&action=approve")
 
     assert resp.status_code == 422
-    data = resp.get_json()
+    data = jload(resp)
     assert data["error"] == "Missing 'spender' for action 'approve'"
 
 
 def test_analyze_rejects_invalid_spender_for_approve_before_payment(client_with_x402):
-    addr = "0x" + "ab" * 20
+    addr = ADDR_AB
     resp = client_with_x402.get(
         f"/analyze?address={addr}&action=approve&spender=0x1234"
     )
 
     assert resp.status_code == 422
-    data = resp.get_json()
+    data = jload(resp)
     assert data["error"] == "Invalid Ethereum address: 0x1234"
 
 
 def test_analyze_rejects_spender_without_action_before_payment(client_with_x402):
-    addr = "0x" + "ab" * 20
-    spender = "0x" + "12" * 20
+    addr = ADDR_AB
+    spender = ADDR_12
     resp = client_with_x402.get(f"/analyze?address={addr}&spender={spender}")
 
     assert resp.status_code == 422
-    data = resp.get_json()
+    data = jload(resp)
     assert data["error"] == "Field 'spender' requires 'action'"
 
 
 def test_analyze_post_rejects_conflicting_action_between_query_and_json_body(client):
-    addr = "0x" + "ab" * 20
-    spender = "0x" + "12" * 20
+    addr = ADDR_AB
+    spender = ADDR_12
 
     resp = client.post(
         f"/analyze?address={addr}&action=approve&spender={spender}",
@@ -1015,14 +1221,14 @@ def test_analyze_post_rejects_conflicting_action_between_query_and_json_body(cli
     )
 
     assert resp.status_code == 422
-    data = resp.get_json()
+    data = jload(resp)
     assert data["error"] == "Conflicting 'action' values in query parameter and JSON body"
 
 
 def test_analyze_post_rejects_conflicting_spender_between_query_and_json_body(client):
-    addr = "0x" + "ab" * 20
-    query_spender = "0x" + "12" * 20
-    body_spender = "0x" + "34" * 20
+    addr = ADDR_AB
+    query_spender = ADDR_12
+    body_spender = ADDR_34
 
     resp = client.post(
         f"/analyze?address={addr}&action=approve&spender={query_spender}",
@@ -1030,7 +1236,7 @@ def test_analyze_post_rejects_conflicting_spender_between_query_and_json_body(cl
     )
 
     assert resp.status_code == 422
-    data = resp.get_json()
+    data = jload(resp)
     assert data["error"] == "Conflicting 'spender' values in query parameter and JSON body"
 
 
@@ -1048,19 +1254,19 @@ def test_analyze_post_malformed_json_returns_422_without_payment(client_with_x40
     )
 
     assert resp.status_code == 422
-    data = resp.get_json()
+    data = jload(resp)
     assert data["error"] == "Malformed JSON body"
 
 
 def test_x402_post_returns_402_without_payment(client_with_x402):
     """POST /analyze should also be behind x402 paywall."""
-    addr = "0x" + "ab" * 20
+    addr = ADDR_AB
     resp = client_with_x402.post("/analyze", json={"address": addr})
     assert resp.status_code == 402
 
 
-def test_dashboard_returns_html(client):
-    resp = client.get("/dashboard")
+def test_dashboard_returns_html(any_client):
+    resp = any_client.get("/dashboard")
     assert resp.status_code == 200
     assert resp.content_type.startswith("text/html")
     assert b"risk-api" in resp.data
@@ -1070,12 +1276,6 @@ def test_dashboard_returns_html(client):
     assert b"malformed_probe" in resp.data
 
 
-def test_dashboard_not_behind_paywall(client_with_x402):
-    resp = client_with_x402.get("/dashboard")
-    assert resp.status_code == 200
-    assert resp.content_type.startswith("text/html")
-
-
 def test_request_log_captures_intent_page_host_referer_and_request_id(
     test_config, monkeypatch, tmp_path
 ):
@@ -1098,6 +1298,7 @@ def test_request_log_captures_intent_page_host_referer_and_request_id(
     assert resp.status_code == 200
     assert resp.headers["X-Request-ID"]
 
+    flush_request_log()
     entries = [json.loads(line) for line in log_path.read_text().splitlines()]
     assert len(entries) == 1
 
@@ -1185,7 +1386,7 @@ def test_stats_fallback_classifies_unpaid_402_requests(
         app.config["TESTING"] = True
         client = app.test_client()
 
-        addr = "0x" + "ab" * 20
+        addr = ADDR_AB
         resp = client.get(
             f"/analyze?address={addr}",
             base_url="https://augurrisk.com",
@@ -1201,37 +1402,43 @@ def test_stats_fallback_classifies_unpaid_402_requests(
     assert stats["top_hosts"] == [{"host": "augurrisk.com", "count": 1}]
 
 
-def test_avatar_returns_png(client):
-    resp = client.get("/avatar.png")
+def test_avatar_returns_png(any_client):
+    resp = any_client.get("/avatar.png")
     assert resp.status_code == 200
     assert resp.content_type == "image/png"
     # PNG magic bytes
     assert resp.data[:4] == b"\x89PNG"
 
 
-def test_avatar_not_behind_paywall(client_with_x402):
-    resp = client_with_x402.get("/avatar.png")
-    assert resp.status_code == 200
-    assert resp.content_type == "image/png"
+def test_avatar_etag_conditional_get_returns_304(client):
+    first = client.get("/avatar.png")
+    etag = first.headers["ETag"]
+    resp = client.get("/avatar.png", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.data == b""
+    assert resp.headers["ETag"] == etag
 
 
-def test_favicon_returns_png(client):
-    resp = client.get("/favicon.png")
+def test_favicon_returns_png(any_client):
+    resp = any_client.get("/favicon.png")
     assert resp.status_code == 200
     assert resp.content_type == "image/png"
     assert resp.data[:4] == b"\x89PNG"
 
 
-def test_favicon_not_behind_paywall(client_with_x402):
-    resp = client_with_x402.get("/favicon.png")
-    assert resp.status_code == 200
-    assert resp.content_type == "image/png"
+def test_openapi_etag_conditional_get_returns_304(client):
+    first = client.get("/openapi.json")
+    etag = first.headers["ETag"]
+    resp = client.get("/openapi.json", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.data == b""
+    assert resp.headers["ETag"] == etag
 
 
-def test_openapi_returns_valid_json(client):
-    resp = client.get("/openapi.json")
+def test_openapi_returns_valid_json(any_client):
+    resp = any_client.get("/openapi.json")
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["openapi"] == "3.0.3"
     assert data["info"]["title"] == "Augur"
     assert "/analyze" in data["paths"]
@@ -1256,24 +1463,10 @@ def test_openapi_returns_valid_json(client):
     assert scheme["name"] == "PAYMENT-SIGNATURE"
 
 
-def test_openapi_uses_public_url(app):
-    app.config["PUBLIC_URL"] = "https://augurrisk.com"
-    with app.test_client() as c:
-        resp = c.get("/openapi.json")
-        data = resp.get_json()
-        assert data["servers"][0]["url"] == "https://augurrisk.com"
-
-
-def test_openapi_not_behind_paywall(client_with_x402):
-    resp = client_with_x402.get("/openapi.json")
-    assert resp.status_code == 200
-    assert "openapi" in resp.get_json()
-
-
 def test_ai_plugin_json_endpoint(client):
     resp = client.get("/.well-known/ai-plugin.json")
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["schema_version"] == "v1"
     assert data["name_for_model"] == "augur"
     assert "Base mainnet" in data["description_for_human"]
@@ -1283,24 +1476,10 @@ def test_ai_plugin_json_endpoint(client):
     assert "/openapi.json" in data["api"]["url"]
 
 
-def test_ai_plugin_uses_public_url(app):
-    app.config["PUBLIC_URL"] = "https://augurrisk.com"
-    with app.test_client() as c:
-        resp = c.get("/.well-known/ai-plugin.json")
-        data = resp.get_json()
-        assert data["api"]["url"] == "https://augurrisk.com/openapi.json"
-
-
-def test_ai_plugin_not_behind_paywall(client_with_x402):
-    resp = client_with_x402.get("/.well-known/ai-plugin.json")
-    assert resp.status_code == 200
-    assert resp.get_json()["schema_version"] == "v1"
-
-
 def test_a2a_agent_card_endpoint(client):
     resp = client.get("/.well-known/agent.json")
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["name"] == "Augur"
     assert "Deterministic Base contract admission control for agents on Base" in data["description"]
     assert data["version"] == "1.0.0"
@@ -1318,74 +1497,37 @@ def test_a2a_agent_card_json_endpoint(client):
     """/.well-known/agent-card.json serves same A2A card (8004scan canonical path)."""
     resp = client.get("/.well-known/agent-card.json")
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["name"] == "Augur"
     assert data["version"] == "1.0.0"
     assert data["skills"][0]["id"] == "analyze-contract"
     assert data["skills"][0]["tags"] == ["oasf:security_privacy"]
 
 
-def test_a2a_agent_card_uses_public_url(app):
-    app.config["PUBLIC_URL"] = "https://augurrisk.com"
-    with app.test_client() as c:
-        resp = c.get("/.well-known/agent.json")
-        data = resp.get_json()
-        assert data["url"] == "https://augurrisk.com"
-        assert data["interfaces"][0]["baseUrl"] == "https://augurrisk.com"
-
-
-def test_a2a_agent_card_json_uses_public_url(app):
-    """agent-card.json path also respects PUBLIC_URL."""
-    app.config["PUBLIC_URL"] = "https://augurrisk.com"
-    with app.test_client() as c:
-        resp = c.get("/.well-known/agent-card.json")
-        data = resp.get_json()
-        assert data["url"] == "https://augurrisk.com"
-
-
-def test_a2a_agent_card_not_behind_paywall(client_with_x402):
-    resp = client_with_x402.get("/.well-known/agent.json")
-    assert resp.status_code == 200
-    assert resp.get_json()["name"] == "Augur"
-
-
-def test_a2a_agent_card_json_not_behind_paywall(client_with_x402):
-    """agent-card.json should also be exempt from x402 paywall."""
-    resp = client_with_x402.get("/.well-known/agent-card.json")
-    assert resp.status_code == 200
-    assert resp.get_json()["name"] == "Augur"
-
-
-def test_agent_metadata_has_a2a_service(client):
+def test_agent_metadata_services(client):
+    """A2A, OASF, and agentWallet services checked off one fetch and index."""
     resp = client.get("/agent-metadata.json")
-    data = resp.get_json()
-    a2a = next(s for s in data["services"] if s["name"] == "A2A")
+    data = jload(resp)
+    by_name = {s["name"]: s for s in data["services"]}
+
+    a2a = by_name["A2A"]
     assert "/.well-known/agent-card.json" in a2a["endpoint"]
     assert a2a["version"] == "0.3.0"
 
-
-def test_agent_metadata_has_oasf_service(client):
-    resp = client.get("/agent-metadata.json")
-    data = resp.get_json()
-    oasf = next(s for s in data["services"] if s["name"] == "OASF")
+    oasf = by_name["OASF"]
     assert oasf["endpoint"] == "https://github.com/agntcy/oasf/"
     assert oasf["version"] == "0.8.0"
     assert oasf["skills"] == ["security_privacy"]
     assert oasf["domains"] == ["technology"]
 
-
-def test_agent_metadata_has_agent_wallet_service(client):
-    resp = client.get("/agent-metadata.json")
-    data = resp.get_json()
-    wallet = next(s for s in data["services"] if s["name"] == "agentWallet")
-    assert wallet["endpoint"].startswith("eip155:8453:0x")
+    assert by_name["agentWallet"]["endpoint"].startswith("eip155:8453:0x")
 
 
 def test_wellknown_x402_returns_discovery_doc(client):
     """/.well-known/x402 returns valid x402 discovery document."""
     resp = client.get("/.well-known/x402")
     assert resp.status_code == 200
-    data = resp.get_json()
+    data = jload(resp)
     assert data["version"] == 1
     assert isinstance(data["resources"], list)
     assert len(data["resources"]) == 1
@@ -1400,23 +1542,6 @@ def test_wellknown_x402_returns_discovery_doc(client):
     assert "not a guarantee" in data["instructions"]
 
 
-def test_wellknown_x402_not_behind_paywall(client_with_x402):
-    """/.well-known/x402 should NOT be behind x402 payment gate."""
-    resp = client_with_x402.get("/.well-known/x402")
-    assert resp.status_code == 200
-    assert resp.get_json()["version"] == 1
-
-
-def test_wellknown_x402_uses_public_url(app):
-    """/.well-known/x402 resources should use PUBLIC_URL when set."""
-    app.config["PUBLIC_URL"] = "https://augurrisk.com"
-    with app.test_client() as c:
-        resp = c.get("/.well-known/x402")
-        data = resp.get_json()
-        assert data["resources"][0] == "https://augurrisk.com/analyze"
-        assert "augurrisk.com" in data["instructions"]
-
-
 # --- Landing page tests ---
 
 
@@ -1446,28 +1571,53 @@ def test_landing_has_meta_tags(client):
     assert b'og:image' in resp.data
 
 
+def _assert_all_in_body(body: bytes, needles: tuple[bytes, ...]) -> None:
+    """Assert every needle occurs in body with one multi-pattern scan.
+
+    A combined alternation (longest needles first, so overlapping needles
+    cannot shadow each other) finds all matches in a single pass instead of
+    one full-body scan per substring assertion.
+    """
+    pattern = re.compile(
+        b"|".join(re.escape(n) for n in sorted(needles, key=len, reverse=True))
+    )
+    found = set(pattern.findall(body))
+    missing = [needle for needle in needles if needle not in found]
+    assert not missing, f"missing from body: {missing}"
+
+
 def test_landing_links_discovery_endpoints(client):
     resp = client.get("/")
-    assert b">Skill Doc<" in resp.data
-    assert b">OpenAPI<" in resp.data
-    assert b">x402<" in resp.data
-    assert b">MCP<" in resp.data
-    assert b">How Payment Works<" in resp.data
-    assert b"/skill.md" in resp.data
-    assert b"/mcp" in resp.data
-    assert b"/openapi.json" in resp.data
-    assert b"/.well-known/agent-card.json" in resp.data
-    assert b"/.well-known/x402" in resp.data
-    assert b"/.well-known/ai-plugin.json" in resp.data
-    assert b"/.well-known/api-catalog" in resp.data
-    assert b"/agent-metadata.json" in resp.data
+    _assert_all_in_body(
+        resp.data,
+        (
+            b">Skill Doc<",
+            b">OpenAPI<",
+            b">x402<",
+            b">MCP<",
+            b">How Payment Works<",
+            b"/skill.md",
+            b"/mcp",
+            b"/openapi.json",
+            b"/.well-known/agent-card.json",
+            b"/.well-known/x402",
+            b"/.well-known/ai-plugin.json",
+            b"/.well-known/api-catalog",
+            b"/agent-metadata.json",
+        ),
+    )
 
 
 def test_landing_links_intent_pages(client):
     resp = client.get("/")
-    assert b"/honeypot-detection-api" in resp.data
-    assert b"/proxy-risk-api" in resp.data
-    assert b"/deployer-reputation-api" in resp.data
+    _assert_all_in_body(
+        resp.data,
+        (
+            b"/honeypot-detection-api",
+            b"/proxy-risk-api",
+            b"/deployer-reputation-api",
+        ),
+    )
 
 
 def test_landing_links_proof_report(client):
@@ -1476,24 +1626,6 @@ def test_landing_links_proof_report(client):
     assert b"/reports/base-weth-before-after" in resp.data
 
 
-def test_landing_uses_public_url(app):
-    app.config["PUBLIC_URL"] = "https://augurrisk.com"
-    with app.test_client() as c:
-        resp = c.get("/")
-        assert b"https://augurrisk.com/skill.md" in resp.data
-        assert b"https://augurrisk.com/openapi.json" in resp.data
-        assert b"https://augurrisk.com/how-payment-works" in resp.data
-        assert b"https://augurrisk.com/honeypot-detection-api" in resp.data
-        assert b"https://augurrisk.com/reports/base-bluechip-bytecode-snapshot" in resp.data
-        assert b"https://augurrisk.com/avatar.png" in resp.data
-
-
-def test_landing_not_behind_paywall(client_with_x402):
-    resp = client_with_x402.get("/")
-    assert resp.status_code == 200
-    assert resp.content_type.startswith("text/html")
-
-
 def test_how_payment_works_page(client):
     resp = client.get("/how-payment-works")
     assert resp.status_code == 200
@@ -1507,21 +1639,6 @@ def test_how_payment_works_page(client):
     assert b"github.com/JleviEderer/risk-api/tree/master" not in resp.data
 
 
-def test_how_payment_works_uses_public_url(app):
-    app.config["PUBLIC_URL"] = "https://augurrisk.com"
-    with app.test_client() as c:
-        resp = c.get("/how-payment-works")
-        assert b"https://augurrisk.com/.well-known/x402" in resp.data
-        assert b"https://augurrisk.com/openapi.json" in resp.data
-        assert b"https://github.com/JleviEderer/risk-api" in resp.data
-
-
-def test_how_payment_works_not_behind_paywall(client_with_x402):
-    resp = client_with_x402.get("/how-payment-works")
-    assert resp.status_code == 200
-    assert resp.content_type.startswith("text/html")
-
-
 def test_mcp_page(client):
     resp = client.get("/mcp")
     assert resp.status_code == 200
@@ -1533,21 +1650,6 @@ def test_mcp_page(client):
     assert b"analyze_base_contract_risk" in resp.data
 
 
-def test_mcp_page_uses_public_url(app):
-    app.config["PUBLIC_URL"] = "https://augurrisk.com"
-    with app.test_client() as c:
-        resp = c.get("/mcp")
-        assert b"https://augurrisk.com/how-payment-works" in resp.data
-        assert b"https://augurrisk.com/openapi.json" in resp.data
-        assert b"https://augurrisk.com/.well-known/x402" in resp.data
-
-
-def test_mcp_page_not_behind_paywall(client_with_x402):
-    resp = client_with_x402.get("/mcp")
-    assert resp.status_code == 200
-    assert resp.content_type.startswith("text/html")
-
-
 def test_proof_report_page(client):
     resp = client.get("/reports/base-bluechip-bytecode-snapshot")
     assert resp.status_code == 200
@@ -1603,28 +1705,6 @@ def test_proof_report_snapshots_match_current_policy_semantics():
             assert result.recommended_policy == expected_policy
 
 
-def test_proof_report_uses_public_url(app):
-    app.config["PUBLIC_URL"] = "https://augurrisk.com"
-    with app.test_client() as c:
-        resp = c.get("/reports/base-bluechip-bytecode-snapshot")
-        assert b"https://augurrisk.com/" in resp.data
-        assert b"https://augurrisk.com/how-payment-works" in resp.data
-        assert b"https://augurrisk.com/openapi.json" in resp.data
-        resp = c.get("/reports/base-weth-before-after")
-        assert b"https://augurrisk.com/" in resp.data
-        assert b"https://augurrisk.com/how-payment-works" in resp.data
-        assert b"https://augurrisk.com/openapi.json" in resp.data
-
-
-def test_proof_report_not_behind_paywall(client_with_x402):
-    resp = client_with_x402.get("/reports/base-bluechip-bytecode-snapshot")
-    assert resp.status_code == 200
-    assert resp.content_type.startswith("text/html")
-    resp = client_with_x402.get("/reports/base-weth-before-after")
-    assert resp.status_code == 200
-    assert resp.content_type.startswith("text/html")
-
-
 def test_proof_report_route_dispatches_from_registry(app, monkeypatch):
     monkeypatch.setitem(
         REPORT_PAGES,
@@ -1681,42 +1761,11 @@ def test_buyer_intent_pages_return_html(client, path, title):
     assert b"/openapi.json" in resp.data
 
 
-@pytest.mark.parametrize(
-    "path",
-    [
-        "/honeypot-detection-api",
-        "/proxy-risk-api",
-        "/deployer-reputation-api",
-    ],
-)
-def test_buyer_intent_pages_use_public_url(app, path):
-    app.config["PUBLIC_URL"] = "https://augurrisk.com"
-    with app.test_client() as c:
-        resp = c.get(path)
-        assert b"https://augurrisk.com/" in resp.data
-        assert b"https://augurrisk.com/how-payment-works" in resp.data
-        assert b"https://augurrisk.com/openapi.json" in resp.data
-
-
-@pytest.mark.parametrize(
-    "path",
-    [
-        "/honeypot-detection-api",
-        "/proxy-risk-api",
-        "/deployer-reputation-api",
-    ],
-)
-def test_buyer_intent_pages_not_behind_paywall(client_with_x402, path):
-    resp = client_with_x402.get(path)
-    assert resp.status_code == 200
-    assert resp.content_type.startswith("text/html")
-
-
 # --- robots.txt tests ---
 
 
-def test_robots_txt_returns_text(client):
-    resp = client.get("/robots.txt")
+def test_robots_txt_returns_text(any_client):
+    resp = any_client.get("/robots.txt")
     assert resp.status_code == 200
     assert resp.content_type.startswith("text/plain")
     text = resp.data.decode()
@@ -1733,65 +1782,41 @@ def test_robots_txt_includes_sitemap(client):
     assert "/sitemap.xml" in text
 
 
-def test_robots_txt_uses_public_url(app):
-    app.config["PUBLIC_URL"] = "https://augurrisk.com"
-    with app.test_client() as c:
-        resp = c.get("/robots.txt")
-        text = resp.data.decode()
-        assert "https://augurrisk.com/sitemap.xml" in text
-
-
-def test_robots_txt_not_behind_paywall(client_with_x402):
-    resp = client_with_x402.get("/robots.txt")
-    assert resp.status_code == 200
-    assert resp.content_type.startswith("text/plain")
+# --- sitemap.xml tests ---
 
 
-# --- sitemap.xml tests ---
+# Private/gated endpoints that must never leak into the sitemap.
+_SITEMAP_FORBID = re.compile(rb"/stats|/dashboard|/analyze")
 
 
-def test_sitemap_returns_xml(client):
-    resp = client.get("/sitemap.xml")
+def test_sitemap_returns_xml(any_client):
+    resp = any_client.get("/sitemap.xml")
     assert resp.status_code == 200
     assert resp.content_type.startswith("application/xml")
-    text = resp.data.decode()
-    assert '<?xml version="1.0"' in text
-    assert "<urlset" in text
+    assert b'<?xml version="1.0"' in resp.data
+    assert b"<urlset" in resp.data
 
 
 def test_sitemap_lists_public_endpoints(client):
     resp = client.get("/sitemap.xml")
-    text = resp.data.decode()
-    assert "/skill.md" in text
-    assert "/mcp" in text
-    assert "/how-payment-works" in text
-    assert "/honeypot-detection-api" in text
-    assert "/proxy-risk-api" in text
-    assert "/deployer-reputation-api" in text
-    assert "/reports/base-bluechip-bytecode-snapshot" in text
-    assert "/reports/base-weth-before-after" in text
-    assert "/openapi.json" in text
-    assert "/agent-metadata.json" in text
-    assert "/.well-known/agent-card.json" in text
-    assert "/.well-known/api-catalog" in text
-    # Should NOT include private/gated endpoints
-    assert "/stats" not in text
-    assert "/dashboard" not in text
-    assert "/analyze" not in text
-
-
-def test_sitemap_uses_public_url(app):
-    app.config["PUBLIC_URL"] = "https://augurrisk.com"
-    with app.test_client() as c:
-        resp = c.get("/sitemap.xml")
-        text = resp.data.decode()
-        assert "https://augurrisk.com/" in text
-
-
-def test_sitemap_not_behind_paywall(client_with_x402):
-    resp = client_with_x402.get("/sitemap.xml")
-    assert resp.status_code == 200
-    assert resp.content_type.startswith("application/xml")
+    _assert_all_in_body(
+        resp.data,
+        (
+            b"/skill.md",
+            b"/mcp",
+            b"/how-payment-works",
+            b"/honeypot-detection-api",
+            b"/proxy-risk-api",
+            b"/deployer-reputation-api",
+            b"/reports/base-bluechip-bytecode-snapshot",
+            b"/reports/base-weth-before-after",
+            b"/openapi.json",
+            b"/agent-metadata.json",
+            b"/.well-known/agent-card.json",
+            b"/.well-known/api-catalog",
+        ),
+    )
+    assert not _SITEMAP_FORBID.search(resp.data)
 
 
 # --- api-catalog tests ---
@@ -1802,13 +1827,13 @@ def test_api_catalog_returns_linkset_json(client):
     assert resp.status_code == 200
     assert "application/linkset+json" in resp.content_type
     assert "rfc9727" in resp.content_type
-    data = resp.get_json()
+    data = jload(resp)
     assert "linkset" in data
 
 
 def test_api_catalog_points_to_openapi(client):
     resp = client.get("/.well-known/api-catalog")
-    data = resp.get_json()
+    data = jload(resp)
     linkset = data["linkset"][0]
     assert linkset["service-desc"][0]["href"].endswith("/openapi.json")
     assert linkset["service-desc"][0]["type"] == "application/json"
@@ -1816,28 +1841,12 @@ def test_api_catalog_points_to_openapi(client):
 
 def test_api_catalog_points_to_landing(client):
     resp = client.get("/.well-known/api-catalog")
-    data = resp.get_json()
+    data = jload(resp)
     linkset = data["linkset"][0]
     assert linkset["service-doc"][0]["href"].endswith("/")
     assert linkset["service-doc"][0]["type"] == "text/html"
 
 
-def test_api_catalog_uses_public_url(app):
-    app.config["PUBLIC_URL"] = "https://augurrisk.com"
-    with app.test_client() as c:
-        resp = c.get("/.well-known/api-catalog")
-        data = resp.get_json()
-        linkset = data["linkset"][0]
-        assert linkset["anchor"] == "https://augurrisk.com/.well-known/api-catalog"
-        assert linkset["service-desc"][0]["href"] == "https://augurrisk.com/openapi.json"
-
-
-def test_api_catalog_not_behind_paywall(client_with_x402):
-    resp = client_with_x402.get("/.well-known/api-catalog")
-    assert resp.status_code == 200
-    assert "linkset" in resp.get_json()
-
-
 # --- llms.txt tests ---
 
 
@@ -1883,23 +1892,6 @@ def test_llms_txt_documents_first_successful_paid_call(client):
     assert "Call before pay. Call before approve. Call before interact." in text
 
 
-def test_llms_txt_uses_public_url(app):
-    app.config["PUBLIC_URL"] = "https://augurrisk.com"
-    with app.test_client() as c:
-        resp = c.get("/llms.txt")
-        text = resp.data.decode()
-        assert "https://augurrisk.com/skill.md" in text
-        assert "https://augurrisk.com/analyze" in text
-        assert "https://augurrisk.com/mcp" in text
-        assert "https://augurrisk.com/openapi.json" in text
-
-
-def test_llms_txt_not_behind_paywall(client_with_x402):
-    resp = client_with_x402.get("/llms.txt")
-    assert resp.status_code == 200
-    assert b"# Augur" in resp.data
-
-
 def test_llms_full_txt_returns_markdown(client):
     resp = client.get("/llms-full.txt")
     assert resp.status_code == 200
@@ -1934,22 +1926,6 @@ def test_llms_full_txt_has_action_aware_approve_example(client):
     assert "action_approve_requested" in text
 
 
-def test_llms_full_txt_uses_public_url(app):
-    app.config["PUBLIC_URL"] = "https://augurrisk.com"
-    with app.test_client() as c:
-        resp = c.get("/llms-full.txt")
-        text = resp.data.decode()
-        assert "https://augurrisk.com/skill.md" in text
-        assert "https://augurrisk.com/mcp" in text
-        assert "https://augurrisk.com/analyze" in text
-
-
-def test_llms_full_txt_not_behind_paywall(client_with_x402):
-    resp = client_with_x402.get("/llms-full.txt")
-    assert resp.status_code == 200
-    assert b"# Augur" in resp.data
-
-
 def test_skill_md_returns_markdown(client):
     resp = client.get("/skill.md")
     assert resp.status_code == 200
@@ -1968,29 +1944,11 @@ def test_skill_md_returns_markdown(client):
     assert "deterministic preflight for Base contract actions" in text
 
 
-def test_skill_md_uses_public_url(app):
-    app.config["PUBLIC_URL"] = "https://augurrisk.com"
-    with app.test_client() as c:
-        resp = c.get("/skill.md")
-        text = resp.data.decode()
-        assert "homepage: https://augurrisk.com" in text
-        assert "https://augurrisk.com/analyze" in text
-        assert "https://augurrisk.com/openapi.json" in text
-        assert "https://augurrisk.com/mcp" in text
-
-
-def test_skill_md_not_behind_paywall(client_with_x402):
-    resp = client_with_x402.get("/skill.md")
-    assert resp.status_code == 200
-    assert b"name: augur" in resp.data
-
-
 # --- OpenAPI examples tests ---
 
 
-def test_openapi_get_200_has_examples(client):
-    resp = client.get("/openapi.json")
-    data = resp.get_json()
+def test_openapi_get_200_has_examples(openapi_spec):
+    data = openapi_spec
     examples = data["paths"]["/analyze"]["get"]["responses"]["200"]["content"]["application/json"]["examples"]
     assert "safe_contract" in examples
     assert examples["safe_contract"]["summary"] == (
@@ -2019,43 +1977,38 @@ def test_openapi_get_200_has_examples(client):
     ]["402"]["description"]
 
 
-@responses.activate
-def test_openapi_proxy_example_matches_mocked_route_output(client):
-    eip1967 = "360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc"
-    proxy_bytecode = "0x7f" + eip1967 + "f4" + "00" * 200
+@pytest.mark.uses_rpc_cache
+def test_openapi_proxy_example_matches_mocked_route_output(
+    client, mocked_responses, openapi_spec
+):
     implementation = cast(dict[str, Any], PROXY_ANALYSIS_EXAMPLE["implementation"])
     impl_addr_hex = str(implementation["address"])[2:]
-    impl_addr_padded = "0x" + "0" * 24 + impl_addr_hex
-    impl_bytecode = "0x" + "ff" + "00" * 200
 
-    responses.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": proxy_bytecode})
-    responses.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": impl_addr_padded})
-    responses.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": impl_bytecode})
+    mocked_responses.post(RPC_URL, json=RPC_OK_PROXY)
+    mocked_responses.post(RPC_URL, json=_impl_slot_batch(impl_addr_hex))
+    mocked_responses.post(RPC_URL, json=RPC_OK_SELFDESTRUCT)
 
     resp = client.get(f"/analyze?address={PROXY_EXAMPLE_ADDRESS}")
     assert resp.status_code == 200
 
-    route_output = resp.get_json()
-    openapi = client.get("/openapi.json").get_json()
-    example_output = openapi["paths"]["/analyze"]["get"]["responses"]["200"]["content"][
+    route_output = jload(resp)
+    example_output = openapi_spec["paths"]["/analyze"]["get"]["responses"]["200"]["content"][
         "application/json"
     ]["examples"]["proxy_contract"]["value"]
 
     assert route_output == example_output
 
 
-def test_openapi_get_422_has_example(client):
-    resp = client.get("/openapi.json")
-    data = resp.get_json()
+def test_openapi_get_422_has_example(openapi_spec):
+    data = openapi_spec
     example = data["paths"]["/analyze"]["get"]["responses"]["422"]["content"]["application/json"]["example"]
     assert "error" in example
     examples = data["paths"]["/analyze"]["get"]["responses"]["422"]["content"]["application/json"]["examples"]
     assert "no_bytecode" in examples
 
 
-def test_openapi_post_422_has_body_error_examples(client):
-    resp = client.get("/openapi.json")
-    data = resp.get_json()
+def test_openapi_post_422_has_body_error_examples(openapi_spec):
+    data = openapi_spec
     examples = data["paths"]["/analyze"]["post"]["responses"]["422"]["content"][
         "application/json"
     ]["examples"]
@@ -2087,9 +2040,8 @@ def test_openapi_post_422_has_body_error_examples(client):
     )
 
 
-def test_openapi_post_200_has_example(client):
-    resp = client.get("/openapi.json")
-    data = resp.get_json()
+def test_openapi_post_200_has_example(openapi_spec):
+    data = openapi_spec
     example = data["paths"]["/analyze"]["post"]["responses"]["200"]["content"]["application/json"]["example"]
     assert example["score"] == 0
     assert example["level"] == "safe"
@@ -2102,18 +2054,16 @@ def test_openapi_post_200_has_example(client):
     }
 
 
-def test_openapi_get_supports_action_aware_query_parameters(client):
-    resp = client.get("/openapi.json")
-    data = resp.get_json()
+def test_openapi_get_supports_action_aware_query_parameters(openapi_spec):
+    data = openapi_spec
     parameters = data["paths"]["/analyze"]["get"]["parameters"]
     names = {parameter["name"] for parameter in parameters}
 
     assert {"address", "action", "spender", "chain"}.issubset(names)
 
 
-def test_openapi_get_200_has_approve_action_example(client):
-    resp = client.get("/openapi.json")
-    data = resp.get_json()
+def test_openapi_get_200_has_approve_action_example(openapi_spec):
+    data = openapi_spec
     examples = data["paths"]["/analyze"]["get"]["responses"]["200"]["content"][
         "application/json"
     ]["examples"]
@@ -2125,9 +2075,8 @@ def test_openapi_get_200_has_approve_action_example(client):
     assert examples["approve_action"]["value"]["action_evaluation"]["decision"] == "warn"
 
 
-def test_openapi_schemas_include_action_evaluation_and_contract_decision(client):
-    resp = client.get("/openapi.json")
-    data = resp.get_json()
+def test_openapi_schemas_include_action_evaluation_and_contract_decision(openapi_spec):
+    data = openapi_spec
     schemas = data["components"]["schemas"]
 
     assert "ActionContext" in schemas
@@ -2138,9 +2087,8 @@ def test_openapi_schemas_include_action_evaluation_and_contract_decision(client)
     assert "action_evaluation" in schemas["AnalysisResult"]["properties"]
 
 
-def test_openapi_schemas_have_descriptions(client):
-    resp = client.get("/openapi.json")
-    data = resp.get_json()
+def test_openapi_schemas_have_descriptions(openapi_spec):
+    data = openapi_spec
     schemas = data["components"]["schemas"]
     # Finding schema has descriptions
     finding = schemas["Finding"]
@@ -2213,10 +2161,10 @@ def test_landing_has_faqpage_schema(client):
 
 def test_sitemap_includes_llms(client):
     resp = client.get("/sitemap.xml")
-    text = resp.data.decode()
-    assert "/skill.md" in text
-    assert "/llms.txt" in text
-    assert "/llms-full.txt" in text
+    _assert_all_in_body(
+        resp.data,
+        (b"/skill.md", b"/llms.txt", b"/llms-full.txt"),
+    )
 
 
 def test_robots_allows_llms(client):
@@ -2267,6 +2215,7 @@ def test_request_log_captures_mcp_page_stage(test_config, monkeypatch, tmp_path)
 
     assert resp.status_code == 200
 
+    flush_request_log()
     entries = [json.loads(line) for line in log_path.read_text().splitlines()]
     assert len(entries) == 1
     assert entries[0]["path"] == "/mcp"
@@ -2289,6 +2238,7 @@ def test_request_log_captures_proof_report_stage(test_config, monkeypatch, tmp_p
 
     assert resp.status_code == 200
 
+    flush_request_log()
     entries = [json.loads(line) for line in log_path.read_text().splitlines()]
     assert len(entries) == 1
     assert entries[0]["path"] == "/reports/base-bluechip-bytecode-snapshot"
@@ -2341,6 +2291,7 @@ def test_request_log_captures_registry_report_stage(
 
     assert resp.status_code == 200
 
+    flush_request_log()
     entries = [json.loads(line) for line in log_path.read_text().splitlines()]
     assert len(entries) == 1
     assert entries[0]["path"] == "/reports/registry-log-test"
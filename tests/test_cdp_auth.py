@@ -6,17 +6,24 @@ import base64
 import time
 
 import jwt
+import pytest
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
 from risk_api.cdp_auth import (
     _build_jwt,
     _parse_ed25519_key,
+    clear_auth_header_cache,
     create_cdp_auth_headers,
 )
 
 
-def _make_test_keypair() -> tuple[str, Ed25519PrivateKey]:
-    """Generate a test Ed25519 keypair, return (base64_secret, private_key)."""
+@pytest.fixture(scope="session")
+def keypair() -> tuple[str, Ed25519PrivateKey]:
+    """One Ed25519 keypair for the whole session, as (base64_secret, private_key).
+
+    Key identity never matters in these tests, only usability, so a single
+    generation replaces one per test.
+    """
     private_key = Ed25519PrivateKey.generate()
     seed = private_key.private_bytes_raw()
     pub = private_key.public_key().public_bytes_raw()
@@ -24,8 +31,8 @@ def _make_test_keypair() -> tuple[str, Ed25519PrivateKey]:
     return secret, private_key
 
 
-def test_parse_ed25519_key():
-    secret, expected_key = _make_test_keypair()
+def test_parse_ed25519_key(keypair):
+    secret, expected_key = keypair
     parsed = _parse_ed25519_key(secret)
     assert parsed.private_bytes_raw() == expected_key.private_bytes_raw()
 
@@ -39,8 +46,8 @@ def test_parse_ed25519_key_wrong_length():
         assert "Expected 64-byte" in str(e)
 
 
-def test_build_jwt_structure():
-    secret, private_key = _make_test_keypair()
+def test_build_jwt_structure(keypair):
+    secret, private_key = keypair
     key_id = "test-key-id"
 
     token = _build_jwt(
@@ -70,9 +77,9 @@ def test_build_jwt_structure():
     assert "nonce" in header
 
 
-def test_build_jwt_is_valid():
+def test_build_jwt_is_valid(keypair):
     """JWT should be verifiable with the corresponding public key."""
-    secret, private_key = _make_test_keypair()
+    secret, private_key = keypair
     token = _build_jwt(
         key_id="k1",
         private_key=private_key,
@@ -85,8 +92,8 @@ def test_build_jwt_is_valid():
     assert decoded["sub"] == "k1"
 
 
-def test_create_cdp_auth_headers_all_endpoints():
-    secret, _ = _make_test_keypair()
+def test_create_cdp_auth_headers_all_endpoints(keypair):
+    secret, _ = keypair
     key_id = "test-uuid"
     url = "https://api.cdp.coinbase.com/platform/v2/x402"
 
@@ -101,8 +108,8 @@ def test_create_cdp_auth_headers_all_endpoints():
         assert headers[endpoint]["Authorization"].startswith("Bearer ")
 
 
-def test_jwt_not_expired():
-    secret, private_key = _make_test_keypair()
+def test_jwt_not_expired(keypair):
+    secret, private_key = keypair
     token = _build_jwt(
         key_id="k1",
         private_key=private_key,
@@ -114,3 +121,17 @@ def test_jwt_not_expired():
     public_key = private_key.public_key()
     decoded = jwt.decode(token, public_key, algorithms=["EdDSA"])
     assert decoded["exp"] > int(time.time())
+
+
+def test_create_cdp_auth_headers_reuses_tokens_within_ttl(keypair):
+    secret, _ = keypair
+    clear_auth_header_cache()
+    url = "https://api.cdp.coinbase.com/platform/v2/x402"
+
+    first = create_cdp_auth_headers("test-uuid", secret, url)
+    second = create_cdp_auth_headers("test-uuid", secret, url)
+    assert second is first
+
+    clear_auth_header_cache()
+    third = create_cdp_auth_headers("test-uuid", secret, url)
+    assert third is not first
@@ -25,10 +25,26 @@ IMPL_ADDR = "aa" * 20
 IMPL_ADDR_PADDED = "0x" + "0" * 24 + IMPL_ADDR
 
 
+ZERO_SLOT = "0x" + "0" * 64
+
+
 def _rpc_response(result: str) -> dict[str, object]:
     return {"jsonrpc": "2.0", "id": 1, "result": result}
 
 
+def _batch_rpc_response(*results: str) -> list[dict[str, object]]:
+    """Batch response for the single eth_getStorageAt POST covering all slots."""
+    return [
+        {"jsonrpc": "2.0", "id": request_id, "result": result}
+        for request_id, result in enumerate(results, start=1)
+    ]
+
+
+def _slot_hit_response(result: str) -> list[dict[str, object]]:
+    """Batch response where the EIP-1967 slot hits and the rest are empty."""
+    return _batch_rpc_response(result, ZERO_SLOT, ZERO_SLOT)
+
+
 def _proxy_bytecode() -> str:
     """Minimal proxy bytecode: PUSH32 <EIP-1967 slot> + DELEGATECALL + padding."""
     return "0x7f" + EIP1967_HEX + "f4" + "00" * 200
@@ -273,7 +289,7 @@ def test_analyze_managed_proxy_admin_surface_requires_manual_review_instead_of_b
     impl_bytecode = "0x63a22cb46563a0712d68f4" + "00" * 220
 
     responses.post(RPC_URL, json=_rpc_response(proxy_bytecode))
-    responses.post(RPC_URL, json=_rpc_response(impl_slot_value))
+    responses.post(RPC_URL, json=_slot_hit_response(impl_slot_value))
     responses.post(RPC_URL, json=_rpc_response(impl_bytecode))
 
     result = analyze_contract(proxy_addr, RPC_URL)
@@ -300,11 +316,8 @@ def test_analyze_proxy_contract():
     proxy_addr = "0x" + "22" * 20
     # First call: get_code for proxy
     responses.post(RPC_URL, json=_rpc_response(_proxy_bytecode()))
-    # Storage slot reads all return zero (no implementation found)
-    zero_slot = "0x" + "0" * 64
-    responses.post(RPC_URL, json=_rpc_response(zero_slot))
-    responses.post(RPC_URL, json=_rpc_response(zero_slot))
-    responses.post(RPC_URL, json=_rpc_response(zero_slot))
+    # Batched storage slot read returns all zeros (no implementation found)
+    responses.post(RPC_URL, json=_batch_rpc_response(ZERO_SLOT, ZERO_SLOT, ZERO_SLOT))
 
     result = analyze_contract(proxy_addr, RPC_URL)
     assert any(f.detector == "proxy" for f in result.findings)
@@ -337,7 +350,7 @@ def test_analyze_rpc_failure():
 def test_resolve_implementation_eip1967():
     """EIP-1967 slot returns valid address."""
     addr = "0x" + "aa" * 20
-    responses.post(RPC_URL, json=_rpc_response(IMPL_ADDR_PADDED))
+    responses.post(RPC_URL, json=_slot_hit_response(IMPL_ADDR_PADDED))
 
     result = resolve_implementation(addr, RPC_URL)
     assert result == "0x" + IMPL_ADDR
@@ -357,11 +370,10 @@ def test_resolve_implementation_minimal_proxy_from_bytecode():
 def test_resolve_implementation_fallthrough_to_eip1822():
     """EIP-1967 empty, EIP-1822 returns valid address."""
     addr = "0x" + "bb" * 20
-    zero = "0x" + "0" * 64
-    # EIP-1967 returns zero
-    responses.post(RPC_URL, json=_rpc_response(zero))
-    # EIP-1822 returns valid address
-    responses.post(RPC_URL, json=_rpc_response(IMPL_ADDR_PADDED))
+    responses.post(
+        RPC_URL,
+        json=_batch_rpc_response(ZERO_SLOT, IMPL_ADDR_PADDED, ZERO_SLOT),
+    )
 
     result = resolve_implementation(addr, RPC_URL)
     assert result == "0x" + IMPL_ADDR
@@ -371,10 +383,7 @@ def test_resolve_implementation_fallthrough_to_eip1822():
 def test_resolve_implementation_all_empty():
     """All slots return zero — no implementation found."""
     addr = "0x" + "cc" * 20
-    zero = "0x" + "0" * 64
-    responses.post(RPC_URL, json=_rpc_response(zero))
-    responses.post(RPC_URL, json=_rpc_response(zero))
-    responses.post(RPC_URL, json=_rpc_response(zero))
+    responses.post(RPC_URL, json=_batch_rpc_response(ZERO_SLOT, ZERO_SLOT, ZERO_SLOT))
 
     result = resolve_implementation(addr, RPC_URL)
     assert result is None
@@ -382,11 +391,9 @@ def test_resolve_implementation_all_empty():
 
 @responses.activate
 def test_resolve_implementation_rpc_failure_graceful():
-    """RPC failure on all slots returns None gracefully."""
+    """RPC failure on the batched slot read returns None gracefully."""
     addr = "0x" + "dd" * 20
     responses.post(RPC_URL, body=ConnectionError("timeout"))
-    responses.post(RPC_URL, body=ConnectionError("timeout"))
-    responses.post(RPC_URL, body=ConnectionError("timeout"))
 
     result = resolve_implementation(addr, RPC_URL)
     assert result is None
@@ -401,8 +408,8 @@ def test_analyze_proxy_resolves_implementation():
     proxy_addr = "0x" + "ee" * 20
     # get_code for proxy
     responses.post(RPC_URL, json=_rpc_response(_proxy_bytecode()))
-    # EIP-1967 storage slot returns impl address
-    responses.post(RPC_URL, json=_rpc_response(IMPL_ADDR_PADDED))
+    # EIP-1967 storage slot (batched read) returns impl address
+    responses.post(RPC_URL, json=_slot_hit_response(IMPL_ADDR_PADDED))
     # get_code for implementation (SELFDESTRUCT)
     responses.post(RPC_URL, json=_rpc_response(_risky_impl_bytecode()))
 
@@ -446,8 +453,8 @@ def test_analyze_proxy_clean_implementation():
     proxy_addr = "0x" + "ff" * 20
     # get_code for proxy
     responses.post(RPC_URL, json=_rpc_response(_proxy_bytecode()))
-    # EIP-1967 storage slot returns impl address
-    responses.post(RPC_URL, json=_rpc_response(IMPL_ADDR_PADDED))
+    # EIP-1967 storage slot (batched read) returns impl address
+    responses.post(RPC_URL, json=_slot_hit_response(IMPL_ADDR_PADDED))
     # get_code for implementation (clean)
     responses.post(RPC_URL, json=_rpc_response(_clean_impl_bytecode()))
 
@@ -466,7 +473,7 @@ def test_analyze_proxy_impl_includes_suspicious_selector_score():
     """Implementation scoring reuses top-level heuristics like suspicious selectors."""
     proxy_addr = "0x" + "12" * 20
     responses.post(RPC_URL, json=_rpc_response(_proxy_bytecode()))
-    responses.post(RPC_URL, json=_rpc_response(IMPL_ADDR_PADDED))
+    responses.post(RPC_URL, json=_slot_hit_response(IMPL_ADDR_PADDED))
     responses.post(RPC_URL, json=_rpc_response(_suspicious_impl_bytecode()))
 
     result = analyze_contract(proxy_addr, RPC_URL)
@@ -484,7 +491,7 @@ def test_analyze_proxy_impl_includes_tiny_bytecode_score():
     """Implementation scoring reuses top-level heuristics like tiny bytecode."""
     proxy_addr = "0x" + "13" * 20
     responses.post(RPC_URL, json=_rpc_response(_proxy_bytecode()))
-    responses.post(RPC_URL, json=_rpc_response(IMPL_ADDR_PADDED))
+    responses.post(RPC_URL, json=_slot_hit_response(IMPL_ADDR_PADDED))
     responses.post(RPC_URL, json=_rpc_response(_tiny_impl_bytecode()))
 
     result = analyze_contract(proxy_addr, RPC_URL)
@@ -503,9 +510,7 @@ def test_analyze_proxy_storage_rpc_failure():
     proxy_addr = "0x" + "a1" * 20
     # get_code for proxy
     responses.post(RPC_URL, json=_rpc_response(_proxy_bytecode()))
-    # All storage reads fail
-    responses.post(RPC_URL, body=ConnectionError("timeout"))
-    responses.post(RPC_URL, body=ConnectionError("timeout"))
+    # The batched storage read fails
     responses.post(RPC_URL, body=ConnectionError("timeout"))
 
     result = analyze_contract(proxy_addr, RPC_URL)
@@ -527,8 +532,8 @@ def test_analyze_proxy_implementation_is_also_proxy():
     proxy_addr = "0x" + "b2" * 20
     # get_code for proxy
     responses.post(RPC_URL, json=_rpc_response(_proxy_bytecode()))
-    # EIP-1967 storage slot returns impl address
-    responses.post(RPC_URL, json=_rpc_response(IMPL_ADDR_PADDED))
+    # EIP-1967 storage slot (batched read) returns impl address
+    responses.post(RPC_URL, json=_slot_hit_response(IMPL_ADDR_PADDED))
     # get_code for implementation — also a proxy
     responses.post(RPC_URL, json=_rpc_response(_proxy_bytecode()))
 
@@ -550,8 +555,8 @@ def test_analyze_proxy_impl_bytecode_fetch_fails():
     proxy_addr = "0x" + "c3" * 20
     # get_code for proxy
     responses.post(RPC_URL, json=_rpc_response(_proxy_bytecode()))
-    # EIP-1967 storage slot returns impl address
-    responses.post(RPC_URL, json=_rpc_response(IMPL_ADDR_PADDED))
+    # EIP-1967 storage slot (batched read) returns impl address
+    responses.post(RPC_URL, json=_slot_hit_response(IMPL_ADDR_PADDED))
     # get_code for implementation fails
     responses.post(RPC_URL, body=ConnectionError("timeout"))
 
@@ -573,7 +578,7 @@ def test_analyze_proxy_impl_address_has_no_code():
     """Implementation address resolved but eth_getCode returns 0x."""
     proxy_addr = "0x" + "c4" * 20
     responses.post(RPC_URL, json=_rpc_response(_proxy_bytecode()))
-    responses.post(RPC_URL, json=_rpc_response(IMPL_ADDR_PADDED))
+    responses.post(RPC_URL, json=_slot_hit_response(IMPL_ADDR_PADDED))
     responses.post(RPC_URL, json=_rpc_response("0x"))
 
     result = analyze_contract(proxy_addr, RPC_URL)
@@ -11,7 +11,7 @@ from flask import request
 
 from risk_api.analytics import PAID_RESPONSE_SNAPSHOT_MAX_BYTES, append_sqlite_entry
 from risk_api.api_contract import analysis_result_from_snapshot
-from risk_api.app import create_app
+from risk_api.app import create_app, flush_request_log
 from risk_api.analysis.engine import clear_analysis_cache
 from risk_api.analysis.reputation import BLOCKSCOUT_API, clear_reputation_cache
 from risk_api.chain.rpc import clear_cache
@@ -107,6 +107,7 @@ def test_analyze_request_is_logged(client_logged, app_with_logging):
     assert resp.status_code == 200
 
     log_path = app_with_logging.config["REQUEST_LOG_PATH"]
+    flush_request_log()
     with open(log_path) as f:
         lines = [l.strip() for l in f if l.strip()]
 
@@ -131,6 +132,7 @@ def test_failed_request_is_logged(client_logged, app_with_logging):
     assert resp.status_code == 422
 
     log_path = app_with_logging.config["REQUEST_LOG_PATH"]
+    flush_request_log()
     with open(log_path) as f:
         lines = [l.strip() for l in f if l.strip()]
 
@@ -147,6 +149,7 @@ def test_failed_request_is_logged(client_logged, app_with_logging):
 def test_health_is_logged_as_health_check(client_logged, app_with_logging):
     client_logged.get("/health")
     log_path = app_with_logging.config["REQUEST_LOG_PATH"]
+    flush_request_log()
     with open(log_path) as f:
         lines = [l.strip() for l in f if l.strip()]
 
@@ -162,6 +165,7 @@ def test_landing_view_is_logged(client_logged, app_with_logging):
     assert resp.status_code == 200
 
     log_path = app_with_logging.config["REQUEST_LOG_PATH"]
+    flush_request_log()
     with open(log_path) as f:
         lines = [l.strip() for l in f if l.strip()]
 
@@ -182,6 +186,7 @@ def test_no_bytecode_request_is_logged(client_logged, app_with_logging):
     assert resp.status_code == 422
 
     log_path = app_with_logging.config["REQUEST_LOG_PATH"]
+    flush_request_log()
     with open(log_path) as f:
         lines = [l.strip() for l in f if l.strip()]
 
@@ -239,6 +244,7 @@ def test_action_approve_logs_allowlisted_spender_trust(
 
     assert resp.status_code == 200
 
+    flush_request_log()
     with open(log_path, encoding="utf-8") as handle:
         lines = [line.strip() for line in handle if line.strip()]
 
@@ -287,6 +293,7 @@ def test_action_approve_logs_unchecked_spender_trust_without_allowlist(
 
     assert resp.status_code == 200
 
+    flush_request_log()
     with open(log_path, encoding="utf-8") as handle:
         lines = [line.strip() for line in handle if line.strip()]
 
@@ -373,6 +380,41 @@ def test_stats_ignores_malformed_jsonl_lines(test_config, monkeypatch, tmp_path)
     assert data["top_paths"] == [{"path": "/", "count": 1}]
 
 
+def test_stats_totals_survive_log_rotation(test_config, log_dir, monkeypatch):
+    """Rotation folds the closing log into stats_rollup.json; /stats sums it."""
+    log_path = os.path.join(log_dir, "requests.jsonl")
+    monkeypatch.delenv("ANALYTICS_DB_PATH", raising=False)
+    monkeypatch.setenv("REQUEST_LOG_PATH", log_path)
+    # Entries are a few hundred bytes; a tiny cap forces a rotation on
+    # roughly every entry, enough to age raw backups out entirely.
+    monkeypatch.setattr("risk_api.app.REQUEST_LOG_MAX_BYTES", 256)
+    app = create_app(config=test_config, enable_x402=False)
+    app.config["TESTING"] = True
+    client = app.test_client()
+
+    for _ in range(8):
+        assert client.get("/").status_code == 200
+
+    resp = client.get("/stats")
+    assert resp.status_code == 200
+    data = resp.get_json()
+    assert data["total_requests"] == 8
+    assert data["funnel"]["landing_views"] == 8
+    # Rotation happened: the rollup exists and the active file holds only
+    # the tail, so the totals above must include rotated-away entries.
+    assert os.path.exists(os.path.join(log_dir, "stats_rollup.json"))
+    with open(log_path) as f:
+        live_lines = [line for line in f if line.strip()]
+    assert len(live_lines) < 8
+
+    # Further traffic (and further rotations) keeps the running total exact.
+    for _ in range(3):
+        assert client.get("/").status_code == 200
+    data = client.get("/stats").get_json()
+    assert data["total_requests"] == 11
+    assert data["funnel"]["landing_views"] == 11
+
+
 def test_stats_returns_501_without_log_path(test_config, monkeypatch):
     monkeypatch.delenv("REQUEST_LOG_PATH", raising=False)
     monkeypatch.delenv("ANALYTICS_DB_PATH", raising=False)
@@ -89,8 +89,8 @@ def test_real_paid_contract_bytecode_regressions(
     monkeypatch.setattr(engine, "get_code", fake_get_code)
     monkeypatch.setattr(
         engine,
-        "get_storage_at",
-        lambda address, slot, rpc_url: ZERO_STORAGE_WORD,
+        "get_storage_at_batch",
+        lambda address, slots, rpc_url: tuple(ZERO_STORAGE_WORD for _ in slots),
     )
     # These fixtures intentionally lock bytecode + policy behavior only.
     # Deployer reputation uses live explorer data in production, so keep it out
@@ -1,7 +1,14 @@
 import pytest
 import responses
 
-from risk_api.chain.rpc import RPCError, clear_cache, get_code, get_storage_at
+from risk_api.chain import rpc
+from risk_api.chain.rpc import (
+    RPCError,
+    clear_cache,
+    get_code,
+    get_storage_at,
+    get_storage_at_batch,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -153,3 +160,98 @@ def test_get_storage_at_caching():
     result2 = get_storage_at(addr, slot, rpc_url)
     assert result1 == result2
     assert len(responses.calls) == 1
+
+# --- get_storage_at_batch tests ---
+
+
+@responses.activate
+def test_get_storage_at_batch_success_maps_by_id():
+    rpc_url = "https://mainnet.base.org"
+    first = "0x" + "000000000000000000000000" + "ab" * 20
+    second = "0x" + "0" * 64
+    # Out-of-order ids must still map back to request order
+    responses.post(
+        rpc_url,
+        json=[
+            {"jsonrpc": "2.0", "id": 2, "result": second},
+            {"jsonrpc": "2.0", "id": 1, "result": first},
+        ],
+    )
+    result = get_storage_at_batch(
+        "0x" + "66" * 20,
+        ("0x" + "aa" * 32, "0x" + "bb" * 32),
+        rpc_url,
+    )
+    assert result == (first, second)
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_get_storage_at_batch_partial_error_yields_none():
+    rpc_url = "https://mainnet.base.org"
+    value = "0x" + "0" * 64
+    responses.post(
+        rpc_url,
+        json=[
+            {"jsonrpc": "2.0", "id": 1, "result": value},
+            {
+                "jsonrpc": "2.0",
+                "id": 2,
+                "error": {"code": -32000, "message": "execution error"},
+            },
+        ],
+    )
+    result = get_storage_at_batch(
+        "0x" + "77" * 20,
+        ("0x" + "cc" * 32, "0x" + "dd" * 32),
+        rpc_url,
+    )
+    assert result == (value, None)
+
+
+@responses.activate
+def test_get_storage_at_batch_rejected_batch_raises():
+    rpc_url = "https://mainnet.base.org"
+    # A node that rejects batch payloads answers with a single error object
+    responses.post(
+        rpc_url,
+        json={
+            "jsonrpc": "2.0",
+            "id": 1,
+            "error": {"code": -32600, "message": "batch not supported"},
+        },
+    )
+    with pytest.raises(RPCError, match="batch not supported"):
+        get_storage_at_batch("0x" + "88" * 20, ("0x" + "ee" * 32,), rpc_url)
+
+
+@responses.activate
+def test_get_storage_at_batch_caching():
+    rpc_url = "https://mainnet.base.org"
+    responses.post(
+        rpc_url,
+        json=[{"jsonrpc": "2.0", "id": 1, "result": "0x" + "0" * 64}],
+    )
+    slots = ("0x" + "ff" * 32,)
+    result1 = get_storage_at_batch("0x" + "99" * 20, slots, rpc_url)
+    result2 = get_storage_at_batch("0x" + "99" * 20, slots, rpc_url)
+    assert result1 == result2
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_get_code_cache_expires_after_ttl(monkeypatch):
+    rpc_url = "https://mainnet.base.org"
+    responses.post(rpc_url, json={"jsonrpc": "2.0", "id": 1, "result": "0x6001"})
+    responses.post(rpc_url, json={"jsonrpc": "2.0", "id": 1, "result": "0x6002"})
+
+    addr = "0x" + "66" * 20
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(rpc.time, "monotonic", lambda: clock["now"])
+
+    assert get_code(addr, rpc_url) == "0x6001"
+    clock["now"] += 60
+    assert get_code(addr, rpc_url) == "0x6001"  # within TTL: cached
+    clock["now"] += 600
+    assert get_code(addr, rpc_url) == "0x6002"  # expired: refetched
+    assert len(responses.calls) == 2